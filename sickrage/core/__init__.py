@@ -72,7 +72,7 @@ from sickrage.core.searchers.proper_searcher import ProperSearcher
 from sickrage.core.searchers.subtitle_searcher import SubtitleSearcher
 from sickrage.core.searchers.trakt_searcher import TraktSearcher
 from sickrage.core.tv.show import TVShow
-from sickrage.core.tv.show.helpers import get_show_list
+from sickrage.core.tv.show.helpers import get_show_list, show_name_index
 from sickrage.core.ui import Notifications
 from sickrage.core.updaters.rsscache_updater import RSSCacheUpdater
 from sickrage.core.updaters.show_updater import ShowUpdater
@@ -545,8 +545,8 @@ class Core(object):
         # perform server checkup
         IOLoop.current().add_callback(self.server_checkup)
 
-        # load shows
-        IOLoop.current().add_callback(self.load_shows)
+        # load shows in the background so the web server can serve requests meanwhile
+        IOLoop.current().run_in_executor(None, self.load_shows)
 
         # perform version update check
         IOLoop.current().spawn_callback(self.version_updater.check_for_update)
@@ -658,8 +658,6 @@ class Core(object):
                 )
 
     def load_shows(self):
-        threading.currentThread().setName('CORE')
-
         session = self.main_db.session()
 
         self.log.info('Loading initial shows list')
@@ -667,14 +665,16 @@ class Core(object):
         self.loading_shows = True
 
         self.shows = {}
-        for query in session.query(MainDB.TVShow).with_entities(MainDB.TVShow.series_id, MainDB.TVShow.series_provider_id, MainDB.TVShow.name,
-                                                                MainDB.TVShow.location):
+        show_name_index.clear()
+
+        # shows are built from a single query, episodes, images, imdb info and release groups are loaded on first use
+        for query in session.query(MainDB.TVShow):
             try:
                 # if not os.path.isdir(query.location) and self.config.general.create_missing_show_dirs:
                 #     make_dir(query.location)
 
                 self.log.info('Loading show {}'.format(query.name))
-                self.shows.update({(query.series_id, query.series_provider_id): TVShow(query.series_id, query.series_provider_id)})
+                self.shows.update({(query.series_id, query.series_provider_id): TVShow(query.series_id, query.series_provider_id, data=query.as_dict())})
             except Exception as e:
                 self.log.debug('There was an error loading show: {}'.format(query.name))
 
@@ -682,6 +682,10 @@ class Core(object):
 
         self.log.info('Loading initial shows list finished')
 
+        # warm up the episode stats shown on the home page
+        if self.shows:
+            TVShow.load_episode_stats(list(self.shows.values()))
+
     def startup_message(self):
         self.log.info("SiCKRAGE :: STARTED")
         self.log.info(f"SiCKRAGE :: APP VERSION:[{sickrage.version()}]")
@@ -734,6 +738,10 @@ class Core(object):
             # save settings
             self.config.save()
 
+            # close databases
+            for db in [self.main_db, self.config.db, self.cache_db]:
+                db.shutdown()
+
             # shutdown logging
             if self.log:
                 self.log.close()
@@ -26,6 +26,9 @@ class BlackAndWhiteList(object):
     blacklist = []
     whitelist = []
 
+    _blacklist_groups = frozenset()
+    _whitelist_groups = frozenset()
+
     def __init__(self, series_id, series_provider_id):
         if not series_id:
             raise BlackWhitelistNoShowIDException()
@@ -43,14 +46,16 @@ class BlackAndWhiteList(object):
         sickrage.app.log.debug('Building black and white list for ' + str(self.series_id))
 
         self.blacklist = self._load_list(session.query(MainDB.Blacklist).filter_by(series_id=self.series_id, series_provider_id=self.series_provider_id))
+        self._blacklist_groups = self._normalize(self.blacklist)
         sickrage.app.log.debug('BWL: {} loaded keywords from {}: {}'.format(self.series_id, MainDB.Blacklist.__tablename__, self.blacklist))
 
         self.whitelist = self._load_list(session.query(MainDB.Whitelist).filter_by(series_id=self.series_id, series_provider_id=self.series_provider_id))
+        self._whitelist_groups = self._normalize(self.whitelist)
         sickrage.app.log.debug('BWL: {} loaded keywords from {}: {}'.format(self.series_id, MainDB.Whitelist.__tablename__, self.whitelist))
 
-    def _add_keywords(self, table, values):
+    def _set_keywords(self, table, values):
         """
-        DB: Adds keywords into database for current show
+        DB: Replaces keywords in database for current show
 
         :param table: database table to add keywords to
         :param values: Values to be inserted in table
@@ -58,13 +63,16 @@ class BlackAndWhiteList(object):
 
         session = sickrage.app.main_db.session()
 
+        session.query(table).filter_by(series_id=self.series_id, series_provider_id=self.series_provider_id).delete()
+
         for value in values:
             session.add(table(**{
                 'series_id': self.series_id,
                 'series_provider_id': self.series_provider_id,
                 'keyword': value
             }))
-            session.commit()
+
+        session.commit()
 
     def set_black_keywords(self, values):
         """
@@ -74,12 +82,9 @@ class BlackAndWhiteList(object):
         :param session: Database session
         """
 
-        session = sickrage.app.main_db.session()
-        session.query(MainDB.Blacklist).filter_by(series_id=self.series_id, series_provider_id=self.series_provider_id).delete()
-        session.commit()
-
-        self._add_keywords(MainDB.Blacklist, values)
+        self._set_keywords(MainDB.Blacklist, values)
         self.blacklist = values
+        self._blacklist_groups = self._normalize(values)
 
         sickrage.app.log.debug('Blacklist set to: %s' % self.blacklist)
 
@@ -90,12 +95,9 @@ class BlackAndWhiteList(object):
         :param values: Complete list of keywords to be set as whitelist
         :param session: Database session
         """
-        session = sickrage.app.main_db.session()
-        session.query(MainDB.Whitelist).filter_by(series_id=self.series_id, series_provider_id=self.series_provider_id).delete()
-        session.commit()
-
-        self._add_keywords(MainDB.Whitelist, values)
+        self._set_keywords(MainDB.Whitelist, values)
         self.whitelist = values
+        self._whitelist_groups = self._normalize(values)
 
         sickrage.app.log.debug('Whitelist set to: %s' % self.whitelist)
 
@@ -112,6 +114,16 @@ class BlackAndWhiteList(object):
 
         return groups
 
+    @staticmethod
+    def _normalize(keywords):
+        """
+        Builds the set of lowercased keywords release groups are matched against
+
+        :param keywords: list of keywords
+        :return: frozenset of lowercased keywords
+        """
+        return frozenset(x.lower() for x in keywords)
+
     def is_valid(self, result):
         """
         Check if result is valid according to white/blacklist for current show
@@ -120,18 +132,20 @@ class BlackAndWhiteList(object):
         :return: False if result is not allowed in white/blacklist, True if it is
         """
 
-        if self.whitelist or self.blacklist:
+        if self._whitelist_groups or self._blacklist_groups:
             if not result.release_group:
                 sickrage.app.log.debug('Failed to detect release group')
                 return False
 
-            if result.release_group.lower() in [x.lower() for x in self.whitelist]:
+            release_group = result.release_group.lower()
+
+            if release_group in self._whitelist_groups:
                 white_result = True
-            elif not self.whitelist:
+            elif not self._whitelist_groups:
                 white_result = True
             else:
                 white_result = False
-            if result.release_group.lower() in [x.lower() for x in self.blacklist]:
+            if release_group in self._blacklist_groups:
                 black_result = False
             else:
                 black_result = True
@@ -40,6 +40,9 @@ from sickrage.core.websession import WebSession
 
 
 class TVCache(object):
+    # max number of urls checked per existence query, keeps us under sqlite's bound parameter limit
+    url_chunk_size = 500
+
     def __init__(self, provider, **kwargs):
         self.lock = threading.Lock()
         self.provider = provider
@@ -50,6 +53,7 @@ class TVCache(object):
     def clear(self):
         session = sickrage.app.cache_db.session()
         if self.shouldClearCache():
+            session.query(CacheDB.ProviderEpisode).filter_by(provider=self.providerID).delete()
             session.query(CacheDB.Provider).filter_by(provider=self.providerID).delete()
             session.commit()
 
@@ -86,7 +90,7 @@ class TVCache(object):
                 # set updated
                 self.last_update = datetime.datetime.today()
 
-                [self._parseItem(item) for item in data['entries']]
+                self.add_cache_entries(list(filter(None, [self._parseItem(item) for item in data['entries']])))
 
                 sickrage.app.log.debug("Updated RSS cache")
             except AuthException as e:
@@ -123,7 +127,7 @@ class TVCache(object):
         self.check_item(title, url)
 
         if title and url:
-            self.add_cache_entry(self._translateTitle(title), self._translateLinkURL(url), seeders, leechers, size)
+            return self._translateTitle(title), self._translateLinkURL(url), seeders, leechers, size
         else:
             sickrage.app.log.debug(
                 "The data returned from the " + self.provider.name + " feed is incomplete, this result is unusable")
@@ -201,68 +205,120 @@ class TVCache(object):
         return True
 
     def add_cache_entry(self, name, url, seeders, leechers, size):
+        self.add_cache_entries([(name, url, seeders, leechers, size)])
+
+    def add_cache_entries(self, entries):
+        """
+        Parses a batch of (name, url, seeders, leechers, size) entries and adds the new ones to the cache
+
+        Existing urls are filtered out with a single query per chunk and all new rows are written in one transaction.
+
+        :param entries: list of (name, url, seeders, leechers, size) tuples
+        """
+
         session = sickrage.app.cache_db.session()
 
-        # check for existing entry in cache
-        if session.query(CacheDB.Provider).filter_by(url=url).count():
+        # dedupe urls within this batch, first entry wins
+        entries = list({entry[1]: entry for entry in reversed(entries)}.values())[::-1]
+        if not entries:
+            return
+
+        # check for existing entries in cache
+        existing_urls = set()
+        for i in range(0, len(entries), self.url_chunk_size):
+            chunk = [entry[1] for entry in entries[i:i + self.url_chunk_size]]
+            existing_urls.update(x.url for x in session.query(CacheDB.Provider.url).filter(CacheDB.Provider.url.in_(chunk)))
+
+        name_parser = NameParser(validate_show=True)
+
+        new_results = []
+        for name, url, seeders, leechers, size in entries:
+            if url in existing_urls:
+                continue
+
+            try:
+                # parse release name
+                parse_result = name_parser.parse(name)
+            except (InvalidShowException, InvalidNameException):
+                continue
+
+            if not parse_result.series_name or parse_result.quality == Qualities.UNKNOWN:
+                continue
+
+            season = parse_result.season_number if parse_result.season_number else 1
+            episodes = parse_result.episode_numbers
+
+            if not (season and episodes):
+                continue
+
+            dbData = {
+                'provider': self.providerID,
+                'name': name,
+                'season': season,
+                'episodes': "|" + "|".join(map(str, episodes)) + "|",
+                'series_id': parse_result.series_id,
+                'series_provider_id': parse_result.series_provider_id.name,
+                'url': url,
+                'time': int(time.mktime(datetime.datetime.today().timetuple())),
+                'quality': parse_result.quality,
+                'release_group': parse_result.release_group,
+                'version': parse_result.version,
+                'seeders': try_int(seeders),
+                'leechers': try_int(leechers),
+                'size': try_int(size, -1)
+            }
+
+            episode_map = [{
+                'provider': self.providerID,
+                'series_id': parse_result.series_id,
+                'series_provider_id': parse_result.series_provider_id,
+                'season': season,
+                'episode': episode
+            } for episode in set(episodes)]
+
+            new_results.append((dbData, episode_map))
+
+        if not new_results:
             return
 
+        # add to internal database
+        def build(dbData, episode_map):
+            provider_result = CacheDB.Provider(**dbData)
+            provider_result.episode_map = [CacheDB.ProviderEpisode(**x) for x in episode_map]
+            return provider_result
+
         try:
-            # parse release name
-            parse_result = NameParser(validate_show=True).parse(name)
-            if parse_result.series_name and parse_result.quality != Qualities.UNKNOWN:
-                season = parse_result.season_number if parse_result.season_number else 1
-                episodes = parse_result.episode_numbers
-
-                if season and episodes:
-                    # store episodes as a seperated string
-                    episode_text = "|" + "|".join(map(str, episodes)) + "|"
-
-                    # get quality of release
-                    quality = parse_result.quality
-
-                    # get release group
-                    release_group = parse_result.release_group
-
-                    # get version
-                    version = parse_result.version
-
-                    dbData = {
-                        'provider': self.providerID,
-                        'name': name,
-                        'season': season,
-                        'episodes': episode_text,
-                        'series_id': parse_result.series_id,
-                        'series_provider_id': parse_result.series_provider_id.name,
-                        'url': url,
-                        'time': int(time.mktime(datetime.datetime.today().timetuple())),
-                        'quality': quality,
-                        'release_group': release_group,
-                        'version': version,
-                        'seeders': try_int(seeders),
-                        'leechers': try_int(leechers),
-                        'size': try_int(size, -1)
-                    }
-
-                    # add to internal database
+            session.add_all([build(dbData, episode_map) for dbData, episode_map in new_results])
+            session.commit()
+        except IntegrityError:
+            # another writer added some of these urls since we checked, fall back to adding them one at a time
+            session.rollback()
+
+            # only report and share the rows that were actually saved
+            added_results = []
+            for dbData, episode_map in new_results:
+                try:
+                    session.add(build(dbData, episode_map))
+                    session.commit()
+                    added_results.append((dbData, episode_map))
+                except IntegrityError:
+                    session.rollback()
+
+            new_results = added_results
+
+        for dbData, __ in new_results:
+            sickrage.app.log.debug("SEARCH RESULT:[{}] ADDED TO CACHE!".format(dbData['name']))
+
+        # add to external provider cache database
+        if sickrage.app.config.general.enable_sickrage_api:
+            from sickrage.search_providers import SearchProviderType
+            if not self.provider.private and self.provider.provider_type in [SearchProviderType.NZB, SearchProviderType.TORRENT]:
+                for dbData, __ in new_results:
                     try:
-                        session.add(CacheDB.Provider(**dbData))
-                        session.commit()
-                        sickrage.app.log.debug("SEARCH RESULT:[{}] ADDED TO CACHE!".format(name))
-                    except IntegrityError:
+                        sickrage.app.api.search_provider.add_search_result(provider=self.providerID, data=dbData)
+                    except Exception as e:
                         pass
 
-                    # add to external provider cache database
-                    if sickrage.app.config.general.enable_sickrage_api:
-                        from sickrage.search_providers import SearchProviderType
-                        if not self.provider.private and self.provider.provider_type in [SearchProviderType.NZB, SearchProviderType.TORRENT]:
-                            try:
-                                sickrage.app.api.search_provider.add_search_result(provider=self.providerID, data=dbData)
-                            except Exception as e:
-                                pass
-        except (InvalidShowException, InvalidNameException):
-            pass
-
     def search_cache(self, series_id, series_provider_id, season, episode, manualSearch=False, downCurQuality=False):
         cache_results = {}
         dbData = []
@@ -276,9 +332,11 @@ class TVCache(object):
         # get data from internal database
         session = sickrage.app.cache_db.session()
         dbData += [x.as_dict() for x in
-                   session.query(CacheDB.Provider).filter_by(provider=self.providerID,
-                                                             series_id=series_id,
-                                                             season=season).filter(CacheDB.Provider.episodes.contains("|{}|".format(episode)))]
+                   session.query(CacheDB.Provider).join(CacheDB.Provider.episode_map).filter(CacheDB.ProviderEpisode.provider == self.providerID,
+                                                                                             CacheDB.ProviderEpisode.series_id == series_id,
+                                                                                             CacheDB.ProviderEpisode.series_provider_id == series_provider_id,
+                                                                                             CacheDB.ProviderEpisode.season == season,
+                                                                                             CacheDB.ProviderEpisode.episode == episode)]
 
         for curResult in dbData:
             result = self.provider.get_result()
@@ -19,6 +19,7 @@
 #  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
 # ##############################################################################
 import os
+from copy import deepcopy
 
 from sqlalchemy import orm
 from sqlalchemy.orm.attributes import flag_modified
@@ -50,6 +51,8 @@ class Config(object):
 
         self.quality_sizes = {}
 
+        self._saved_values = {}
+
     @property
     def user(self):
         return self._config_data.get(self.db.Users)
@@ -384,6 +387,9 @@ class Config(object):
             self.db.session().commit()
         self._config_data[self.db.AniDB] = self.db.session().query(self.db.AniDB).first().as_attrdict()
 
+        for table, table_data in self._config_data.items():
+            self._saved_values[(table, table_data.id)] = deepcopy(dict(table_data))
+
         # QUALITY SIZES
         for quality in Qualities:
             if quality.is_preset or quality.is_combined:
@@ -398,6 +404,7 @@ class Config(object):
 
             db_item = self.db.session().query(self.db.QualitySizes).filter_by(quality=quality).one()
             self.quality_sizes[quality.name] = db_item.as_attrdict()
+            self._saved_values[(self.db.QualitySizes, db_item.id)] = deepcopy(db_item.as_dict())
 
         # CUSTOM SEARCH PROVIDERS
         for search_providers in self.db.session().query(self.db.SearchProvidersTorrentRss, self.db.SearchProvidersNewznab):
@@ -434,6 +441,8 @@ class Config(object):
                     search_provider = self.db.session().query(self.db.SearchProvidersNewznab).filter_by(provider_id=search_provider_id).one()
 
                 if search_provider:
+                    self._saved_values[(type(search_provider), search_provider.provider_id)] = deepcopy(search_provider.as_dict())
+
                     if search_provider.provider_type in [SearchProviderType.TORRENT, SearchProviderType.TORRENT_RSS]:
                         sickrage.app.search_providers.all()[search_provider.provider_id].ratio = search_provider.ratio
                     elif search_provider.provider_type in [SearchProviderType.NZB, SearchProviderType.NEWZNAB]:
@@ -462,6 +471,7 @@ class Config(object):
         for metadata_provider_id in sickrage.app.metadata_providers:
             try:
                 metadata_provider = self.db.session().query(self.db.MetadataProviders).filter_by(provider_id=metadata_provider_id).one()
+                self._saved_values[(self.db.MetadataProviders, metadata_provider.provider_id)] = deepcopy(metadata_provider.as_dict())
 
                 sickrage.app.metadata_providers[metadata_provider.provider_id].show_metadata = metadata_provider.show_metadata
                 sickrage.app.metadata_providers[metadata_provider.provider_id].episode_metadata = metadata_provider.episode_metadata
@@ -477,138 +487,153 @@ class Config(object):
             except orm.exc.NoResultFound:
                 pass
 
+        # rebuild log censoring from the loaded secrets
+        sickrage.app.log.reset_censored_items()
+
     def save(self, mark_dirty=False):
+        session = self.db.session()
+
         try:
+            saved_values = {}
+
             # CONFIG SETTINGS
-            for table_name, table_data in self._config_data.items():
-                db_item = self.db.session().query(table_name).one()
-                db_item.update(**table_data)
-                if mark_dirty:
-                    for column_name in table_data:
-                        flag_modified(db_item, column_name)
-                self.db.session().commit()
+            for table, table_data in self._config_data.items():
+                saved_values.update(self._save_changed_rows(session, table, 'id', {table_data.id: table_data}, mark_dirty))
 
             # QUALITY SIZES
-            for quality_size_name, quality_size_data in self.quality_sizes.items():
-                db_item = self.db.session().query(self.db.QualitySizes).filter_by(quality=Qualities[quality_size_name].value).one()
-                db_item.update(**quality_size_data)
-                if mark_dirty:
-                    for column_name in quality_size_data:
-                        flag_modified(db_item, column_name)
-                self.db.session().commit()
+            saved_values.update(self._save_changed_rows(session, self.db.QualitySizes, 'id',
+                                                        {x.id: x for x in self.quality_sizes.values()}, mark_dirty))
 
             # SEARCH PROVIDERS
-            for _search_provider_id, _search_provider in sickrage.app.search_providers.all().copy().items():
-                search_provider = None
+            search_provider_tables = {
+                SearchProviderType.TORRENT: self.db.SearchProvidersTorrent,
+                SearchProviderType.NZB: self.db.SearchProvidersNzb,
+                SearchProviderType.TORRENT_RSS: self.db.SearchProvidersTorrentRss,
+                SearchProviderType.NEWZNAB: self.db.SearchProvidersNewznab,
+            }
 
-                if _search_provider.provider_type == SearchProviderType.TORRENT:
-                    try:
-                        search_provider = self.db.session().query(self.db.SearchProvidersTorrent).filter_by(provider_id=_search_provider_id).one()
-                    except orm.exc.NoResultFound:
-                        self.db.session().add(self.db.SearchProvidersTorrent(provider_id=_search_provider_id, provider_type=_search_provider.provider_type))
-                        self.db.session().commit()
-                        search_provider = self.db.session().query(self.db.SearchProvidersTorrent).filter_by(provider_id=_search_provider_id).one()
-                elif _search_provider.provider_type == SearchProviderType.NZB:
-                    try:
-                        search_provider = self.db.session().query(self.db.SearchProvidersNzb).filter_by(provider_id=_search_provider_id).one()
-                    except orm.exc.NoResultFound:
-                        self.db.session().add(self.db.SearchProvidersNzb(provider_id=_search_provider_id, provider_type=_search_provider.provider_type))
-                        self.db.session().commit()
-                        search_provider = self.db.session().query(self.db.SearchProvidersNzb).filter_by(provider_id=_search_provider_id).one()
-                elif _search_provider.provider_type == SearchProviderType.TORRENT_RSS:
-                    try:
-                        search_provider = self.db.session().query(self.db.SearchProvidersTorrentRss).filter_by(provider_id=_search_provider_id).one()
-                        if _search_provider.provider_deleted:
-                            del sickrage.app.search_providers[_search_provider.provider_type.name][_search_provider_id]
-                            self.db.session().query(self.db.SearchProvidersTorrentRss).filter_by(provider_id=_search_provider_id).delete()
-                            self.db.session().commit()
-                            continue
-                    except orm.exc.NoResultFound:
-                        self.db.session().add(self.db.SearchProvidersTorrentRss(provider_id=_search_provider_id, provider_type=_search_provider.provider_type))
-                        self.db.session().commit()
-                        search_provider = self.db.session().query(self.db.SearchProvidersTorrentRss).filter_by(provider_id=_search_provider_id).one()
-
-                    search_provider.name = sickrage.app.search_providers.all()[search_provider.provider_id].name
-                    search_provider.url = sickrage.app.search_providers.all()[search_provider.provider_id].urls['base_url']
-                    search_provider.title_tag = sickrage.app.search_providers.all()[search_provider.provider_id].titleTAG
-                elif _search_provider.provider_type == SearchProviderType.NEWZNAB:
-                    try:
-                        search_provider = self.db.session().query(self.db.SearchProvidersNewznab).filter_by(provider_id=_search_provider_id).one()
-                        if _search_provider.provider_deleted:
-                            del sickrage.app.search_providers[_search_provider.provider_type.name][_search_provider_id]
-                            self.db.session().query(self.db.SearchProvidersNewznab).filter_by(provider_id=_search_provider_id).delete()
-                            self.db.session().commit()
-                            continue
-                    except orm.exc.NoResultFound:
-                        self.db.session().add(self.db.SearchProvidersNewznab(provider_id=_search_provider_id, provider_type=_search_provider.provider_type))
-                        self.db.session().commit()
-                        search_provider = self.db.session().query(self.db.SearchProvidersNewznab).filter_by(provider_id=_search_provider_id).one()
-
-                    search_provider.name = sickrage.app.search_providers.all()[search_provider.provider_id].name
-                    search_provider.url = sickrage.app.search_providers.all()[search_provider.provider_id].urls['base_url']
-                    search_provider.api_key = sickrage.app.search_providers.all()[search_provider.provider_id].api_key
-                    search_provider.cat_ids = sickrage.app.search_providers.all()[search_provider.provider_id].catIDs
+            search_providers = {}
+            for search_provider_id, search_provider in sickrage.app.search_providers.all().copy().items():
+                table = search_provider_tables.get(search_provider.provider_type)
+                if not table:
+                    continue
 
-                if search_provider:
-                    if search_provider.provider_type in [SearchProviderType.TORRENT, SearchProviderType.TORRENT_RSS]:
-                        search_provider.ratio = sickrage.app.search_providers.all()[search_provider.provider_id].ratio
-                    elif search_provider.provider_type in [SearchProviderType.NZB, SearchProviderType.NEWZNAB]:
-                        search_provider.username = sickrage.app.search_providers.all()[search_provider.provider_id].username
-
-                    search_provider.search_mode = sickrage.app.search_providers.all()[search_provider.provider_id].search_mode
-                    search_provider.search_separator = sickrage.app.search_providers.all()[search_provider.provider_id].search_separator
-                    search_provider.cookies = sickrage.app.search_providers.all()[search_provider.provider_id].cookies
-                    search_provider.proper_strings = ','.join(sickrage.app.search_providers.all()[search_provider.provider_id].proper_strings)
-                    search_provider.private = sickrage.app.search_providers.all()[search_provider.provider_id].private
-                    search_provider.supports_backlog = sickrage.app.search_providers.all()[search_provider.provider_id].supports_backlog
-                    search_provider.supports_absolute_numbering = sickrage.app.search_providers.all()[search_provider.provider_id].supports_absolute_numbering
-                    search_provider.anime_only = sickrage.app.search_providers.all()[search_provider.provider_id].anime_only
-                    search_provider.search_fallback = sickrage.app.search_providers.all()[search_provider.provider_id].search_fallback
-                    search_provider.enable_daily = sickrage.app.search_providers.all()[search_provider.provider_id].enable_daily
-                    search_provider.enable_backlog = sickrage.app.search_providers.all()[search_provider.provider_id].enable_backlog
-                    search_provider.enable_cookies = sickrage.app.search_providers.all()[search_provider.provider_id].enable_cookies
-                    search_provider.enable = sickrage.app.search_providers.all()[search_provider.provider_id].enabled
-                    search_provider.sort_order = sickrage.app.search_providers.all()[search_provider.provider_id].sort_order
-                    search_provider.custom_settings = sickrage.app.search_providers.all()[search_provider.provider_id].custom_settings
-
-                    if mark_dirty:
-                        for column_name in search_provider.as_dict():
-                            flag_modified(search_provider, column_name)
-
-                    self.db.session().commit()
+                if search_provider.provider_type in [SearchProviderType.TORRENT_RSS, SearchProviderType.NEWZNAB] and search_provider.provider_deleted:
+                    del sickrage.app.search_providers[search_provider.provider_type.name][search_provider_id]
+                    session.query(table).filter_by(provider_id=search_provider_id).delete()
+                    saved_values[(table, search_provider_id)] = None
+                    continue
 
-            # METADATA PROVIDERS
-            for metadata_provider_id in sickrage.app.metadata_providers:
-                try:
-                    metadata_provider = self.db.session().query(self.db.MetadataProviders).filter_by(provider_id=metadata_provider_id).one()
-                except orm.exc.NoResultFound:
-                    self.db.session().add(self.db.MetadataProviders(provider_id=metadata_provider_id))
-                    self.db.session().commit()
-                    metadata_provider = self.db.session().query(self.db.MetadataProviders).filter_by(provider_id=metadata_provider_id).one()
-
-                metadata_provider.show_metadata = sickrage.app.metadata_providers[metadata_provider.provider_id].show_metadata
-                metadata_provider.episode_metadata = sickrage.app.metadata_providers[metadata_provider.provider_id].episode_metadata
-                metadata_provider.fanart = sickrage.app.metadata_providers[metadata_provider.provider_id].fanart
-                metadata_provider.poster = sickrage.app.metadata_providers[metadata_provider.provider_id].poster
-                metadata_provider.banner = sickrage.app.metadata_providers[metadata_provider.provider_id].banner
-                metadata_provider.episode_thumbnails = sickrage.app.metadata_providers[metadata_provider.provider_id].episode_thumbnails
-                metadata_provider.season_posters = sickrage.app.metadata_providers[metadata_provider.provider_id].season_posters
-                metadata_provider.season_banners = sickrage.app.metadata_providers[metadata_provider.provider_id].season_banners
-                metadata_provider.season_all_poster = sickrage.app.metadata_providers[metadata_provider.provider_id].season_all_poster
-                metadata_provider.season_all_banner = sickrage.app.metadata_providers[metadata_provider.provider_id].season_all_banner
-                metadata_provider.enable = sickrage.app.metadata_providers[metadata_provider.provider_id].enabled
-
-                if mark_dirty:
-                    for column_name in metadata_provider.as_dict():
-                        flag_modified(metadata_provider, column_name)
+                search_providers.setdefault(table, {})[search_provider_id] = self._search_provider_values(search_provider)
 
-                self.db.session().commit()
+            for table, rows in search_providers.items():
+                saved_values.update(self._save_changed_rows(session, table, 'provider_id', rows, mark_dirty))
+
+            # METADATA PROVIDERS
+            metadata_providers = {}
+            for metadata_provider_id, metadata_provider in sickrage.app.metadata_providers.items():
+                metadata_providers[metadata_provider_id] = {
+                    'show_metadata': metadata_provider.show_metadata,
+                    'episode_metadata': metadata_provider.episode_metadata,
+                    'fanart': metadata_provider.fanart,
+                    'poster': metadata_provider.poster,
+                    'banner': metadata_provider.banner,
+                    'episode_thumbnails': metadata_provider.episode_thumbnails,
+                    'season_posters': metadata_provider.season_posters,
+                    'season_banners': metadata_provider.season_banners,
+                    'season_all_poster': metadata_provider.season_all_poster,
+                    'season_all_banner': metadata_provider.season_all_banner,
+                    'enable': metadata_provider.enabled,
+                }
+
+            saved_values.update(self._save_changed_rows(session, self.db.MetadataProviders, 'provider_id', metadata_providers, mark_dirty))
+
+            session.commit()
+
+            for key, values in saved_values.items():
+                if values is None:
+                    self._saved_values.pop(key, None)
+                else:
+                    self._saved_values.setdefault(key, {}).update(values)
+
+            # secrets may have changed, rebuild log censoring
+            sickrage.app.log.reset_censored_items()
 
             sickrage.app.log.info("Config saved to database successfully!")
         except Exception as e:
+            session.rollback()
             sickrage.app.log.warning("Failed to save config to database")
             sickrage.app.log.debug(f"Failed to save config to database: {e}")
 
+    def _save_changed_rows(self, session, table, key_column, rows, mark_dirty=False):
+        """
+        Stages updates for rows whose values differ from what was last loaded or saved, adding rows that do not exist yet.
+        :param session: database session to stage the changes in
+        :param table: config database table class
+        :param key_column: column name the keys of rows map to
+        :param rows: dict of key -> dict of column values
+        :param mark_dirty: write every value, even when unchanged
+        :return: dict of (table, key) -> changed column values, to be recorded once committed
+        """
+        changed_rows = {}
+
+        for key, values in rows.items():
+            saved_values = self._saved_values.get((table, key), {})
+            changed_values = {k: v for k, v in values.items() if mark_dirty or k not in saved_values or saved_values[k] != v}
+            if changed_values:
+                changed_rows[key] = changed_values
+
+        if not changed_rows:
+            return {}
+
+        db_items = {getattr(x, key_column): x for x in session.query(table).filter(getattr(table, key_column).in_(changed_rows.keys()))}
+
+        for key, changed_values in changed_rows.items():
+            db_item = db_items.get(key)
+            if not db_item:
+                db_item = table(**{key_column: key})
+                session.add(db_item)
+
+            db_item.update(**changed_values)
+            if mark_dirty:
+                for column_name in changed_values:
+                    flag_modified(db_item, column_name)
+
+        return {(table, key): deepcopy(changed_values) for key, changed_values in changed_rows.items()}
+
+    @staticmethod
+    def _search_provider_values(search_provider):
+        values = {
+            'provider_type': search_provider.provider_type,
+            'search_mode': search_provider.search_mode,
+            'search_separator': search_provider.search_separator,
+            'cookies': search_provider.cookies,
+            'proper_strings': ','.join(search_provider.proper_strings),
+            'private': search_provider.private,
+            'supports_backlog': search_provider.supports_backlog,
+            'supports_absolute_numbering': search_provider.supports_absolute_numbering,
+            'anime_only': search_provider.anime_only,
+            'search_fallback': search_provider.search_fallback,
+            'enable_daily': search_provider.enable_daily,
+            'enable_backlog': search_provider.enable_backlog,
+            'enable_cookies': search_provider.enable_cookies,
+            'enable': search_provider.enabled,
+            'sort_order': search_provider.sort_order,
+            'custom_settings': search_provider.custom_settings,
+        }
+
+        if search_provider.provider_type in [SearchProviderType.TORRENT, SearchProviderType.TORRENT_RSS]:
+            values['ratio'] = search_provider.ratio
+        elif search_provider.provider_type in [SearchProviderType.NZB, SearchProviderType.NEWZNAB]:
+            values['username'] = search_provider.username
+
+        if search_provider.provider_type == SearchProviderType.TORRENT_RSS:
+            values.update(name=search_provider.name, url=search_provider.urls['base_url'], title_tag=search_provider.titleTAG)
+        elif search_provider.provider_type == SearchProviderType.NEWZNAB:
+            values.update(name=search_provider.name, url=search_provider.urls['base_url'], api_key=search_provider.api_key, cat_ids=search_provider.catIDs)
+
+        return values
+
     def reset_encryption(self):
         CustomStringEncryptedType.reset = True
         self.save(mark_dirty=True)
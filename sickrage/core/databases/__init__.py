@@ -16,11 +16,13 @@
 # You should have received a copy of the GNU General Public License
 # along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
 import datetime
+import json
 import os
 import pickle
 import random
 import sqlite3
 import threading
+import time
 from time import sleep
 
 import alembic.command
@@ -30,12 +32,13 @@ import sqlalchemy
 from alembic.runtime.migration import MigrationContext
 from alembic.script import ScriptDirectory
 from attrdict import AttrDict
-from sqlalchemy import create_engine, event, inspect, MetaData, Index, TypeDecorator
+from sqlalchemy import create_engine, event, inspect, MetaData, Index, Table, TypeDecorator
 from sqlalchemy.engine import Engine, reflection
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.automap import automap_base
-from sqlalchemy.ext.serializer import loads, dumps
+from sqlalchemy.ext.serializer import loads
 from sqlalchemy.orm import sessionmaker, mapper, scoped_session
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.sql.ddl import CreateTable, CreateIndex
 from sqlalchemy.util import KeyedTuple
 
@@ -51,6 +54,8 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
     dbapi_connection.isolation_level = None
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA journal_mode=WAL")
+    # only takes effect on new database files, existing ones are switched on their next vacuum
+    cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
     cursor.close()
     dbapi_connection.isolation_level = old_isolation
 
@@ -137,6 +142,14 @@ class SRDatabaseBase(object):
 
 
 class SRDatabase(object):
+    # sqlite maintenance thresholds, see SRDatabase.setup
+    integrity_check_interval = datetime.timedelta(days=7)
+    analyze_interval = datetime.timedelta(days=7)
+    vacuum_free_page_ratio = 0.1
+
+    # rows read or written at a time by backup and restore
+    backup_chunk_size = 1000
+
     def __init__(self, name, db_type='sqlite', db_prefix='sickrage', db_host='localhost', db_port='3306', db_username='sickrage', db_password='sickrage'):
         self.name = name
         self.db_type = db_type
@@ -149,18 +162,47 @@ class SRDatabase(object):
         self.db_path = os.path.join(sickrage.app.data_dir, '{}.db'.format(self.name))
         self.db_migrations_path = os.path.join(os.path.dirname(__file__), self.name, 'migrations')
 
+        self._engine = None
+        self._engine_settings = None
+        self._engine_lock = threading.Lock()
+
         self.session = scoped_session(sessionmaker(class_=ContextSession, bind=self.engine))
 
+    @property
+    def engine_settings(self):
+        return self.db_type, self.db_path, self.db_prefix, self.db_host, self.db_port, self.db_username, self.db_password
+
     @property
     def engine(self):
+        """
+        Engine shared by all sessions of this database, rebuilt only when the database settings change
+        """
+
+        with self._engine_lock:
+            if self._engine is None or self._engine_settings != self.engine_settings:
+                old_engine, self._engine = self._engine, self.create_engine()
+                self._engine_settings = self.engine_settings
+
+                if old_engine is not None:
+                    self.session.remove()
+                    self.session.configure(bind=self._engine)
+                    old_engine.dispose()
+
+            return self._engine
+
+    def create_engine(self):
         if self.db_type == 'sqlite':
-            return create_engine('sqlite:///{}'.format(self.db_path), echo=False, connect_args={'check_same_thread': False, 'timeout': 30})
+            # keep connections open between sessions instead of re-opening the file and re-applying pragmas each time
+            return create_engine('sqlite:///{}'.format(self.db_path), echo=False, connect_args={'check_same_thread': False, 'timeout': 30},
+                                 poolclass=QueuePool, pool_size=10, max_overflow=-1)
         elif self.db_type == 'mysql':
             mysql_engine = create_engine('mysql+pymysql://{}:{}@{}:{}/'.format(self.db_username, self.db_password, self.db_host, self.db_port), echo=False)
             mysql_engine.execute(f"CREATE DATABASE IF NOT EXISTS {self.db_prefix}_{self.name}")
+            mysql_engine.dispose()
+
             return create_engine(
                 'mysql+pymysql://{}:{}@{}:{}/{}_{}'.format(self.db_username, self.db_password, self.db_host, self.db_port, self.db_prefix, self.name),
-                echo=False)
+                echo=False, pool_size=10, max_overflow=20, pool_recycle=3600, pool_pre_ping=True)
 
     @property
     def version(self):
@@ -174,14 +216,26 @@ class SRDatabase(object):
             alembic.command.stamp(self.get_alembic_config(), str(migrate_version))
             self.engine.execute("drop table migrate_version")
 
+        maintenance_state = self.load_maintenance_state()
+        clean_shutdown = maintenance_state.get('clean_shutdown') and maintenance_state.get('fingerprint') == self.db_file_fingerprint
+
+        # stays unset until shutdown, so a crash forces a full check on the next start
+        maintenance_state['clean_shutdown'] = False
+        self.save_maintenance_state(maintenance_state)
+
         if not self.engine.dialect.has_table(self.engine, 'alembic_version'):
             alembic.command.stamp(self.get_alembic_config(), 'head')
             sickrage.app.log.info("Performing initialization on {} database".format(self.name))
             self.initialize()
 
         # perform integrity check
-        sickrage.app.log.info("Performing integrity check on {} database".format(self.name))
-        self.integrity_check()
+        if self.db_type == 'sqlite':
+            if not clean_shutdown or self._maintenance_due(maintenance_state, 'last_integrity_check', self.integrity_check_interval):
+                sickrage.app.log.info("Performing integrity check on {} database".format(self.name))
+                if self.integrity_check():
+                    maintenance_state['last_integrity_check'] = int(time.time())
+            else:
+                sickrage.app.log.debug("Skipping integrity check on {} database, last shutdown was clean".format(self.name))
 
         # upgrade database
         sickrage.app.log.info("Performing upgrades on {} database".format(self.name))
@@ -191,9 +245,83 @@ class SRDatabase(object):
         sickrage.app.log.info("Performing cleanup on {} database".format(self.name))
         self.cleanup()
 
-        # free up space
-        sickrage.app.log.info("Performing vacuum on {} database".format(self.name))
-        self.vacuum()
+        # free up space and refresh query planner statistics
+        if self.db_type == 'sqlite':
+            self.optimize(maintenance_state)
+
+        self.save_maintenance_state(maintenance_state)
+
+    def shutdown(self):
+        """
+        Closes all database connections and records a clean shutdown, allowing the next start to skip the integrity check
+        """
+
+        self.session.remove()
+        self.engine.dispose()
+
+        maintenance_state = self.load_maintenance_state()
+        maintenance_state.update(clean_shutdown=True, fingerprint=self.db_file_fingerprint)
+        self.save_maintenance_state(maintenance_state)
+
+    @property
+    def maintenance_file(self):
+        return os.path.join(sickrage.app.data_dir, '{}_db_maintenance.json'.format(self.name))
+
+    @property
+    def db_file_fingerprint(self):
+        """
+        Size and modification time of the sqlite database file, used to detect changes made while SiCKRAGE was not running
+        """
+
+        try:
+            stat = os.stat(self.db_path)
+            return [stat.st_size, stat.st_mtime_ns]
+        except OSError:
+            return None
+
+    def load_maintenance_state(self):
+        try:
+            with open(self.maintenance_file, 'r') as fh:
+                return json.load(fh)
+        except (IOError, ValueError):
+            return {}
+
+    def save_maintenance_state(self, maintenance_state):
+        try:
+            with open(self.maintenance_file, 'w') as fh:
+                json.dump(maintenance_state, fh)
+        except IOError as e:
+            sickrage.app.log.debug(f"Unable to save {self.name} database maintenance state: {e}")
+
+    @staticmethod
+    def _maintenance_due(maintenance_state, key, interval):
+        return time.time() - maintenance_state.get(key, 0) >= interval.total_seconds()
+
+    def optimize(self, maintenance_state):
+        """
+        Reclaims free pages once they make up a significant part of the database file and periodically refreshes statistics
+        used by the query planner, instead of rewriting the whole file on every start.
+
+        :param maintenance_state: maintenance state of this database, updated in place
+        """
+
+        page_count = self.engine.scalar("PRAGMA page_count")
+        freelist_count = self.engine.scalar("PRAGMA freelist_count")
+
+        if page_count and freelist_count / page_count >= self.vacuum_free_page_ratio:
+            if self.engine.scalar("PRAGMA auto_vacuum") == 2:
+                sickrage.app.log.info("Performing incremental vacuum on {} database".format(self.name))
+                self.incremental_vacuum()
+            else:
+                sickrage.app.log.info("Performing vacuum on {} database".format(self.name))
+                self.vacuum()
+
+            maintenance_state['last_vacuum'] = int(time.time())
+
+        if self._maintenance_due(maintenance_state, 'last_analyze', self.analyze_interval):
+            sickrage.app.log.info("Performing analyze on {} database".format(self.name))
+            self.engine.execute("ANALYZE")
+            maintenance_state['last_analyze'] = int(time.time())
 
     def initialize(self):
         pass
@@ -227,7 +355,10 @@ class SRDatabase(object):
         return config
 
     def get_metadata(self):
-        return MetaData(bind=self.engine, reflect=True)
+        metadata = MetaData(bind=self.engine)
+        # skip sqlite internal tables such as the sqlite_stat1 statistics written by ANALYZE
+        metadata.reflect(only=lambda table_name, __: not table_name.startswith('sqlite_'))
+        return metadata
 
     def get_base(self):
         base = automap_base(metadata=self.get_metadata())
@@ -239,72 +370,151 @@ class SRDatabase(object):
             if self.session().scalar("PRAGMA integrity_check") != "ok":
                 sickrage.app.log.fatal(
                     f"{self.name.capitalize()} database file {self.db_path} is damaged, please restore a backup or delete the database file and restart SiCKRAGE")
+                return False
+
+        return True
 
     def cleanup(self):
         pass
 
     def vacuum(self):
+        # switch to incremental auto vacuum while the file is rebuilt anyway, later space can then be reclaimed without a full rewrite
+        self.engine.execute("PRAGMA auto_vacuum = INCREMENTAL")
         self.engine.execute("VACUUM")
 
+    def incremental_vacuum(self):
+        connection = self.engine.raw_connection()
+
+        try:
+            # every fetched step frees pages, so the pragma has to be run to completion
+            cursor = connection.cursor()
+            cursor.execute("PRAGMA incremental_vacuum")
+            cursor.fetchall()
+            connection.commit()
+        finally:
+            connection.close()
+
     def backup(self, filename):
+        """
+        Streams the schema, indexes and rows of every table to filename as a sequence of pickled records, rows are
+        read and written in chunks of backup_chunk_size so memory use does not grow with the size of the database.
+
+        :param filename: backup file to write
+        """
+
         meta = self.get_metadata()
+        inspector = reflection.Inspector.from_engine(self.engine)
+
+        # server side cursors keep drivers such as pymysql from buffering whole tables
+        with open(filename, 'wb') as fh, self.engine.connect().execution_options(stream_results=True) as connection:
+            pickle.dump({'version': self.version, 'chunked': True}, fh, protocol=pickle.DEFAULT_PROTOCOL)
+
+            for table_name, table_object in meta.tables.items():
+                sickrage.app.log.info(f'Backing up {self.name} database table {table_name} schema')
 
-        backup_dict = {
-            'schema': {},
-            'indexes': {},
-            'data': {},
-            'version': self.version
-        }
-
-        for table_name, table_object in meta.tables.items():
-            sickrage.app.log.info(f'Backing up {self.name} database table {table_name} schema')
-            backup_dict['indexes'].update({table_name: []})
-            backup_dict['schema'].update({table_name: str(CreateTable(table_object))})
-            backup_dict['data'].update({table_name: dumps(self.session().query(table_object).all(), protocol=pickle.DEFAULT_PROTOCOL)})
-            for index in reflection.Inspector.from_engine(self.engine).get_indexes(table_name):
-                cols = [table_object.c[col] for col in index['column_names']]
-                idx = Index(index['name'], *cols)
-                backup_dict['indexes'][table_name].append(str(CreateIndex(idx)))
-
-        with open(filename, 'wb') as fh:
-            pickle.dump(backup_dict, fh, protocol=pickle.DEFAULT_PROTOCOL)
+                indexes = []
+                for index in inspector.get_indexes(table_name):
+                    cols = [table_object.c[col] for col in index['column_names']]
+                    idx = Index(index['name'], *cols)
+                    indexes.append(str(CreateIndex(idx)))
+
+                columns = [column.name for column in table_object.columns]
+                pickle.dump(('table', table_name, str(CreateTable(table_object)), indexes, columns), fh, protocol=pickle.DEFAULT_PROTOCOL)
+
+                sickrage.app.log.info(f'Backing up {self.name} database table {table_name} data')
+
+                result = connection.execute(table_object.select())
+
+                try:
+                    while True:
+                        rows = result.fetchmany(self.backup_chunk_size)
+                        if not rows:
+                            break
+
+                        pickle.dump(('rows', table_name, [tuple(row) for row in rows]), fh, protocol=pickle.DEFAULT_PROTOCOL)
+                finally:
+                    result.close()
 
     def restore(self, filename):
-        session = self.session()
+        """
+        Restores a backup made by backup, rows are inserted one chunk at a time. Backups written as a single pickled
+        dict by older versions are still supported.
+
+        :param filename: backup file to restore
+        """
 
         with open(filename, 'rb') as fh:
-            backup_dict = pickle.load(fh)
+            header = pickle.load(fh)
+
+            if not header.get('chunked'):
+                return self._restore_legacy(header)
 
             # drop all tables
             self.get_base().metadata.drop_all()
 
-            # restore schema
-            if backup_dict.get('schema', None):
-                for table_name, schema in backup_dict['schema'].items():
-                    sickrage.app.log.info(f'Restoring {self.name} database table {table_name} schema')
-                    session.execute(schema)
-                session.commit()
-
-            # restore indexes
-            if backup_dict.get('indexes', None):
-                for table_name, indexes in backup_dict['indexes'].items():
-                    sickrage.app.log.info(f'Restoring {self.name} database table {table_name} indexes')
-                    for index in indexes:
-                        session.execute(index)
-                session.commit()
-
-            # restore data
-            if backup_dict.get('data', None):
-                base = self.get_base()
-                meta = self.get_metadata()
-                for table_name, data in backup_dict['data'].items():
-                    sickrage.app.log.info(f'Restoring {self.name} database table {table_name} data')
-                    table = base.classes[table_name]
-                    session.query(table).delete()
-
-                    rows = []
-                    for row in loads(data, meta, session):
-                        if isinstance(row, KeyedTuple):
-                            rows.append(row._asdict())
-                    session.bulk_insert_mappings(table, rows)
-                session.commit()
+            columns = {}
+            indexes = []
+            tables = {}
+
+            with self.engine.begin() as connection:
+                while True:
+                    try:
+                        record = pickle.load(fh)
+                    except EOFError:
+                        break
+
+                    if record[0] == 'table':
+                        __, table_name, schema, table_indexes, columns[table_name] = record
+                        sickrage.app.log.info(f'Restoring {self.name} database table {table_name} schema')
+                        connection.execute(schema)
+                        indexes += table_indexes
+                    elif record[0] == 'rows':
+                        __, table_name, rows = record
+
+                        if table_name not in tables:
+                            sickrage.app.log.info(f'Restoring {self.name} database table {table_name} data')
+                            tables[table_name] = Table(table_name, MetaData(), autoload=True, autoload_with=connection)
+
+                        connection.execute(tables[table_name].insert(), [dict(zip(columns[table_name], row)) for row in rows])
+
+                # indexes are created once all rows are in, which is faster than updating them on every insert
+                sickrage.app.log.info(f'Restoring {self.name} database indexes')
+                for index in indexes:
+                    connection.execute(index)
+
+    def _restore_legacy(self, backup_dict):
+        session = self.session()
+
+        # drop all tables
+        self.get_base().metadata.drop_all()
+
+        # restore schema
+        if backup_dict.get('schema', None):
+            for table_name, schema in backup_dict['schema'].items():
+                sickrage.app.log.info(f'Restoring {self.name} database table {table_name} schema')
+                session.execute(schema)
+            session.commit()
+
+        # restore indexes
+        if backup_dict.get('indexes', None):
+            for table_name, indexes in backup_dict['indexes'].items():
+                sickrage.app.log.info(f'Restoring {self.name} database table {table_name} indexes')
+                for index in indexes:
+                    session.execute(index)
+            session.commit()
+
+        # restore data
+        if backup_dict.get('data', None):
+            base = self.get_base()
+            meta = self.get_metadata()
+            for table_name, data in backup_dict['data'].items():
+                sickrage.app.log.info(f'Restoring {self.name} database table {table_name} data')
+                table = base.classes[table_name]
+                session.query(table).delete()
+
+                rows = []
+                for row in loads(data, meta, session):
+                    if isinstance(row, KeyedTuple):
+                        rows.append(row._asdict())
+                session.bulk_insert_mappings(table, rows)
+            session.commit()
@@ -16,8 +16,11 @@
 # You should have received a copy of the GNU General Public License
 # along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
 
-from sqlalchemy import Column, Integer, Text, String, Boolean, MetaData, Enum
+import time
+
+from sqlalchemy import Column, Integer, Text, String, Boolean, MetaData, Enum, ForeignKeyConstraint, Index, BigInteger
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
 
 from sickrage.core.databases import SRDatabase, SRDatabaseBase
 from sickrage.core.enums import SeriesProviderID
@@ -56,8 +59,14 @@ class CacheDB(SRDatabase):
                 else:
                     found.append((x.series_id, x.name))
 
+        def remove_expired_series_provider_cache():
+            session = self.session()
+            session.query(CacheDB.SeriesProviderCache).filter(CacheDB.SeriesProviderCache.expires <= int(time.time())).delete()
+            session.commit()
+
         remove_duplicates_from_last_search_table()
         # remove_duplicates_from_scene_name_table()
+        remove_expired_series_provider_cache()
 
     class LastUpdate(base):
         __tablename__ = 'last_update'
@@ -103,6 +112,53 @@ class CacheDB(SRDatabase):
         leechers = Column(Integer)
         size = Column(Integer)
 
+        episode_map = relationship('ProviderEpisode', uselist=True, backref='providers', cascade="all, delete-orphan")
+
+    class ProviderEpisode(base):
+        __tablename__ = 'provider_episodes'
+        __table_args__ = (
+            ForeignKeyConstraint(['provider_id'], ['providers.id'], ondelete='CASCADE', name=f'fk_{__tablename__}_provider_id'),
+            Index('idx_provider_series_id_series_provider_id_season_episode', 'provider', 'series_id', 'series_provider_id', 'season', 'episode'),
+        )
+
+        id = Column(Integer, primary_key=True)
+        provider_id = Column(Integer, index=True)
+        provider = Column(Text)
+        series_id = Column(Integer)
+        series_provider_id = Column(Enum(SeriesProviderID))
+        season = Column(Integer)
+        episode = Column(Integer)
+
+    class SeriesProviderCache(base):
+        __tablename__ = 'series_provider_cache'
+        __table_args__ = (
+            Index('idx_provider_series_id_language_season_type', 'provider', 'series_id', 'language', 'season_type', unique=True),
+        )
+
+        id = Column(Integer, primary_key=True)
+        provider = Column(String(32))
+        series_id = Column(Integer)
+        language = Column(String(32))
+        season_type = Column(String(32))
+        series_data = Column(Text)
+        episodes_data = Column(Text)
+        expires = Column(Integer)
+
+    class ShowDirSnapshot(base):
+        __tablename__ = 'show_dir_snapshots'
+        __table_args__ = (
+            Index('idx_series_id_series_provider_id', 'series_id', 'series_provider_id'),
+        )
+
+        id = Column(Integer, primary_key=True)
+        series_id = Column(Integer)
+        series_provider_id = Column(Enum(SeriesProviderID))
+        path = Column(Text)
+        is_dir = Column(Boolean, default=False)
+        size = Column(BigInteger, default=0)
+        mtime = Column(BigInteger)
+        inode = Column(BigInteger)
+
     class Announcements(base):
         __tablename__ = 'announcements'
 
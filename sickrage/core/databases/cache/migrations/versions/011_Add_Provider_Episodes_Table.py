@@ -0,0 +1,57 @@
+"""Initial migration
+
+Revision ID: 11
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+from sickrage.core.enums import SeriesProviderID
+
+revision = '11'
+down_revision = '10'
+
+
+def upgrade():
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=conn)
+    providers = sa.Table('providers', meta, autoload=True)
+
+    if not conn.engine.dialect.has_table(conn.engine, 'provider_episodes'):
+        provider_episodes = op.create_table(
+            'provider_episodes',
+            sa.Column('id', sa.Integer, primary_key=True),
+            sa.Column('provider_id', sa.Integer, index=True),
+            sa.Column('provider', sa.Text),
+            sa.Column('series_id', sa.Integer),
+            sa.Column('series_provider_id', sa.Enum(SeriesProviderID)),
+            sa.Column('season', sa.Integer),
+            sa.Column('episode', sa.Integer),
+            sa.ForeignKeyConstraint(['provider_id'], ['providers.id'], ondelete='CASCADE', name='fk_provider_episodes_provider_id')
+        )
+
+        op.create_index('idx_provider_series_id_series_provider_id_season_episode', 'provider_episodes',
+                        ['provider', 'series_id', 'series_provider_id', 'season', 'episode'])
+
+        with op.get_context().begin_transaction():
+            rows = []
+            for row in conn.execute(providers.select()):
+                for episode in filter(None, (row.episodes or '').split('|')):
+                    rows.append({
+                        'provider_id': row.id,
+                        'provider': row.provider,
+                        'series_id': row.series_id,
+                        'series_provider_id': row.series_provider_id,
+                        'season': row.season,
+                        'episode': int(episode)
+                    })
+
+            if rows:
+                op.bulk_insert(provider_episodes, rows)
+
+
+def downgrade():
+    pass
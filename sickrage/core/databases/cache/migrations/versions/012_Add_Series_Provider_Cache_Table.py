@@ -0,0 +1,38 @@
+"""Initial migration
+
+Revision ID: 12
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+
+revision = '12'
+down_revision = '11'
+
+
+def upgrade():
+    conn = op.get_bind()
+
+    if not conn.engine.dialect.has_table(conn.engine, 'series_provider_cache'):
+        op.create_table(
+            'series_provider_cache',
+            sa.Column('id', sa.Integer, primary_key=True),
+            sa.Column('provider', sa.String(32)),
+            sa.Column('series_id', sa.Integer),
+            sa.Column('language', sa.String(32)),
+            sa.Column('season_type', sa.String(32)),
+            sa.Column('series_data', sa.Text),
+            sa.Column('episodes_data', sa.Text),
+            sa.Column('expires', sa.Integer)
+        )
+
+        op.create_index('idx_provider_series_id_language_season_type', 'series_provider_cache',
+                        ['provider', 'series_id', 'language', 'season_type'], unique=True)
+
+
+def downgrade():
+    pass
@@ -0,0 +1,38 @@
+"""Initial migration
+
+Revision ID: 13
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+from sickrage.core.enums import SeriesProviderID
+
+revision = '13'
+down_revision = '12'
+
+
+def upgrade():
+    conn = op.get_bind()
+
+    if not conn.engine.dialect.has_table(conn.engine, 'show_dir_snapshots'):
+        op.create_table(
+            'show_dir_snapshots',
+            sa.Column('id', sa.Integer, primary_key=True),
+            sa.Column('series_id', sa.Integer),
+            sa.Column('series_provider_id', sa.Enum(SeriesProviderID)),
+            sa.Column('path', sa.Text),
+            sa.Column('is_dir', sa.Boolean, default=False),
+            sa.Column('size', sa.BigInteger, default=0),
+            sa.Column('mtime', sa.BigInteger),
+            sa.Column('inode', sa.BigInteger)
+        )
+
+        op.create_index('idx_series_id_series_provider_id', 'show_dir_snapshots', ['series_id', 'series_provider_id'])
+
+
+def downgrade():
+    pass
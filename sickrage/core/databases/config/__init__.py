@@ -147,6 +147,7 @@ class ConfigDB(SRDatabase):
         allow_high_priority = Column(Boolean, default=False)
         anon_redirect = Column(Text, default='https://anonym.to/?')
         series_provider_timeout = Column(Integer, default=20)
+        series_provider_cache_ttl = Column(Integer, default=24)
         web_use_gzip = Column(Boolean, default=True)
         daily_searcher_freq = Column(Integer, default=40)
         ignore_words = Column(Text, default=','.join(['german', 'french', 'core2hd', 'dutch', 'swedish', 'reenc', 'MrLss']))
@@ -263,6 +264,17 @@ class ConfigDB(SRDatabase):
         view_changelog = Column(Boolean, default=False)
         strip_special_file_bits = Column(Boolean, default=True)
         max_queue_workers = Column(Integer, default=5)
+        name_parser_throttle = Column(Boolean, default=True)
+        name_parser_throttle_rate = Column(Integer, default=50)
+        name_parser_cache_size = Column(Integer, default=1000)
+        name_parser_cache_ttl = Column(Integer, default=0)
+        search_providers_max_workers = Column(Integer, default=5)
+        search_providers_timeout = Column(Integer, default=180)
+        web_max_workers = Column(Integer, default=10)
+        web_session_pool_connections = Column(Integer, default=10)
+        web_session_pool_maxsize = Column(Integer, default=10)
+        web_session_timeout = Column(Integer, default=15)
+        web_session_cache_size = Column(Integer, default=50)
 
     class GUI(base):
         __tablename__ = 'gui'
@@ -0,0 +1,32 @@
+"""Initial migration
+
+Revision ID: 6
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+
+revision = '6'
+down_revision = '5'
+
+
+def upgrade():
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=conn)
+    general = sa.Table('general', meta, autoload=True)
+
+    if not hasattr(general.c, 'name_parser_throttle'):
+        op.add_column('general', sa.Column('name_parser_throttle', sa.Boolean, default=True))
+        conn.execute('UPDATE general SET name_parser_throttle = 1')
+
+    if not hasattr(general.c, 'name_parser_throttle_rate'):
+        op.add_column('general', sa.Column('name_parser_throttle_rate', sa.Integer, default=50))
+        conn.execute('UPDATE general SET name_parser_throttle_rate = 50')
+
+
+def downgrade():
+    pass
@@ -0,0 +1,32 @@
+"""Initial migration
+
+Revision ID: 7
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+
+revision = '7'
+down_revision = '6'
+
+
+def upgrade():
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=conn)
+    general = sa.Table('general', meta, autoload=True)
+
+    if not hasattr(general.c, 'name_parser_cache_size'):
+        op.add_column('general', sa.Column('name_parser_cache_size', sa.Integer, default=1000))
+        conn.execute('UPDATE general SET name_parser_cache_size = 1000')
+
+    if not hasattr(general.c, 'name_parser_cache_ttl'):
+        op.add_column('general', sa.Column('name_parser_cache_ttl', sa.Integer, default=0))
+        conn.execute('UPDATE general SET name_parser_cache_ttl = 0')
+
+
+def downgrade():
+    pass
@@ -0,0 +1,32 @@
+"""Initial migration
+
+Revision ID: 8
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+
+revision = '8'
+down_revision = '7'
+
+
+def upgrade():
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=conn)
+    general = sa.Table('general', meta, autoload=True)
+
+    if not hasattr(general.c, 'search_providers_max_workers'):
+        op.add_column('general', sa.Column('search_providers_max_workers', sa.Integer, default=5))
+        conn.execute('UPDATE general SET search_providers_max_workers = 5')
+
+    if not hasattr(general.c, 'search_providers_timeout'):
+        op.add_column('general', sa.Column('search_providers_timeout', sa.Integer, default=180))
+        conn.execute('UPDATE general SET search_providers_timeout = 180')
+
+
+def downgrade():
+    pass
@@ -0,0 +1,36 @@
+"""Initial migration
+
+Revision ID: 10
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+
+revision = '10'
+down_revision = '9'
+
+
+def upgrade():
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=conn)
+    general = sa.Table('general', meta, autoload=True)
+
+    if not hasattr(general.c, 'web_session_pool_connections'):
+        op.add_column('general', sa.Column('web_session_pool_connections', sa.Integer, default=10))
+        conn.execute('UPDATE general SET web_session_pool_connections = 10')
+
+    if not hasattr(general.c, 'web_session_pool_maxsize'):
+        op.add_column('general', sa.Column('web_session_pool_maxsize', sa.Integer, default=10))
+        conn.execute('UPDATE general SET web_session_pool_maxsize = 10')
+
+    if not hasattr(general.c, 'web_session_timeout'):
+        op.add_column('general', sa.Column('web_session_timeout', sa.Integer, default=15))
+        conn.execute('UPDATE general SET web_session_timeout = 15')
+
+
+def downgrade():
+    pass
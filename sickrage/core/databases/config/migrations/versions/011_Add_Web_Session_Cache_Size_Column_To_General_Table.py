@@ -0,0 +1,28 @@
+"""Initial migration
+
+Revision ID: 11
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+
+revision = '11'
+down_revision = '10'
+
+
+def upgrade():
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=conn)
+    general = sa.Table('general', meta, autoload=True)
+
+    if not hasattr(general.c, 'web_session_cache_size'):
+        op.add_column('general', sa.Column('web_session_cache_size', sa.Integer, default=50))
+        conn.execute('UPDATE general SET web_session_cache_size = 50')
+
+
+def downgrade():
+    pass
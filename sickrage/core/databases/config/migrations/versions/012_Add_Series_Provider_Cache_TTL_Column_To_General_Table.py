@@ -0,0 +1,28 @@
+"""Initial migration
+
+Revision ID: 12
+Revises:
+Create Date: 2017-12-29 14:39:27.854291
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+
+revision = '12'
+down_revision = '11'
+
+
+def upgrade():
+    conn = op.get_bind()
+    meta = sa.MetaData(bind=conn)
+    general = sa.Table('general', meta, autoload=True)
+
+    if not hasattr(general.c, 'series_provider_cache_ttl'):
+        op.add_column('general', sa.Column('series_provider_cache_ttl', sa.Integer, default=24))
+        conn.execute('UPDATE general SET series_provider_cache_ttl = 24')
+
+
+def downgrade():
+    pass
@@ -406,6 +406,70 @@ def list_media_files(path):
     return files
 
 
+def scan_media_files(path, snapshot=None):
+    """
+    Get a snapshot of the media files in a path, only listing folders and stat'ing files that changed since the
+    previous snapshot
+
+    :param path: Path to check for files
+    :param snapshot: previous snapshot, dict of path -> (is_dir, size, mtime, inode)
+    :return: tuple of new snapshot and list of media files that are new or changed since the previous snapshot
+    """
+
+    snapshot = snapshot or {}
+
+    children = {}
+    for cur_path in snapshot:
+        children.setdefault(os.path.dirname(cur_path), []).append(cur_path)
+
+    new_snapshot = {}
+    changed_files = []
+
+    dirs = [os.path.normpath(path)]
+    while dirs:
+        cur_dir = dirs.pop()
+
+        try:
+            dir_stat = os.stat(cur_dir)
+        except OSError:
+            continue
+
+        if not stat.S_ISDIR(dir_stat.st_mode):
+            continue
+
+        new_snapshot[cur_dir] = (True, 0, dir_stat.st_mtime_ns, dir_stat.st_ino)
+
+        # nothing was added, removed or renamed in this folder, re-use its previous contents
+        if snapshot.get(cur_dir) == new_snapshot[cur_dir]:
+            for cur_path in children.get(cur_dir, []):
+                if snapshot[cur_path][0]:
+                    dirs.append(cur_path)
+                elif is_media_file(os.path.basename(cur_path)):
+                    new_snapshot[cur_path] = snapshot[cur_path]
+            continue
+
+        try:
+            entries = list(os.scandir(cur_dir))
+        except OSError:
+            continue
+
+        for entry in entries:
+            try:
+                # if it's a folder do it recursively
+                if entry.is_dir():
+                    if not entry.name.startswith('.') and not entry.name == 'Extras':
+                        dirs.append(entry.path)
+                elif is_media_file(entry.name):
+                    file_stat = entry.stat()
+                    new_snapshot[entry.path] = (False, file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino)
+                    if snapshot.get(entry.path) != new_snapshot[entry.path]:
+                        changed_files.append(entry.path)
+            except OSError:
+                continue
+
+    return new_snapshot, changed_files
+
+
 def copy_file(src_file, dest_file):
     """
     Copy a file from source to destination
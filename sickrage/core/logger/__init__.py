@@ -82,64 +82,94 @@ class Logger(logging.getLoggerClass()):
         self.warning_viewer = WarningViewer()
         self.error_viewer = ErrorViewer()
 
+        # compiled censor pattern, built on first use
+        self._censored_items_regex = None
+
         # start logger
         self.start()
 
     @property
     def censored_items(self):
         try:
-            items = [
-                sickrage.app.config.user.password,
-                sickrage.app.config.sabnzbd.password,
-                sickrage.app.config.sabnzbd.apikey,
-                sickrage.app.config.nzbget.password,
-                sickrage.app.config.synology.password,
-                sickrage.app.config.torrent.password,
-                sickrage.app.config.kodi.password,
-                sickrage.app.config.plex.password,
-                sickrage.app.config.plex.server_token,
-                sickrage.app.config.emby.apikey,
-                sickrage.app.config.growl.password,
-                sickrage.app.config.freemobile.apikey,
-                sickrage.app.config.telegram.apikey,
-                sickrage.app.config.join_app.apikey,
-                sickrage.app.config.prowl.apikey,
-                sickrage.app.config.twitter.password,
-                sickrage.app.config.twilio.auth_token,
-                sickrage.app.config.boxcar2.access_token,
-                sickrage.app.config.pushover.apikey,
-                sickrage.app.config.nma.api_keys,
-                sickrage.app.config.pushalot.auth_token,
-                sickrage.app.config.pushbullet.api_key,
-                sickrage.app.config.email.password,
-                sickrage.app.config.subtitles.addic7ed_pass,
-                sickrage.app.config.subtitles.legendastv_pass,
-                sickrage.app.config.subtitles.itasa_pass,
-                sickrage.app.config.subtitles.opensubtitles_pass,
-                sickrage.app.config.anidb.password
-            ]
-
-            for __, search_provider in sickrage.app.search_providers.all().items():
-                if search_provider.provider_type in [SearchProviderType.NZB, SearchProviderType.NEWZNAB]:
-                    items.append(search_provider.api_key)
-                elif search_provider.provider_type == SearchProviderType.TORRENT_RSS and not search_provider.default:
-                    items.append(search_provider.urls['base_url'])
-
-                items.append(search_provider.cookies)
-
-                [items.append(search_provider.custom_settings[item]) for item in [
-                    'digest',
-                    'hash',
-                    'api_key',
-                    'password',
-                    'passkey',
-                    'pin',
-                ] if item in search_provider.custom_settings]
-
-            return list(filter(None, items))
+            return self._get_censored_items()
         except AttributeError:
             return []
 
+    def _get_censored_items(self):
+        items = [
+            sickrage.app.config.user.password,
+            sickrage.app.config.sabnzbd.password,
+            sickrage.app.config.sabnzbd.apikey,
+            sickrage.app.config.nzbget.password,
+            sickrage.app.config.synology.password,
+            sickrage.app.config.torrent.password,
+            sickrage.app.config.kodi.password,
+            sickrage.app.config.plex.password,
+            sickrage.app.config.plex.server_token,
+            sickrage.app.config.emby.apikey,
+            sickrage.app.config.growl.password,
+            sickrage.app.config.freemobile.apikey,
+            sickrage.app.config.telegram.apikey,
+            sickrage.app.config.join_app.apikey,
+            sickrage.app.config.prowl.apikey,
+            sickrage.app.config.twitter.password,
+            sickrage.app.config.twilio.auth_token,
+            sickrage.app.config.boxcar2.access_token,
+            sickrage.app.config.pushover.apikey,
+            sickrage.app.config.nma.api_keys,
+            sickrage.app.config.pushalot.auth_token,
+            sickrage.app.config.pushbullet.api_key,
+            sickrage.app.config.email.password,
+            sickrage.app.config.subtitles.addic7ed_pass,
+            sickrage.app.config.subtitles.legendastv_pass,
+            sickrage.app.config.subtitles.itasa_pass,
+            sickrage.app.config.subtitles.opensubtitles_pass,
+            sickrage.app.config.anidb.password
+        ]
+
+        for __, search_provider in sickrage.app.search_providers.all().items():
+            if search_provider.provider_type in [SearchProviderType.NZB, SearchProviderType.NEWZNAB]:
+                items.append(search_provider.api_key)
+            elif search_provider.provider_type == SearchProviderType.TORRENT_RSS and not search_provider.default:
+                items.append(search_provider.urls['base_url'])
+
+            items.append(search_provider.cookies)
+
+            [items.append(search_provider.custom_settings[item]) for item in [
+                'digest',
+                'hash',
+                'api_key',
+                'password',
+                'passkey',
+                'pin',
+            ] if item in search_provider.custom_settings]
+
+        return list(filter(None, items))
+
+    @property
+    def censored_items_regex(self):
+        """
+        Compiled pattern matching all censored items, rebuilt after reset_censored_items() is called
+        """
+
+        if self._censored_items_regex is None:
+            try:
+                items = sorted(set(map(str, self._get_censored_items())), key=len, reverse=True)
+            except AttributeError:
+                # config not loaded yet, try again on the next record
+                return None
+
+            self._censored_items_regex = re.compile(fr"(?<!\w)({'|'.join(map(re.escape, items))})(?!\w)") if items else False
+
+        return self._censored_items_regex
+
+    def reset_censored_items(self):
+        self._censored_items_regex = None
+
+    @property
+    def handler_level(self):
+        return min([handler.level for handler in self.handlers], default=logging.NOTSET)
+
     def start(self):
         # remove all handlers
         self.handlers.clear()
@@ -191,11 +221,17 @@ class Logger(logging.getLoggerClass()):
         if name in self.loggers:
             record = super(Logger, self).makeRecord(name, level, fn, lno, msg, args, exc_info, func, extra, sinfo)
 
+            # no handler will emit this record, skip censoring it
+            if record.levelno < self.handler_level:
+                return record
+
             try:
                 def repl(m):
                     return '*' * len(m.group())
 
-                record.msg = re.sub(fr"\b({'|'.join(self.censored_items)})\b", repl, record.msg)
+                censored_items_regex = self.censored_items_regex
+                if censored_items_regex:
+                    record.msg = censored_items_regex.sub(repl, record.msg)
                 record.msg = unidecode(record.msg)
             except:
                 pass
@@ -24,10 +24,11 @@ import os
 import re
 import time
 from collections import OrderedDict
-from threading import Lock
+from threading import Lock, local
 
 from dateutil import parser
 from sqlalchemy import orm
+from tornado.ioloop import IOLoop
 
 import sickrage
 from sickrage.core.common import Quality, Qualities
@@ -115,17 +116,26 @@ class NameParser(object):
         return series_name.strip()
 
     def _compile_regexes(self, regexMode):
-        if regexMode == self.ANIME_REGEX:
+        self.compiled_regexes = compiled_regexes.get(regexMode)
+        if self.compiled_regexes is None:
+            with compiled_regexes_lock:
+                if regexMode not in compiled_regexes:
+                    compiled_regexes[regexMode] = self._build_regexes(regexMode)
+                self.compiled_regexes = compiled_regexes[regexMode]
+
+    @staticmethod
+    def _build_regexes(regexMode):
+        if regexMode == NameParser.ANIME_REGEX:
             dbg_str = "ANIME"
             uncompiled_regex = [regexes.anime_regexes]
-        elif regexMode == self.NORMAL_REGEX:
+        elif regexMode == NameParser.NORMAL_REGEX:
             dbg_str = "NORMAL"
             uncompiled_regex = [regexes.normal_regexes]
         else:
             dbg_str = "ALL"
             uncompiled_regex = [regexes.normal_regexes, regexes.anime_regexes]
 
-        self.compiled_regexes = []
+        compiled = []
         for regexItem in uncompiled_regex:
             for cur_pattern_num, (cur_pattern_name, cur_pattern) in enumerate(regexItem):
                 try:
@@ -135,7 +145,9 @@ class NameParser(object):
                         "WARNING: Invalid episode_pattern using %s regexs, %s. %s" % (
                             dbg_str, errormsg, cur_pattern))
                 else:
-                    self.compiled_regexes.append((cur_pattern_num, cur_pattern_name, cur_regex))
+                    compiled.append((cur_pattern_num, cur_pattern_name, cur_regex))
+
+        return tuple(compiled)
 
     def _parse_string(self, name, skip_scene_detection=False):
         if not name:
@@ -358,9 +370,6 @@ class NameParser(object):
             if show_obj.scene and not skip_scene_detection:
                 sickrage.app.log.debug(f"Scene converted parsed result {best_result.original_name} into {best_result}")
 
-        # CPU sleep
-        time.sleep(0.02)
-
         return best_result
 
     def _combine_results(self, first, second, attr):
@@ -428,6 +437,8 @@ class NameParser(object):
         if cached:
             return cached
 
+        start_cpu_time = time.thread_time()
+
         # break it into parts if there are any (dirname, file name, extension)
         dir_name, file_name = os.path.split(name)
 
@@ -447,6 +458,9 @@ class NameParser(object):
         # parse the dirname for extra info if needed
         dir_name_result = self._parse_string(dir_name, skip_scene_detection)
 
+        # throttle parsing in worker threads that are over their cpu budget
+        name_parser_throttle.throttle(time.thread_time() - start_cpu_time)
+
         # build the ParseResult object
         final_result.air_date = self._combine_results(file_name_result, dir_name_result, 'air_date')
 
@@ -582,28 +596,148 @@ class ParseResult(object):
         return False
 
 
+def _general_setting(name, default):
+    """
+    Reads a general config setting, falling back to its default while the config is not loaded yet
+    """
+    general = sickrage.app.config.general
+    return getattr(general, name) if general else default
+
+
 class NameParserCache(object):
     def __init__(self):
         self.lock = Lock()
         self.data = OrderedDict()
-        self.max_size = 200
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def max_size(self):
+        return max(_general_setting('name_parser_cache_size', 1000) or 0, 0)
+
+    @property
+    def ttl(self):
+        return _general_setting('name_parser_cache_ttl', 0) or 0
+
+    @property
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.data),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_ratio': self.hits / lookups if lookups else 0.0
+            }
 
     def get(self, key):
         with self.lock:
-            value = self.data.get(key)
-            if value:
-                sickrage.app.log.debug("Using cached parse result for: {}".format(key))
-            return value
+            item = self.data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+
+            value, added = item
+            if self.ttl and time.monotonic() - added > self.ttl:
+                del self.data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self.data.move_to_end(key)
+            self.hits += 1
+
+        sickrage.app.log.debug("Using cached parse result for: {}".format(key))
+        return value
 
     def add(self, key, value):
         with self.lock:
-            self.data.update({key: value})
-            while len(self.data) > self.max_size:
-                self.data.pop(list(self.data.keys())[0], None)
+            self.data[key] = (value, time.monotonic())
+            self.data.move_to_end(key)
+
+            max_size = self.max_size
+            while len(self.data) > max_size:
+                self.data.popitem(last=False)
+                self.evictions += 1
+
+
+class NameParserThrottle(object):
+    """
+    Token bucket throttle for name parsing, a parse only draws a token when its worker thread has used up its
+    cpu budget, so batch parsing runs at full speed until it starts to starve the rest of the process. Parses on
+    the IOLoop thread are never throttled, sleeping there would stall every web request.
+    """
+
+    def __init__(self, cpu_budget=0.5, window=1.0):
+        self.lock = Lock()
+        self.cpu_budget = cpu_budget
+        self.window = window
+        self.tokens = None
+        self.last_refill = time.monotonic()
+        self.thread_usage = local()
+
+    @property
+    def enabled(self):
+        return _general_setting('name_parser_throttle', True)
+
+    @property
+    def rate(self):
+        return max(_general_setting('name_parser_throttle_rate', 50) or 0, 1)
+
+    def throttle(self, cpu_time):
+        if not self.enabled:
+            return
+
+        if IOLoop.current(instance=False) is not None:
+            return
+
+        if not self._over_cpu_budget(cpu_time):
+            return
+
+        delay = self._consume()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _over_cpu_budget(self, cpu_time):
+        now = time.monotonic()
+
+        if now - getattr(self.thread_usage, 'window_start', 0) > self.window:
+            self.thread_usage.window_start = now
+            self.thread_usage.cpu_time = 0
+
+        self.thread_usage.cpu_time += cpu_time
+
+        return self.thread_usage.cpu_time > self.cpu_budget * self.window
+
+    def _consume(self):
+        with self.lock:
+            rate = self.rate
+            now = time.monotonic()
+
+            if self.tokens is None:
+                self.tokens = rate
+
+            self.tokens = min(rate, self.tokens + (now - self.last_refill) * rate)
+            self.last_refill = now
+            self.tokens -= 1
+
+            return -self.tokens / rate if self.tokens < 0 else 0
 
 
 name_parser_cache = NameParserCache()
 
+name_parser_throttle = NameParserThrottle()
+
+# compiled regexes are shared by all parser instances, keyed by regex mode
+compiled_regexes = {}
+compiled_regexes_lock = Lock()
+
 
 class InvalidNameException(Exception):
     """The given release name is not valid"""
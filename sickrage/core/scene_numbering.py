@@ -454,24 +454,25 @@ def xem_refresh(series_id, series_provider_id, force=False):
                 sickrage.app.log.info('No XEM data for show {} on {}'.format(show_object.name, show_object.series_provider.name))
                 return
 
-            for entry in parsed_json['data']:
-                try:
-                    episode_object = show_object.get_episode(season=entry[show_object.series_provider.xem_origin]['season'],
-                                                             episode=entry[show_object.series_provider.xem_origin]['episode'])
-                except EpisodeNotFoundException:
-                    continue
-
-                if 'scene' in entry:
-                    episode_object.xem_season = entry['scene']['season']
-                    episode_object.xem_episode = entry['scene']['episode']
-                    episode_object.xem_absolute_number = entry['scene']['absolute']
-
-                if 'scene_2' in entry:  # for doubles
-                    episode_object.xem_season = entry['scene_2']['season']
-                    episode_object.xem_episode = entry['scene_2']['episode']
-                    episode_object.xem_absolute_number = entry['scene_2']['absolute']
-
-                episode_object.save()
+            with show_object.batch_save():
+                for entry in parsed_json['data']:
+                    try:
+                        episode_object = show_object.get_episode(season=entry[show_object.series_provider.xem_origin]['season'],
+                                                                 episode=entry[show_object.series_provider.xem_origin]['episode'])
+                    except EpisodeNotFoundException:
+                        continue
+
+                    if 'scene' in entry:
+                        episode_object.xem_season = entry['scene']['season']
+                        episode_object.xem_episode = entry['scene']['episode']
+                        episode_object.xem_absolute_number = entry['scene']['absolute']
+
+                    if 'scene_2' in entry:  # for doubles
+                        episode_object.xem_season = entry['scene_2']['season']
+                        episode_object.xem_episode = entry['scene_2']['episode']
+                        episode_object.xem_absolute_number = entry['scene_2']['absolute']
+
+                    episode_object.save()
         except Exception as e:
             sickrage.app.log.debug("Exception while refreshing XEM data for show {} on {}: {}".format(series_id, show_object.series_provider.name, e))
             sickrage.app.log.debug(traceback.format_exc())
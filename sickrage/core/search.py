@@ -19,6 +19,8 @@
 import itertools
 import re
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
 from datetime import date, timedelta
 
 import sickrage
@@ -32,7 +34,7 @@ from sickrage.core.common import (
 )
 from sickrage.core.enums import NzbMethod, TorrentMethod
 from sickrage.core.exceptions import AuthException
-from sickrage.core.helpers import show_names
+from sickrage.core.helpers import show_names, try_int
 from sickrage.core.nzbSplitter import split_nzb_result
 from sickrage.core.tv.show.helpers import find_show
 from sickrage.core.tv.show.history import (
@@ -47,6 +49,11 @@ from sickrage.search_providers import (
     TorrentRssProvider, SearchProviderType
 )
 
+# provider searches share one thread pool, see get_search_executor
+search_executor = None
+search_executor_max_workers = None
+search_executor_lock = threading.Lock()
+
 
 def snatch_episode(result, end_status=EpisodeStatus.SNATCHED):
     """
@@ -114,24 +121,25 @@ def snatch_episode(result, end_status=EpisodeStatus.SNATCHED):
     sickrage.app.alerts.message(_('Episode snatched'), result.name)
 
     trakt_data = []
-    for episode_number in result.episodes:
-        episode_obj = show_object.get_episode(result.season, episode_number)
+    with show_object.batch_save():
+        for episode_number in result.episodes:
+            episode_obj = show_object.get_episode(result.season, episode_number)
 
-        if is_first_best_match(result):
-            episode_obj.status = Quality.composite_status(EpisodeStatus.SNATCHED_BEST, result.quality)
-        else:
-            episode_obj.status = Quality.composite_status(end_status, result.quality)
+            if is_first_best_match(result):
+                episode_obj.status = Quality.composite_status(EpisodeStatus.SNATCHED_BEST, result.quality)
+            else:
+                episode_obj.status = Quality.composite_status(end_status, result.quality)
 
-        episode_obj.save()
+            episode_obj.save()
 
-        # don't notify when we re-download an episode
-        if episode_obj.status not in EpisodeStatus.composites(EpisodeStatus.DOWNLOADED):
-            try:
-                NotificationProvider.mass_notify_snatch(episode_obj._format_pattern('%SN - %Sx%0E - %EN - %QN') + " from " + result.provider.name)
-            except Exception:
-                sickrage.app.log.debug("Failed to send snatch notification")
+            # don't notify when we re-download an episode
+            if episode_obj.status not in EpisodeStatus.composites(EpisodeStatus.DOWNLOADED):
+                try:
+                    NotificationProvider.mass_notify_snatch(episode_obj._format_pattern('%SN - %Sx%0E - %EN - %QN') + " from " + result.provider.name)
+                except Exception:
+                    sickrage.app.log.debug("Failed to send snatch notification")
 
-            trakt_data.append((episode_obj.season, episode_obj.episode))
+                trakt_data.append((episode_obj.season, episode_obj.episode))
 
     data = sickrage.app.notification_providers['trakt'].trakt_episode_data_generate(trakt_data)
 
@@ -307,84 +315,121 @@ def is_first_best_match(result):
     return False
 
 
-def search_providers(series_id, series_provider_id, season, episode, manualSearch=False, downCurQuality=False, cacheOnly=False):
+def narrow_results(results):
     """
-    Walk providers for information on shows
+    Narrows a list of results down to the best ones needed to cover all of their episodes.
 
-    :param series_id: Show ID we are looking for
-    :param episodes: Episode IDs we hope to find
-    :param manualSearch: Boolean, is this a manual search?
-    :param downCurQuality: Boolean, should we re-download currently available quality file
-    :return: results for search
+    Results are ranked by quality and then by seeders, nzb results don't depend on seeders so they
+    outrank torrents of the same quality, ties keep their original order. Results are then picked
+    greedily in ranked order, keeping only those that cover an episode not already covered.
+
+    :param results: list of result objects
+    :return: list of narrowed result objects
     """
 
-    orig_thread_name = threading.currentThread().getName()
+    def rank(result):
+        quality = 0 if result.quality == Qualities.UNKNOWN else int(result.quality)
+        if result.provider.provider_type == NZBProvider.provider_type:
+            return quality, float('inf')
+        return quality, try_int(result.seeders, -1)
 
-    show_object = find_show(series_id, series_provider_id)
+    narrowed = []
+    covered_episodes = set()
 
-    final_results = []
+    for result in sorted(results, key=rank, reverse=True):
+        episodes = set(result.episodes)
+        if not episodes or not episodes.issubset(covered_episodes):
+            narrowed.append(result)
+            covered_episodes |= episodes
 
-    for providerID, providerObj in sickrage.app.search_providers.sort(randomize=sickrage.app.config.general.randomize_providers).items():
-        # check if provider is enabled
-        if not providerObj.is_enabled:
-            continue
+    return narrowed
 
-        # check provider type
-        if not sickrage.app.config.general.use_nzbs and providerObj.provider_type in [NZBProvider.provider_type, NewznabProvider.provider_type]:
-            continue
-        elif not sickrage.app.config.general.use_torrents and providerObj.provider_type in [TorrentProvider.provider_type, TorrentRssProvider.provider_type]:
-            continue
 
-        if providerObj.anime_only and not show_object.is_anime:
-            sickrage.app.log.debug("" + str(show_object.name) + " is not an anime, skiping")
-            continue
+def get_search_executor():
+    """
+    Returns the thread pool shared by all provider searches, it is rebuilt when the worker settings change
+
+    :return: ThreadPoolExecutor
+    """
+
+    global search_executor, search_executor_max_workers
+
+    # every search queue worker gets its own share of provider workers
+    max_workers = max(sickrage.app.config.general.search_providers_max_workers or 0, 1) * max(sickrage.app.config.general.max_queue_workers or 0, 1)
+
+    with search_executor_lock:
+        if search_executor is None or search_executor_max_workers != max_workers:
+            if search_executor is not None:
+                search_executor.shutdown(wait=False)
+
+            search_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='SEARCH-PROVIDER')
+            search_executor_max_workers = max_workers
+
+        return search_executor
+
+
+def _search_provider(provider, orig_thread_name, series_id, series_provider_id, season, episode, manualSearch, downCurQuality, cacheOnly,
+                     stop_searching=None):
+    """
+    Searches a single provider, falling back between episode and season pack searches if enabled
+
+    :param stop_searching: event set once the overall search gave up on this provider, no further requests are started
+
+    :return: dict of search results keyed by episode number
+    """
+
+    show_object = find_show(series_id, series_provider_id)
+
+    found_results = {}
 
-        found_results = {}
+    search_count = 0
+    search_mode = provider.search_mode
 
-        search_count = 0
-        search_mode = providerObj.search_mode
+    # Always search for episode when manually searching when in sponly
+    if search_mode == 'sponly' and manualSearch is True:
+        search_mode = 'eponly'
 
-        # Always search for episode when manually searching when in sponly
-        if search_mode == 'sponly' and manualSearch is True:
-            search_mode = 'eponly'
+    thread = threading.currentThread()
+    thread_name = thread.getName()
+    thread.setName(orig_thread_name + "::[" + provider.name + "]")
 
+    try:
         while True:
+            if stop_searching and stop_searching.is_set():
+                break
+
             search_count += 1
 
             try:
-                threading.currentThread().setName(orig_thread_name + "::[" + providerObj.name + "]")
-
                 if episode and search_mode == 'eponly':
                     sickrage.app.log.info("Performing episode search for " + show_object.name)
                 else:
                     sickrage.app.log.info("Performing season pack search for " + show_object.name)
 
                 # search provider for episodes
-                found_results = providerObj.find_search_results(series_id,
-                                                                series_provider_id,
-                                                                season,
-                                                                episode,
-                                                                search_mode,
-                                                                manualSearch,
-                                                                downCurQuality,
-                                                                cacheOnly)
+                found_results = provider.find_search_results(series_id,
+                                                             series_provider_id,
+                                                             season,
+                                                             episode,
+                                                             search_mode,
+                                                             manualSearch,
+                                                             downCurQuality,
+                                                             cacheOnly)
             except AuthException as e:
                 sickrage.app.log.warning("Authentication error: {}".format(e))
                 break
             except Exception as e:
-                sickrage.app.log.error("Error while searching " + providerObj.name + ", skipping: {}".format(e))
+                sickrage.app.log.error("Error while searching " + provider.name + ", skipping: {}".format(e))
                 break
-            finally:
-                threading.currentThread().setName(orig_thread_name)
 
             if len(found_results):
                 # make a list of all the results for this provider
                 for search_result in found_results:
                     # Sort results by seeders if available
-                    if providerObj.provider_type == SearchProviderType.TORRENT or getattr(providerObj, 'torznab', False):
+                    if provider.provider_type == SearchProviderType.TORRENT or getattr(provider, 'torznab', False):
                         found_results[search_result].sort(key=lambda k: int(k.seeders), reverse=True)
                 break
-            elif not providerObj.search_fallback or search_count == 2:
+            elif not provider.search_fallback or search_count == 2:
                 break
 
             if search_mode == 'sponly':
@@ -393,176 +438,238 @@ def search_providers(series_id, series_provider_id, season, episode, manualSearc
             else:
                 sickrage.app.log.debug("Fallback season pack search initiate")
                 search_mode = 'sponly'
+    finally:
+        thread.setName(thread_name)
 
-        # skip to next provider if we have no results to process
-        if not len(found_results):
-            continue
+    return found_results
 
-        # remove duplicates
-        for cur_episode in found_results:
-            found_results[cur_episode] = [next(obj) for i, obj in itertools.groupby(sorted(found_results[cur_episode], key=lambda x: x.url), lambda x: x.url)]
 
-        # pick the best season NZB
-        best_season_result = None
-        if SEASON_RESULT in found_results:
-            best_season_result = pick_best_result(found_results[SEASON_RESULT], season_pack=True)
+def search_providers(series_id, series_provider_id, season, episode, manualSearch=False, downCurQuality=False, cacheOnly=False):
+    """
+    Walk providers for information on shows
 
-        highest_quality_overall = 0
-        for cur_episode in found_results:
-            for cur_result in found_results[cur_episode]:
-                if cur_result.quality != Qualities.UNKNOWN and cur_result.quality > highest_quality_overall:
-                    highest_quality_overall = cur_result.quality
+    :param series_id: Show ID we are looking for
+    :param episodes: Episode IDs we hope to find
+    :param manualSearch: Boolean, is this a manual search?
+    :param downCurQuality: Boolean, should we re-download currently available quality file
+    :return: results for search
+    """
 
-        sickrage.app.log.debug("The highest quality of any match is " + highest_quality_overall.display_name)
+    orig_thread_name = threading.currentThread().getName()
 
-        # see if every episode is wanted
-        if best_season_result:
-            # get the quality of the season nzb
-            season_qual = best_season_result.quality
-            sickrage.app.log.debug("The quality of the season " + best_season_result.provider.provider_type.display_name + " is " + season_qual.display_name)
+    show_object = find_show(series_id, series_provider_id)
 
-            all_episodes = set([x.episode for x in show_object.episodes if x.season == best_season_result.season])
+    final_results = []
 
-            sickrage.app.log.debug("Episodes list: {}".format(','.join(map(str, all_episodes))))
+    providers = []
+    for providerID, providerObj in sickrage.app.search_providers.sort(randomize=sickrage.app.config.general.randomize_providers).items():
+        # check if provider is enabled
+        if not providerObj.is_enabled:
+            continue
 
-            all_wanted = True
-            any_wanted = False
+        # check provider type
+        if not sickrage.app.config.general.use_nzbs and providerObj.provider_type in [NZBProvider.provider_type, NewznabProvider.provider_type]:
+            continue
+        elif not sickrage.app.config.general.use_torrents and providerObj.provider_type in [TorrentProvider.provider_type, TorrentRssProvider.provider_type]:
+            continue
 
-            for curEp in all_episodes:
-                if not show_object.want_episode(season, curEp, season_qual, downCurQuality):
-                    all_wanted = False
-                else:
-                    any_wanted = True
+        if providerObj.anime_only and not show_object.is_anime:
+            sickrage.app.log.debug("" + str(show_object.name) + " is not an anime, skiping")
+            continue
 
-            # if we need every ep in the season and there's nothing better then just download this and be done
-            # with it (unless single episodes are preferred)
-            if all_wanted and best_season_result.quality == highest_quality_overall:
-                sickrage.app.log.info("Every ep in this season is needed, "
-                                      "downloading the whole " + best_season_result.provider.provider_type.display_name + " " + best_season_result.name)
+        providers.append(providerObj)
 
-                best_season_result.episodes = all_episodes
+    # one deadline for the whole search, providers that have not finished by then are skipped
+    timeout = sickrage.app.config.general.search_providers_timeout or None
+    deadline = time.monotonic() + timeout if timeout else None
+    stop_searching = threading.Event()
+    timed_out = []
 
-                return best_season_result
-            elif not any_wanted:
-                sickrage.app.log.debug("No eps from this season are wanted at this quality, ignoring the result of {}".format(best_season_result.name))
-            else:
-                if best_season_result.provider.provider_type == NZBProvider.provider_type:
-                    sickrage.app.log.debug("Breaking apart the NZB and adding the individual ones to our results")
-
-                    # if not, break it apart and add them as the lowest priority results
-                    individual_results = split_nzb_result(best_season_result)
-                    for curResult in individual_results:
-                        ep_num = -1
-                        if len(curResult.episodes) == 1:
-                            ep_num = curResult.episodes[0]
-                        elif len(curResult.episodes) > 1:
-                            ep_num = MULTI_EP_RESULT
-
-                        if ep_num in found_results:
-                            found_results[ep_num].append(curResult)
-                        else:
-                            found_results[ep_num] = [curResult]
+    # search providers concurrently, results are still processed in provider order so they stay deterministic
+    executor = get_search_executor()
+    futures = [(providerObj, executor.submit(_search_provider, providerObj, orig_thread_name, series_id, series_provider_id, season, episode,
+                                             manualSearch, downCurQuality, cacheOnly, stop_searching)) for providerObj in providers]
 
-                # If this is a torrent all we can do is leech the entire torrent, user will have to select which
-                # eps not do download in his torrent client
-                else:
-                    # Season result from Torrent Provider must be a full-season torrent, creating multi-ep result
-                    # for it.
-                    sickrage.app.log.info("Adding multi-ep result for full-season torrent. Set the episodes you "
-                                          "don't want to 'don't download' in your torrent client if desired!")
+    try:
+        for providerObj, future in futures:
+            try:
+                found_results = future.result(timeout=max(deadline - time.monotonic(), 0) if deadline else None)
+            except TimeoutError:
+                timed_out.append(providerObj.name)
+                continue
 
-                    best_season_result.episodes = all_episodes
+            # skip to next provider if we have no results to process
+            if not len(found_results):
+                continue
 
-                    if MULTI_EP_RESULT in found_results:
-                        found_results[MULTI_EP_RESULT].append(best_season_result)
-                    else:
-                        found_results[MULTI_EP_RESULT] = [best_season_result]
-
-        # go through multi-ep results and see if we really want them or not, get rid of the rest
-        multi_results = {}
-        if MULTI_EP_RESULT in found_results:
-            for _multiResult in found_results[MULTI_EP_RESULT]:
-                sickrage.app.log.debug(
-                    "Seeing if we want to bother with multi-episode result " + _multiResult.name)
-
-                # Filter result by ignore/required/whitelist/blacklist/quality, etc
-                multi_result = pick_best_result(_multiResult)
-                if not multi_result:
-                    continue
+            # remove duplicates
+            for cur_episode in found_results:
+                found_results[cur_episode] = [next(obj) for i, obj in itertools.groupby(sorted(found_results[cur_episode], key=lambda x: x.url), lambda x: x.url)]
 
-                # see how many of the eps that this result covers aren't covered by single results
-                needed_eps = []
-                not_needed_eps = []
-                for multi_result_episode in multi_result.episodes:
-                    # if we have results for the episode
-                    if multi_result_episode in found_results and len(found_results[multi_result_episode]) > 0:
-                        not_needed_eps.append(multi_result_episode)
-                    else:
-                        needed_eps.append(multi_result_episode)
+            # pick the best season NZB
+            best_season_result = None
+            if SEASON_RESULT in found_results:
+                best_season_result = pick_best_result(found_results[SEASON_RESULT], season_pack=True)
 
-                sickrage.app.log.debug("Single-ep check result is neededEps: " + str(needed_eps) + ", notNeededEps: " + str(not_needed_eps))
-                if not needed_eps:
-                    sickrage.app.log.debug("All of these episodes were covered by single episode results, ignoring this multi-episode result")
-                    continue
+            highest_quality_overall = 0
+            for cur_episode in found_results:
+                for cur_result in found_results[cur_episode]:
+                    if cur_result.quality != Qualities.UNKNOWN and cur_result.quality > highest_quality_overall:
+                        highest_quality_overall = cur_result.quality
 
-                # check if these eps are already covered by another multi-result
-                multi_needed_eps = []
-                multi_not_needed_eps = []
-                for multi_result_episode in multi_result.episodes:
-                    if multi_result_episode in multi_results:
-                        multi_not_needed_eps.append(multi_result_episode)
-                    else:
-                        multi_needed_eps.append(multi_result_episode)
+            sickrage.app.log.debug("The highest quality of any match is " + highest_quality_overall.display_name)
 
-                sickrage.app.log.debug(
-                    "Multi-ep check result is multiNeededEps: " + str(
-                        multi_needed_eps) + ", multiNotNeededEps: " + str(
-                        multi_not_needed_eps)
-                )
+            # see if every episode is wanted
+            if best_season_result:
+                # get the quality of the season nzb
+                season_qual = best_season_result.quality
+                sickrage.app.log.debug("The quality of the season " + best_season_result.provider.provider_type.display_name + " is " + season_qual.display_name)
 
-                if not multi_needed_eps:
-                    sickrage.app.log.debug("All of these episodes were covered by another multi-episode nzbs, ignoring this multi-ep result")
-                    continue
+                all_episodes = set([x.episode for x in show_object.episodes if x.season == best_season_result.season])
 
-                # don't bother with the single result if we're going to get it with a multi result
-                for multi_result_episode in multi_result.episodes:
-                    multi_results[multi_result_episode] = multi_result
+                sickrage.app.log.debug("Episodes list: {}".format(','.join(map(str, all_episodes))))
 
-                    if multi_result_episode in found_results:
-                        sickrage.app.log.debug("A needed multi-episode result overlaps with a single-episode result for ep #" + str(
-                            multi_result_episode) + ", removing the single-episode results from the list")
-                        del found_results[multi_result_episode]
+                all_wanted = True
+                any_wanted = False
 
-        # of all the single ep results narrow it down to the best one
-        final_results += list(set(multi_results.values()))
-        for curEp, curResults in found_results.items():
-            if curEp in (MULTI_EP_RESULT, SEASON_RESULT):
-                continue
+                for curEp in all_episodes:
+                    if not show_object.want_episode(season, curEp, season_qual, downCurQuality):
+                        all_wanted = False
+                    else:
+                        any_wanted = True
 
-            if not len(curResults) > 0:
-                continue
+                # if we need every ep in the season and there's nothing better then just download this and be done
+                # with it (unless single episodes are preferred)
+                if all_wanted and best_season_result.quality == highest_quality_overall:
+                    sickrage.app.log.info("Every ep in this season is needed, "
+                                          "downloading the whole " + best_season_result.provider.provider_type.display_name + " " + best_season_result.name)
 
-            # if all results were rejected move on to the next episode
-            best_result = pick_best_result(curResults)
-            if not best_result:
-                continue
+                    best_season_result.episodes = all_episodes
+
+                    return best_season_result
+                elif not any_wanted:
+                    sickrage.app.log.debug("No eps from this season are wanted at this quality, ignoring the result of {}".format(best_season_result.name))
+                else:
+                    if best_season_result.provider.provider_type == NZBProvider.provider_type:
+                        sickrage.app.log.debug("Breaking apart the NZB and adding the individual ones to our results")
+
+                        # if not, break it apart and add them as the lowest priority results
+                        individual_results = split_nzb_result(best_season_result)
+                        for curResult in individual_results:
+                            ep_num = -1
+                            if len(curResult.episodes) == 1:
+                                ep_num = curResult.episodes[0]
+                            elif len(curResult.episodes) > 1:
+                                ep_num = MULTI_EP_RESULT
+
+                            if ep_num in found_results:
+                                found_results[ep_num].append(curResult)
+                            else:
+                                found_results[ep_num] = [curResult]
+
+                    # If this is a torrent all we can do is leech the entire torrent, user will have to select which
+                    # eps not do download in his torrent client
+                    else:
+                        # Season result from Torrent Provider must be a full-season torrent, creating multi-ep result
+                        # for it.
+                        sickrage.app.log.info("Adding multi-ep result for full-season torrent. Set the episodes you "
+                                              "don't want to 'don't download' in your torrent client if desired!")
+
+                        best_season_result.episodes = all_episodes
 
-            # add result
-            final_results.append(best_result)
+                        if MULTI_EP_RESULT in found_results:
+                            found_results[MULTI_EP_RESULT].append(best_season_result)
+                        else:
+                            found_results[MULTI_EP_RESULT] = [best_season_result]
+
+            # go through multi-ep results and see if we really want them or not, get rid of the rest
+            multi_results = {}
+            if MULTI_EP_RESULT in found_results:
+                for _multiResult in found_results[MULTI_EP_RESULT]:
+                    sickrage.app.log.debug(
+                        "Seeing if we want to bother with multi-episode result " + _multiResult.name)
+
+                    # Filter result by ignore/required/whitelist/blacklist/quality, etc
+                    multi_result = pick_best_result(_multiResult)
+                    if not multi_result:
+                        continue
+
+                    # see how many of the eps that this result covers aren't covered by single results
+                    needed_eps = []
+                    not_needed_eps = []
+                    for multi_result_episode in multi_result.episodes:
+                        # if we have results for the episode
+                        if multi_result_episode in found_results and len(found_results[multi_result_episode]) > 0:
+                            not_needed_eps.append(multi_result_episode)
+                        else:
+                            needed_eps.append(multi_result_episode)
+
+                    sickrage.app.log.debug("Single-ep check result is neededEps: " + str(needed_eps) + ", notNeededEps: " + str(not_needed_eps))
+                    if not needed_eps:
+                        sickrage.app.log.debug("All of these episodes were covered by single episode results, ignoring this multi-episode result")
+                        continue
+
+                    # check if these eps are already covered by another multi-result
+                    multi_needed_eps = []
+                    multi_not_needed_eps = []
+                    for multi_result_episode in multi_result.episodes:
+                        if multi_result_episode in multi_results:
+                            multi_not_needed_eps.append(multi_result_episode)
+                        else:
+                            multi_needed_eps.append(multi_result_episode)
+
+                    sickrage.app.log.debug(
+                        "Multi-ep check result is multiNeededEps: " + str(
+                            multi_needed_eps) + ", multiNotNeededEps: " + str(
+                            multi_not_needed_eps)
+                    )
+
+                    if not multi_needed_eps:
+                        sickrage.app.log.debug("All of these episodes were covered by another multi-episode nzbs, ignoring this multi-ep result")
+                        continue
+
+                    # don't bother with the single result if we're going to get it with a multi result
+                    for multi_result_episode in multi_result.episodes:
+                        multi_results[multi_result_episode] = multi_result
+
+                        if multi_result_episode in found_results:
+                            sickrage.app.log.debug("A needed multi-episode result overlaps with a single-episode result for ep #" + str(
+                                multi_result_episode) + ", removing the single-episode results from the list")
+                            del found_results[multi_result_episode]
+
+            # of all the single ep results narrow it down to the best one
+            final_results += list(dict.fromkeys(multi_results.values()))
+            for curEp, curResults in found_results.items():
+                if curEp in (MULTI_EP_RESULT, SEASON_RESULT):
+                    continue
 
-        # narrow results by comparing quality
-        if len(final_results) > 1:
-            final_results = list(set([a for a, b in itertools.product(final_results, repeat=len(final_results)) if a.quality >= b.quality]))
+                if not len(curResults) > 0:
+                    continue
 
-        # narrow results by comparing seeders for torrent results
-        if len(final_results) > 1:
-            final_results = list(set(
-                [a for a, b in itertools.product(final_results, repeat=len(final_results)) if a.provider.provider_type == NZBProvider.provider_type or a.seeders > b.seeders]))
+                # if all results were rejected move on to the next episode
+                best_result = pick_best_result(curResults)
+                if not best_result:
+                    continue
 
-        # check that we got all the episodes we wanted first before doing a match and snatch
-        for result in final_results.copy():
-            if all([episode in result.episodes and is_final_result(result)]):
-                return result
+                # add result
+                final_results.append(best_result)
+
+            # narrow results by comparing quality and seeders for torrent results
+            if len(final_results) > 1:
+                final_results = narrow_results(final_results)
+
+            # check that we got all the episodes we wanted first before doing a match and snatch
+            for result in final_results.copy():
+                if all([episode in result.episodes and is_final_result(result)]):
+                    return result
+    finally:
+        if timed_out:
+            sickrage.app.log.warning("Timed out while searching " + ", ".join(timed_out) + ", skipping")
+
+        # stop any provider searches that have not started yet, running ones finish their current request and then stop
+        stop_searching.set()
+        for __, future in futures:
+            future.cancel()
 
     if len(final_results) == 1:
         return next(iter(final_results))
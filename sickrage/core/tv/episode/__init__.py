@@ -47,9 +47,14 @@ from sickrage.subtitles import Subtitles
 
 
 class TVEpisode(object):
-    def __init__(self, series_id, series_provider_id, season, episode, location=''):
+    def __init__(self, series_id, series_provider_id, season, episode, location='', data=None):
         self.lock = threading.Lock()
 
+        # row already fetched by the show's bulk episode load
+        if data is not None:
+            self._data_local = data
+            return
+
         with sickrage.app.main_db.session() as session:
             try:
                 query = session.query(MainDB.TVEpisode).filter_by(series_id=series_id, series_provider_id=series_provider_id, season=season,
@@ -387,6 +392,12 @@ class TVEpisode(object):
             sickrage.app.log.error('Could not parse episode status into a valid overview status: {}'.format(self.status))
 
     def save(self):
+        show = self.show
+
+        # written later by the show's batch_save block
+        if show and show.queue_episode_save(self):
+            return
+
         with self.lock, sickrage.app.main_db.session() as session:
             try:
                 query = session.query(MainDB.TVEpisode).filter_by(series_id=self.series_id,
@@ -399,6 +410,9 @@ class TVEpisode(object):
             finally:
                 session.commit()
 
+        if show:
+            show.index_episode(self)
+
     def delete(self):
         with self.lock, sickrage.app.main_db.session() as session:
             session.query(MainDB.TVEpisode).filter_by(series_id=self.series_id,
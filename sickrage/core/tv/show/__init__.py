@@ -27,6 +27,8 @@ import shutil
 import stat
 import threading
 import traceback
+from collections import OrderedDict
+from contextlib import contextmanager
 
 import send2trash
 import sqlalchemy
@@ -38,13 +40,15 @@ import sickrage
 from sickrage.core.blackandwhitelist import BlackAndWhiteList
 from sickrage.core.caches.image_cache import ImageCache
 from sickrage.core.common import Quality, Qualities, EpisodeStatus
+from sickrage.core.databases.cache import CacheDB
 from sickrage.core.databases.main import MainDB
 from sickrage.core.databases.main.schemas import TVShowSchema, IMDbInfoSchema, BlacklistSchema, WhitelistSchema
 from sickrage.core.enums import SeriesProviderID
 from sickrage.core.exceptions import ShowNotFoundException, EpisodeNotFoundException, EpisodeDeletedException, MultipleEpisodesInDatabaseException
-from sickrage.core.helpers import list_media_files, is_media_file, try_int, safe_getattr, flatten
+from sickrage.core.helpers import list_media_files, scan_media_files, is_media_file, try_int, safe_getattr, flatten
 from sickrage.core.media.util import series_image, SeriesImageType
 from sickrage.core.tv.episode import TVEpisode
+from sickrage.core.tv.show.helpers import show_name_index
 from sickrage.series_providers.exceptions import SeriesProviderAttributeNotFound, SeriesProviderException
 
 
@@ -59,26 +63,36 @@ class TVShowID(object):
 
 
 class TVShow(object):
-    def __init__(self, series_id, series_provider_id, lang='eng', location=''):
+    def __init__(self, series_id, series_provider_id, lang='eng', location='', data=None):
         self.lock = threading.Lock()
         self._episodes = {}
+        self._episodes_loaded = False
+        self._episodes_by_absolute_number = None
+        self._episode_stats = None
+        self._release_groups = None
+        self._pending_episodes = {}
+
+        # row already fetched by the bulk show load at startup
+        if data is not None:
+            self._data_local = data
+        else:
+            with sickrage.app.main_db.session() as session:
+                try:
+                    query = session.query(MainDB.TVShow).filter_by(series_id=series_id, series_provider_id=series_provider_id).one()
+                    self._data_local = query.as_dict()
+                except orm.exc.NoResultFound:
+                    self._data_local = MainDB.TVShow().as_dict()
+                    self._data_local.update(**{
+                        'series_id': series_id,
+                        'series_provider_id': series_provider_id,
+                        'lang': lang,
+                        'location': location
+                    })
 
-        with sickrage.app.main_db.session() as session:
-            try:
-                query = session.query(MainDB.TVShow).filter_by(series_id=series_id, series_provider_id=series_provider_id).one()
-                self._data_local = query.as_dict()
-            except orm.exc.NoResultFound:
-                self._data_local = MainDB.TVShow().as_dict()
-                self._data_local.update(**{
-                    'series_id': series_id,
-                    'series_provider_id': series_provider_id,
-                    'lang': lang,
-                    'location': location
-                })
-
-                self.load_from_series_provider()
+                    self.load_from_series_provider()
 
         sickrage.app.shows.update({(self.series_id, self.series_provider_id): self})
+        show_name_index.add(self)
 
     @property
     def slug(self):
@@ -112,6 +126,7 @@ class TVShow(object):
     @name.setter
     def name(self, value):
         self._data_local['name'] = value
+        show_name_index.add(self)
 
     @property
     def location(self):
@@ -330,6 +345,7 @@ class TVShow(object):
     @scene_exceptions.setter
     def scene_exceptions(self, value):
         self._data_local['scene_exceptions'] = ','.join(value)
+        show_name_index.add(self)
 
     @property
     def last_update(self):
@@ -385,142 +401,228 @@ class TVShow(object):
 
     @property
     def episodes(self):
-        if not self._episodes:
-            with sickrage.app.main_db.session() as session:
-                for x in session.query(MainDB.TVEpisode).filter_by(series_id=self.series_id, series_provider_id=self.series_provider_id):
-                    self._episodes[x.episode_id] = TVEpisode(series_id=x.series_id, series_provider_id=x.series_provider_id, season=x.season, episode=x.episode)
+        self.load_episodes()
         return list(self._episodes.values())
 
-    @property
-    def imdb_info(self):
+    def load_episodes(self):
+        """
+        Loads all of the show's episodes from the database in a single query and indexes them by (season, episode)
+        """
+
+        if self._episodes_loaded:
+            return
+
+        episodes = {}
         with sickrage.app.main_db.session() as session:
-            return session.query(MainDB.IMDbInfo).filter_by(series_id=self.series_id).one_or_none()
+            for x in session.query(MainDB.TVEpisode).filter_by(series_id=self.series_id, series_provider_id=self.series_provider_id):
+                episodes[(x.season, x.episode)] = TVEpisode(series_id=x.series_id, series_provider_id=x.series_provider_id, season=x.season,
+                                                            episode=x.episode, data=x.as_dict())
 
-    @property
-    def is_anime(self):
-        return int(self.anime) > 0
+        self._episodes = episodes
+        self._episodes_by_absolute_number = None
+        self._episodes_loaded = True
 
     @property
-    def airs_next(self):
-        _airs_next = datetime.date.min
+    def episodes_by_absolute_number(self):
+        """
+        Maps absolute numbers to the (season, episode) keys of the show's episodes, rebuilt after episodes are added, deleted or saved
+        """
 
-        with sickrage.app.main_db.session() as session:
-            query = session.query(
-                MainDB.TVEpisode
-            ).filter_by(
-                series_id=self.series_id, series_provider_id=self.series_provider_id
-            ).filter(
-                MainDB.TVEpisode.season > 0,
-                MainDB.TVEpisode.airdate >= datetime.date.today(),
-                MainDB.TVEpisode.status.in_([EpisodeStatus.UNAIRED, EpisodeStatus.WANTED])
-            ).order_by(
-                MainDB.TVEpisode.airdate
-            ).first()
+        self.load_episodes()
 
-            if query:
-                _airs_next = query.airdate
+        if self._episodes_by_absolute_number is None:
+            episodes_by_absolute_number = {}
+            for key, episode_object in self._episodes.items():
+                episodes_by_absolute_number.setdefault(episode_object.absolute_number, []).append(key)
+            self._episodes_by_absolute_number = episodes_by_absolute_number
 
-        return _airs_next
+        return self._episodes_by_absolute_number
 
-    @property
-    def airs_prev(self):
-        _airs_prev = datetime.date.min
+    def index_episode(self, episode_object):
+        if self._episodes_loaded:
+            self._episodes.setdefault((episode_object.season, episode_object.episode), episode_object)
+        self._episodes_by_absolute_number = None
+        self.reset_episode_stats()
+
+    @contextmanager
+    def batch_save(self):
+        """
+        Queues the episode saves made by this thread inside the block and writes them in a single transaction on exit
+        """
+
+        thread_id = threading.get_ident()
+        if thread_id in self._pending_episodes:
+            # an outer block on this thread writes them
+            yield
+            return
+
+        self._pending_episodes[thread_id] = OrderedDict()
+
+        try:
+            yield
+        finally:
+            self.save_episodes(self._pending_episodes.pop(thread_id).values())
+
+    def queue_episode_save(self, episode_object):
+        pending = self._pending_episodes.get(threading.get_ident())
+        if pending is None:
+            return False
+
+        pending[(episode_object.season, episode_object.episode)] = episode_object
+        return True
+
+    def save_episodes(self, episode_objects):
+        """
+        Writes episodes in a single transaction, loading their existing rows with one query and letting the session flush
+        the changed columns as batched updates and inserts
+        """
+
+        episode_objects = list(episode_objects)
+        if not episode_objects:
+            return
 
         with sickrage.app.main_db.session() as session:
-            query = session.query(
-                MainDB.TVEpisode
-            ).filter_by(
+            rows = {(x.season, x.episode): x for x in session.query(MainDB.TVEpisode).filter_by(
                 series_id=self.series_id, series_provider_id=self.series_provider_id
             ).filter(
-                MainDB.TVEpisode.season > 0,
-                MainDB.TVEpisode.airdate < datetime.date.today(),
-                MainDB.TVEpisode.status != EpisodeStatus.UNAIRED
-            ).order_by(
-                sqlalchemy.desc(MainDB.TVEpisode.airdate)
-            ).first()
+                MainDB.TVEpisode.season.in_(set(x.season for x in episode_objects))
+            )}
 
-            if query:
-                _airs_prev = query.airdate
+            for episode_object in episode_objects:
+                with episode_object.lock:
+                    try:
+                        rows[(episode_object.season, episode_object.episode)].update(**episode_object._data_local)
+                    except KeyError:
+                        session.add(MainDB.TVEpisode(**episode_object._data_local))
 
-        return _airs_prev
+            session.commit()
+
+        for episode_object in episode_objects:
+            self.index_episode(episode_object)
 
     @property
-    def episodes_unaired(self):
+    def imdb_info(self):
         with sickrage.app.main_db.session() as session:
-            query = session.query(
-                MainDB.TVEpisode.season, MainDB.TVEpisode.status
-            ).filter_by(
-                series_id=self.series_id, series_provider_id=self.series_provider_id
-            ).filter(
-                MainDB.TVEpisode.status == EpisodeStatus.UNAIRED
-            )
+            return session.query(MainDB.IMDbInfo).filter_by(series_id=self.series_id).one_or_none()
 
-            if not sickrage.app.config.gui.display_show_specials:
-                query = query.filter(MainDB.TVEpisode.season > 0)
+    @property
+    def is_anime(self):
+        return int(self.anime) > 0
+
+    @property
+    def episode_stats(self):
+        """
+        Episode counts and air dates grouped by status and regular/special season, cached until an episode is saved or deleted
+        """
 
-        return query.count()
+        if self._episode_stats is None or self._episode_stats[0] != datetime.date.today():
+            self.load_episode_stats([self])
+        return self._episode_stats[1]
 
     @property
-    def episodes_snatched(self):
+    def total_size(self):
+        if self._episode_stats is None or self._episode_stats[0] != datetime.date.today():
+            self.load_episode_stats([self])
+        return self._episode_stats[2]
+
+    @staticmethod
+    def load_episode_stats(shows):
+        """
+        Loads the episode stats and total file size of the given shows, one grouped query each
+        """
+
+        today = datetime.date.today()
+        shows = {(show.series_id, show.series_provider_id): show for show in shows}
+        stats = {key: [] for key in shows}
+        total_sizes = {key: 0 for key in shows}
+
         with sickrage.app.main_db.session() as session:
             query = session.query(
-                MainDB.TVEpisode.season, MainDB.TVEpisode.status
-            ).filter_by(
-                series_id=self.series_id, series_provider_id=self.series_provider_id
-            ).filter(
-                MainDB.TVEpisode.status.in_(flatten([EpisodeStatus.composites(EpisodeStatus.SNATCHED), EpisodeStatus.composites(EpisodeStatus.SNATCHED_BEST),
-                                                     EpisodeStatus.composites(EpisodeStatus.SNATCHED_PROPER)]))
+                MainDB.TVEpisode.series_id,
+                MainDB.TVEpisode.series_provider_id,
+                MainDB.TVEpisode.status,
+                MainDB.TVEpisode.season > 0,
+                sqlalchemy.func.count(),
+                sqlalchemy.func.min(sqlalchemy.case([(MainDB.TVEpisode.airdate >= today, MainDB.TVEpisode.airdate)])),
+                sqlalchemy.func.max(sqlalchemy.case([(MainDB.TVEpisode.airdate < today, MainDB.TVEpisode.airdate)]))
+            ).group_by(
+                MainDB.TVEpisode.series_id,
+                MainDB.TVEpisode.series_provider_id,
+                MainDB.TVEpisode.status,
+                MainDB.TVEpisode.season > 0
             )
 
-            if not sickrage.app.config.gui.display_show_specials:
-                query = query.filter(MainDB.TVEpisode.season > 0)
+            if len(shows) == 1:
+                series_id, series_provider_id = next(iter(shows))
+                query = query.filter_by(series_id=series_id, series_provider_id=series_provider_id)
 
-        return query.count()
+            for series_id, series_provider_id, status, regular, count, next_airdate, prev_airdate in query:
+                if (series_id, series_provider_id) in stats:
+                    stats[(series_id, series_provider_id)].append((status, regular, count, next_airdate, prev_airdate))
 
-    @property
-    def episodes_downloaded(self):
-        with sickrage.app.main_db.session() as session:
+            # multi-episode files are shared by several episodes, count each location once
             query = session.query(
-                MainDB.TVEpisode.season, MainDB.TVEpisode.status
-            ).filter_by(
-                series_id=self.series_id, series_provider_id=self.series_provider_id
+                MainDB.TVEpisode.series_id,
+                MainDB.TVEpisode.series_provider_id,
+                sqlalchemy.func.max(MainDB.TVEpisode.file_size)
             ).filter(
-                MainDB.TVEpisode.status.in_(flatten([EpisodeStatus.composites(EpisodeStatus.DOWNLOADED), EpisodeStatus.composites(EpisodeStatus.ARCHIVED)]))
+                MainDB.TVEpisode.location != ''
+            ).group_by(
+                MainDB.TVEpisode.series_id,
+                MainDB.TVEpisode.series_provider_id,
+                MainDB.TVEpisode.location
             )
 
-            if not sickrage.app.config.gui.display_show_specials:
-                query = query.filter(MainDB.TVEpisode.season > 0)
+            if len(shows) == 1:
+                series_id, series_provider_id = next(iter(shows))
+                query = query.filter_by(series_id=series_id, series_provider_id=series_provider_id)
+
+            for series_id, series_provider_id, file_size in query:
+                if (series_id, series_provider_id) in total_sizes:
+                    total_sizes[(series_id, series_provider_id)] += file_size or 0
+
+        for key, show in shows.items():
+            show._episode_stats = (today, stats[key], total_sizes[key])
 
-        return query.count()
+    def reset_episode_stats(self):
+        self._episode_stats = None
+
+    def count_episodes(self, statuses=None, exclude_statuses=None):
+        return sum(count for status, regular, count, __, __ in self.episode_stats
+                   if (regular or sickrage.app.config.gui.display_show_specials)
+                   and (statuses is None or status in statuses)
+                   and (exclude_statuses is None or status not in exclude_statuses))
 
     @property
-    def episodes_special(self):
-        with sickrage.app.main_db.session() as session:
-            query = session.query(
-                MainDB.TVEpisode.season
-            ).filter_by(
-                series_id=self.series_id, series_provider_id=self.series_provider_id
-            ).filter(
-                MainDB.TVEpisode.season == 0
-            )
+    def airs_next(self):
+        return min([next_airdate for status, regular, __, next_airdate, __ in self.episode_stats
+                    if regular and next_airdate and status in [EpisodeStatus.UNAIRED, EpisodeStatus.WANTED]], default=datetime.date.min)
 
-        return query.count()
+    @property
+    def airs_prev(self):
+        return max([prev_airdate for status, regular, __, __, prev_airdate in self.episode_stats
+                    if regular and prev_airdate and status != EpisodeStatus.UNAIRED], default=datetime.date.min)
 
     @property
-    def episodes_total(self):
-        with sickrage.app.main_db.session() as session:
-            query = session.query(
-                MainDB.TVEpisode.season, MainDB.TVEpisode.status
-            ).filter_by(
-                series_id=self.series_id, series_provider_id=self.series_provider_id
-            ).filter(
-                MainDB.TVEpisode.status != EpisodeStatus.UNAIRED
-            )
+    def episodes_unaired(self):
+        return self.count_episodes(statuses=[EpisodeStatus.UNAIRED])
 
-            if not sickrage.app.config.gui.display_show_specials:
-                query = query.filter(MainDB.TVEpisode.season > 0)
+    @property
+    def episodes_snatched(self):
+        return self.count_episodes(statuses=flatten([EpisodeStatus.composites(EpisodeStatus.SNATCHED), EpisodeStatus.composites(EpisodeStatus.SNATCHED_BEST),
+                                                     EpisodeStatus.composites(EpisodeStatus.SNATCHED_PROPER)]))
 
-        return query.count()
+    @property
+    def episodes_downloaded(self):
+        return self.count_episodes(statuses=flatten([EpisodeStatus.composites(EpisodeStatus.DOWNLOADED), EpisodeStatus.composites(EpisodeStatus.ARCHIVED)]))
+
+    @property
+    def episodes_special(self):
+        return sum(count for __, regular, count, __, __ in self.episode_stats if regular is not None and not regular)
+
+    @property
+    def episodes_total(self):
+        return self.count_episodes(exclude_statuses=[EpisodeStatus.UNAIRED])
 
     @property
     def new_episodes(self):
@@ -554,16 +656,6 @@ class TVShow(object):
 
         return new_episodes
 
-    @property
-    def total_size(self):
-        _total_size = 0
-        _related_episodes = set()
-        for episode_object in self.episodes:
-            [_related_episodes.add(related_episode.episode_id) for related_episode in episode_object.related_episodes]
-            if episode_object.episode_id not in _related_episodes:
-                _total_size += episode_object.file_size
-        return _total_size
-
     @property
     def network_logo_name(self):
         return unidecode(self.network).lower()
@@ -571,7 +663,10 @@ class TVShow(object):
     @property
     def release_groups(self):
         if self.is_anime:
-            return BlackAndWhiteList(self.series_id, self.series_provider_id)
+            release_groups = self._release_groups
+            if not release_groups or (release_groups.series_id, release_groups.series_provider_id) != (self.series_id, self.series_provider_id):
+                self._release_groups = release_groups = BlackAndWhiteList(self.series_id, self.series_provider_id)
+            return release_groups
 
     @property
     def poster(self):
@@ -662,7 +757,10 @@ class TVShow(object):
             session.commit()
 
     def flush_episodes(self):
-        self._episodes.clear()
+        self._episodes = {}
+        self._episodes_loaded = False
+        self._episodes_by_absolute_number = None
+        self.reset_episode_stats()
 
     def load_from_series_provider(self, cache=True):
         sickrage.app.log.debug(str(self.series_id) + ": Loading show info from " + self.series_provider.name)
@@ -705,32 +803,38 @@ class TVShow(object):
 
         # flush episodes from cache so we can reload from database
         self.flush_episodes()
+        episode_count = len(self.episodes)
 
         series_provider_language = self.lang or sickrage.app.config.general.series_provider_default_language
         series_info = self.series_provider.get_series_info(self.series_id, language=series_provider_language, enable_cache=cache)
         if not series_info:
             raise SeriesProviderException
 
-        for season in series_info:
-            scanned_eps[season] = {}
-            for episode in series_info[season]:
-                # need some examples of wtf episode 0 means to decide if we want it or not
-                if episode == 0:
-                    continue
+        with self.batch_save():
+            for season in series_info:
+                scanned_eps[season] = {}
+                for episode in series_info[season]:
+                    # need some examples of wtf episode 0 means to decide if we want it or not
+                    if episode == 0:
+                        continue
 
-                try:
-                    episode_obj = self.get_episode(season, episode)
-                except EpisodeNotFoundException:
-                    continue
-                else:
                     try:
-                        episode_obj.load_from_series_provider(season, episode)
-                        episode_obj.save()
-                    except EpisodeDeletedException:
-                        sickrage.app.log.info("The episode was deleted, skipping the rest of the load")
+                        episode_obj = self.get_episode(season, episode)
+                    except EpisodeNotFoundException:
                         continue
+                    else:
+                        try:
+                            episode_obj.load_from_series_provider(season, episode)
+                            episode_obj.save()
+                        except EpisodeDeletedException:
+                            sickrage.app.log.info("The episode was deleted, skipping the rest of the load")
+                            continue
+
+                    scanned_eps[season][episode] = True
 
-                scanned_eps[season][episode] = True
+        # new episodes may match files the last dir refresh could not place, so the next refresh parses every file
+        if len(self.episodes) > episode_count:
+            self.delete_dir_snapshot()
 
         # Done updating save last update date
         self.last_update = datetime.datetime.now()
@@ -740,38 +844,32 @@ class TVShow(object):
         return scanned_eps
 
     def get_episode(self, season=None, episode=None, absolute_number=None, location=None, no_create=False):
-        try:
-            if season is None and episode is None and absolute_number is not None:
-                with sickrage.app.main_db.session() as session:
-                    query = session.query(MainDB.TVEpisode).filter_by(series_id=self.series_id, series_provider_id=self.series_provider_id,
-                                                                      absolute_number=absolute_number).one()
-                    sickrage.app.log.debug("Found episode by absolute_number %s which is S%02dE%02d" % (absolute_number, query.season, query.episode))
-                    season = query.season
-                    episode = query.episode
-
-            for tv_episode in self.episodes:
-                if tv_episode.season == season and tv_episode.episode == episode:
-                    return tv_episode
-            else:
-                if no_create:
-                    return None
-
-                tv_episode = TVEpisode(series_id=self.series_id,
-                                       series_provider_id=self.series_provider_id,
-                                       season=season,
-                                       episode=episode,
-                                       location=location or '')
-
-                self._episodes[tv_episode.episode_id] = tv_episode
-                return tv_episode
-        except orm.exc.MultipleResultsFound:
-            if absolute_number is not None:
-                sickrage.app.log.debug("Multiple entries for absolute number: " + str(absolute_number) + " in show: " + self.name + " found ")
-            raise MultipleEpisodesInDatabaseException
-        except orm.exc.NoResultFound:
-            if absolute_number is not None:
+        self.load_episodes()
+
+        if season is None and episode is None and absolute_number is not None:
+            keys = self.episodes_by_absolute_number.get(absolute_number, [])
+            if not keys:
                 sickrage.app.log.debug("No entries for absolute number: " + str(absolute_number) + " in show: " + self.name + " found.")
-            raise EpisodeNotFoundException
+                raise EpisodeNotFoundException
+            elif len(keys) > 1:
+                sickrage.app.log.debug("Multiple entries for absolute number: " + str(absolute_number) + " in show: " + self.name + " found ")
+                raise MultipleEpisodesInDatabaseException
+
+            season, episode = keys[0]
+            sickrage.app.log.debug("Found episode by absolute_number %s which is S%02dE%02d" % (absolute_number, season, episode))
+
+        tv_episode = self._episodes.get((season, episode))
+        if tv_episode is not None or no_create:
+            return tv_episode
+
+        tv_episode = TVEpisode(series_id=self.series_id,
+                               series_provider_id=self.series_provider_id,
+                               season=season,
+                               episode=episode,
+                               location=location or '')
+
+        self.index_episode(tv_episode)
+        return tv_episode
 
     def delete_episode(self, season, episode, full=False):
         episode_object = self.get_episode(season, episode, no_create=True)
@@ -793,14 +891,15 @@ class TVShow(object):
 
         # delete episode from show episode cache
         sickrage.app.log.debug("Deleting %s S%02dE%02d from the shows episode cache" % (self.name, episode_object.season or 0, episode_object.episode or 0))
-        try:
-            del self._episodes[episode_object.episode_id]
-        except KeyError:
-            pass
+        self._episodes.pop((episode_object.season, episode_object.episode), None)
+        self._episodes_by_absolute_number = None
+        for pending in list(self._pending_episodes.values()):
+            pending.pop((episode_object.season, episode_object.episode), None)
 
         # delete episode from database
         sickrage.app.log.debug("Deleting %s S%02dE%02d from the DB" % (self.name, episode_object.season or 0, episode_object.episode or 0))
         episode_object.delete()
+        self.reset_episode_stats()
 
         raise EpisodeDeletedException()
 
@@ -861,17 +960,21 @@ class TVShow(object):
             episode_obj.update_video_metadata()
 
     # find all media files in the show folder and create episodes for as many as possible
-    def load_episodes_from_dir(self):
+    def load_episodes_from_dir(self, media_files=None):
         from sickrage.core.nameparser import NameParser, InvalidNameException, InvalidShowException
 
         if not os.path.isdir(self.location):
             sickrage.app.log.debug(str(self.series_id) + ": Show dir doesn't exist, not loading episodes from disk")
             return
 
-        sickrage.app.log.debug(str(self.series_id) + ": Loading all episodes from the show directory " + self.location)
+        if media_files is None:
+            sickrage.app.log.debug(str(self.series_id) + ": Loading all episodes from the show directory " + self.location)
 
-        # get file list
-        media_files = list_media_files(self.location)
+            # get file list
+            media_files = list_media_files(self.location)
+        else:
+            sickrage.app.log.debug(str(self.series_id) + ": Loading {} new or changed episodes from the show directory {}".format(len(media_files),
+                                                                                                                                self.location))
 
         # create TVEpisodes from each media file (if possible)
         for mediaFile in media_files:
@@ -1113,6 +1216,9 @@ class TVShow(object):
             session.delete(series)
             session.commit()
 
+        # remove dir snapshot
+        self.delete_dir_snapshot()
+
         # remove episodes from show episode cache
         self.flush_episodes()
 
@@ -1122,6 +1228,8 @@ class TVShow(object):
         except KeyError:
             pass
 
+        show_name_index.remove(self)
+
         # clear the cache
         image_cache_dir = os.path.join(sickrage.app.cache_dir, 'images')
         for cache_file in glob.glob(os.path.join(image_cache_dir, str(self.series_id) + '.*')):
@@ -1170,67 +1278,109 @@ class TVShow(object):
         sickrage.app.log.debug("Checking & filling cache for show " + self.name)
         ImageCache().fill_cache(self, force)
 
+    def load_dir_snapshot(self):
+        with sickrage.app.cache_db.session() as session:
+            return {x.path: (x.is_dir, x.size, x.mtime, x.inode) for x in
+                    session.query(CacheDB.ShowDirSnapshot).filter_by(series_id=self.series_id, series_provider_id=self.series_provider_id)}
+
+    def save_dir_snapshot(self, snapshot):
+        with sickrage.app.cache_db.session() as session:
+            unchanged = set()
+
+            for dbData in session.query(CacheDB.ShowDirSnapshot).filter_by(series_id=self.series_id, series_provider_id=self.series_provider_id):
+                if snapshot.get(dbData.path) == (dbData.is_dir, dbData.size, dbData.mtime, dbData.inode):
+                    unchanged.add(dbData.path)
+                else:
+                    session.delete(dbData)
+
+            session.add_all([CacheDB.ShowDirSnapshot(series_id=self.series_id,
+                                                     series_provider_id=self.series_provider_id,
+                                                     path=path,
+                                                     is_dir=is_dir,
+                                                     size=size,
+                                                     mtime=mtime,
+                                                     inode=inode) for path, (is_dir, size, mtime, inode) in snapshot.items() if path not in unchanged])
+
+            session.commit()
+
+    def delete_dir_snapshot(self):
+        with sickrage.app.cache_db.session() as session:
+            session.query(CacheDB.ShowDirSnapshot).filter_by(series_id=self.series_id, series_provider_id=self.series_provider_id).delete()
+            session.commit()
+
     def refresh_dir(self):
         # make sure the show dir is where we think it is unless dirs are created on the fly
         if not os.path.isdir(self.location) and not sickrage.app.config.general.create_missing_show_dirs:
             return False
 
-        # load from dir
+        # compare the show dir against its snapshot from the last refresh
+        snapshot = self.load_dir_snapshot()
+        new_snapshot, changed_files = scan_media_files(self.location, snapshot)
+        media_files = set(k for k, v in new_snapshot.items() if not v[0])
+
+        # load from dir, files that did not change since the last refresh are not parsed again
         try:
-            self.load_episodes_from_dir()
+            self.load_episodes_from_dir(sorted(changed_files))
         except Exception as e:
             sickrage.app.log.debug("Error searching dir for episodes: {}".format(e))
             sickrage.app.log.debug(traceback.format_exc())
+        else:
+            if new_snapshot != snapshot:
+                self.save_dir_snapshot(new_snapshot)
 
         # run through all locations from DB, check that they exist
         sickrage.app.log.debug(str(self.series_id) + ": Loading all episodes with a location from the database")
 
-        for curEp in self.episodes:
-            if curEp.location == '':
-                continue
+        with self.batch_save():
+            for curEp in self.episodes:
+                if curEp.location == '':
+                    continue
 
-            curLoc = os.path.normpath(curEp.location)
-            season = int(curEp.season)
-            episode = int(curEp.episode)
-
-            # if the path doesn't exist or if it's not in our show dir
-            if not os.path.isfile(curLoc) or not os.path.normpath(curLoc).startswith(os.path.normpath(self.location)):
-                # check if downloaded files still exist, update our data if this has changed
-                if not sickrage.app.config.general.skip_removed_files:
-                    # if it used to have a file associated with it and it doesn't anymore then set it to
-                    # EP_DEFAULT_DELETED_STATUS
-                    if curEp.location and curEp.status in EpisodeStatus.composites(EpisodeStatus.DOWNLOADED):
-                        if sickrage.app.config.general.ep_default_deleted_status == EpisodeStatus.ARCHIVED:
-                            __, oldQuality = Quality.split_composite_status(curEp.status)
-                            new_status = Quality.composite_status(EpisodeStatus.ARCHIVED, oldQuality)
-                        else:
-                            new_status = sickrage.app.config.general.ep_default_deleted_status
-
-                        sickrage.app.log.debug("%s: Location for S%02dE%02d doesn't exist, "
-                                               "removing it and changing our status to %s" % (self.series_id,
-                                                                                              season or 0, episode or 0,
-                                                                                              new_status.display_name))
-
-                        curEp.status = new_status
-                        curEp.subtitles = ''
-                        curEp.subtitles_searchcount = 0
-                        curEp.subtitles_lastsearch = datetime.datetime.min
-
-                    curEp.location = ''
-                    curEp.hasnfo = False
-                    curEp.hastbn = False
-                    curEp.release_name = ''
-            else:
-                if curEp.status in EpisodeStatus.composites(EpisodeStatus.ARCHIVED):
-                    __, oldQuality = Quality.split_composite_status(curEp.status)
-                    curEp.status = Quality.composite_status(EpisodeStatus.DOWNLOADED, oldQuality)
+                curLoc = os.path.normpath(curEp.location)
+                season = int(curEp.season)
+                episode = int(curEp.episode)
+
+                # if the path doesn't exist or if it's not in our show dir
+                if curLoc not in media_files and (not os.path.isfile(curLoc) or not os.path.normpath(curLoc).startswith(os.path.normpath(self.location))):
+                    # check if downloaded files still exist, update our data if this has changed
+                    if not sickrage.app.config.general.skip_removed_files:
+                        # if it used to have a file associated with it and it doesn't anymore then set it to
+                        # EP_DEFAULT_DELETED_STATUS
+                        if curEp.location and curEp.status in EpisodeStatus.composites(EpisodeStatus.DOWNLOADED):
+                            if sickrage.app.config.general.ep_default_deleted_status == EpisodeStatus.ARCHIVED:
+                                __, oldQuality = Quality.split_composite_status(curEp.status)
+                                new_status = Quality.composite_status(EpisodeStatus.ARCHIVED, oldQuality)
+                            else:
+                                new_status = sickrage.app.config.general.ep_default_deleted_status
+
+                            sickrage.app.log.debug("%s: Location for S%02dE%02d doesn't exist, "
+                                                   "removing it and changing our status to %s" % (self.series_id,
+                                                                                                  season or 0, episode or 0,
+                                                                                                  new_status.display_name))
+
+                            curEp.status = new_status
+                            curEp.subtitles = ''
+                            curEp.subtitles_searchcount = 0
+                            curEp.subtitles_lastsearch = datetime.datetime.min
+
+                        curEp.location = ''
+                        curEp.hasnfo = False
+                        curEp.hastbn = False
+                        curEp.release_name = ''
+
+                        # save episode to database
+                        curEp.save()
+                else:
+                    if curEp.status in EpisodeStatus.composites(EpisodeStatus.ARCHIVED):
+                        __, oldQuality = Quality.split_composite_status(curEp.status)
+                        curEp.status = Quality.composite_status(EpisodeStatus.DOWNLOADED, oldQuality)
 
-                # the file exists, set its modify file stamp
-                if sickrage.app.config.general.airdate_episodes:
-                    curEp.airdate_modify_stamp()
+                        # save episode to database
+                        curEp.save()
 
-            # save episode to database
-            curEp.save()
+                    # the file exists, set its modify file stamp
+                    if sickrage.app.config.general.airdate_episodes:
+                        curEp.airdate_modify_stamp()
 
     def download_subtitles(self):
         if not os.path.isdir(self.location):
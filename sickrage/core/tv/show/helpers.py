@@ -19,10 +19,80 @@
 #  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
 # ##############################################################################
 
+import threading
+
 import sickrage
 from sickrage.core.enums import SeriesProviderID
 
 
+class ShowNameIndex(object):
+    """
+    Maps normalized show names and scene exceptions to loaded shows, kept up to date as shows
+    are added, removed, renamed or have their scene exceptions changed.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.names = {}
+        self.scene_exceptions = {}
+        self.indexed = {}
+
+    @staticmethod
+    def normalize(name):
+        return name.strip().lower() if name else ''
+
+    def add(self, show):
+        key = (show.series_id, show.series_provider_id)
+        names = {self.normalize(show.name)} - {''}
+        scene_exceptions = {self.normalize(x.split('|')[0]) for x in show.scene_exceptions} - {''}
+
+        with self.lock:
+            self._remove(key)
+            self.indexed[key] = (names, scene_exceptions)
+            for name in names:
+                self.names.setdefault(name, []).append(key)
+            for name in scene_exceptions:
+                self.scene_exceptions.setdefault(name, []).append(key)
+
+    def remove(self, show):
+        with self.lock:
+            self._remove((show.series_id, show.series_provider_id))
+
+    def clear(self):
+        with self.lock:
+            self.names.clear()
+            self.scene_exceptions.clear()
+            self.indexed.clear()
+
+    def find_by_name(self, term):
+        return self._find(self.names, term)
+
+    def find_by_scene_exception(self, term):
+        return self._find(self.scene_exceptions, term)
+
+    def _find(self, index, term):
+        with self.lock:
+            keys = list(index.get(self.normalize(term), []))
+
+        for key in keys:
+            show = sickrage.app.shows.get(key)
+            if show:
+                return show
+
+    def _remove(self, key):
+        names, scene_exceptions = self.indexed.pop(key, (set(), set()))
+        for index, index_names in [(self.names, names), (self.scene_exceptions, scene_exceptions)]:
+            for name in index_names:
+                keys = index.get(name, [])
+                if key in keys:
+                    keys.remove(key)
+                if not keys:
+                    index.pop(name, None)
+
+
+show_name_index = ShowNameIndex()
+
+
 def find_show(series_id, series_provider_id=None):
     if not series_id:
         return None
@@ -39,15 +109,11 @@ def find_show_by_slug(slug):
 
 
 def find_show_by_name(term):
-    for show in get_show_list():
-        if term == show.name:
-            return show
+    return show_name_index.find_by_name(term)
 
 
 def find_show_by_scene_exception(term):
-    for show in get_show_list():
-        if term in [x.split('|')[0] for x in show.scene_exceptions]:
-            return show
+    return show_name_index.find_by_scene_exception(term)
 
 
 def find_show_by_location(location):
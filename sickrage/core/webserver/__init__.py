@@ -23,6 +23,8 @@ import os
 import shutil
 import socket
 import ssl
+import threading
+from concurrent.futures.thread import ThreadPoolExecutor
 
 import tornado.autoreload
 import tornado.locale
@@ -123,6 +125,53 @@ class StaticNoCacheFileHandler(StaticFileHandler):
         self.set_header('Cache-Control', 'max-age=0,no-cache,no-store')
 
 
+class WebExecutor(ThreadPoolExecutor):
+    """
+    Bounded thread pool shared by all web and API handlers, tracks queued, active and completed tasks
+    """
+
+    def __init__(self, max_workers=None, thread_name_prefix='WEB-Thread'):
+        super(WebExecutor, self).__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._stats_lock = threading.Lock()
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+
+    def submit(self, fn, *args, **kwargs):
+        with self._stats_lock:
+            self.queued += 1
+
+        try:
+            return super(WebExecutor, self).submit(self._run, fn, *args, **kwargs)
+        except RuntimeError:
+            with self._stats_lock:
+                self.queued -= 1
+            raise
+
+    def _run(self, fn, *args, **kwargs):
+        with self._stats_lock:
+            self.queued -= 1
+            self.active += 1
+
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._stats_lock:
+                self.active -= 1
+                self.completed += 1
+
+    @property
+    def stats(self):
+        with self._stats_lock:
+            return {
+                'max_workers': self._max_workers,
+                'threads': len(self._threads),
+                'queued': self.queued,
+                'active': self.active,
+                'completed': self.completed
+            }
+
+
 class WebServer(object):
     def __init__(self):
         super(WebServer, self).__init__()
@@ -135,10 +184,14 @@ class WebServer(object):
         self.api_v2_root = None
         self.app = None
         self.server = None
+        self.executor = None
 
     def start(self):
         self.started = True
 
+        # shared thread pool for blocking handler work
+        self.executor = WebExecutor(max_workers=max(sickrage.app.config.general.web_max_workers or 0, 1))
+
         # load languages
         tornado.locale.load_gettext_translations(sickrage.LOCALE_DIR, 'messages')
 
@@ -581,3 +634,5 @@ class WebServer(object):
             if self.server:
                 self.server.close_all_connections()
                 self.server.stop()
+            if self.executor:
+                self.executor.shutdown(wait=False)
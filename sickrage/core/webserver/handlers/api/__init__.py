@@ -22,7 +22,6 @@ import functools
 import json
 import traceback
 import types
-from concurrent.futures.thread import ThreadPoolExecutor
 
 import bleach
 import sentry_sdk
@@ -43,7 +42,6 @@ from sickrage.core.helpers import get_internal_ip
 class APIBaseHandler(RequestHandler):
     def __init__(self, application, request, api_version='', **kwargs):
         super(APIBaseHandler, self).__init__(application, request, **kwargs)
-        self.executor = ThreadPoolExecutor(thread_name_prefix=f'API{api_version}-Thread')
 
     def prepare(self):
         super(APIBaseHandler, self).prepare()
@@ -128,7 +126,7 @@ class APIBaseHandler(RequestHandler):
     def run_async(self, method):
         @functools.wraps(method)
         async def wrapper(self, *args, **kwargs):
-            resp = await IOLoop.current().run_in_executor(self.executor, functools.partial(method, *args, **kwargs))
+            resp = await IOLoop.current().run_in_executor(sickrage.app.wserver.executor, functools.partial(method, *args, **kwargs))
             self.finish(resp)
 
         return types.MethodType(wrapper, self)
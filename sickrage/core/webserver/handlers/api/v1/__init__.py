@@ -25,7 +25,6 @@ import os
 import re
 import time
 import traceback
-from concurrent.futures.thread import ThreadPoolExecutor
 from urllib.parse import unquote_plus
 
 from sqlalchemy import orm
@@ -47,6 +46,7 @@ from sickrage.core.media.fanart import FanArt
 from sickrage.core.media.network import Network
 from sickrage.core.media.poster import Poster
 from sickrage.core.queues.search import ManualSearchTask, BacklogSearchTask
+from sickrage.core.tv.show import TVShow
 from sickrage.core.tv.show.coming_episodes import ComingEpisodes, ComingEpsSortBy
 from sickrage.core.tv.show.helpers import find_show, get_show_list
 from sickrage.core.tv.show.history import History
@@ -83,7 +83,6 @@ class ApiV1BaseHandler(RequestHandler):
 
     def __init__(self, application, request, **kwargs):
         super(ApiV1BaseHandler, self).__init__(application, request, **kwargs)
-        self.executor = ThreadPoolExecutor(thread_name_prefix='APIv1-Thread')
 
     async def prepare(self, *args, **kwargs):
         # set the output callback
@@ -132,7 +131,7 @@ class ApiV1BaseHandler(RequestHandler):
             if len(value) == 1:
                 kwargs[arg] = value[0]
 
-        return await IOLoop.current().run_in_executor(self.executor, functools.partial(method, **kwargs))
+        return await IOLoop.current().run_in_executor(sickrage.app.wserver.executor, functools.partial(method, **kwargs))
 
     def _out_as_image(self, _dict):
         self.set_header('Content-Type', _dict['image'].type)
@@ -848,32 +847,33 @@ class CMD_EpisodeSetStatus(ApiV1Handler):
         start_backlog = False
         wanted = []
 
-        for epObj in ep_list:
-            if self.status == EpisodeStatus.WANTED:
-                # figure out what episodes are wanted so we can backlog them
-                wanted += [(epObj.season, epObj.episode)]
-
-            # don't let them mess up UNAIRED episodes
-            if epObj.status == EpisodeStatus.UNAIRED:
-                if self.e is not None:
-                    ep_results.append(_epResult(RESULT_FAILURE, epObj, "Refusing to change status because it is UNAIRED"))
+        with show_obj.batch_save():
+            for epObj in ep_list:
+                if self.status == EpisodeStatus.WANTED:
+                    # figure out what episodes are wanted so we can backlog them
+                    wanted += [(epObj.season, epObj.episode)]
+
+                # don't let them mess up UNAIRED episodes
+                if epObj.status == EpisodeStatus.UNAIRED:
+                    if self.e is not None:
+                        ep_results.append(_epResult(RESULT_FAILURE, epObj, "Refusing to change status because it is UNAIRED"))
+                        failure = True
+                    continue
+
+                # allow the user to force setting the status for an already downloaded episode
+                if epObj.status in flatten(
+                        [EpisodeStatus.composites(EpisodeStatus.DOWNLOADED), EpisodeStatus.composites(EpisodeStatus.ARCHIVED)]) and not self.force:
+                    ep_results.append(_epResult(RESULT_FAILURE, epObj, "Refusing to change status because it is already marked as DOWNLOADED"))
                     failure = True
-                continue
-
-            # allow the user to force setting the status for an already downloaded episode
-            if epObj.status in flatten(
-                    [EpisodeStatus.composites(EpisodeStatus.DOWNLOADED), EpisodeStatus.composites(EpisodeStatus.ARCHIVED)]) and not self.force:
-                ep_results.append(_epResult(RESULT_FAILURE, epObj, "Refusing to change status because it is already marked as DOWNLOADED"))
-                failure = True
-                continue
+                    continue
 
-            epObj.status = self.status
-            epObj.save()
+                epObj.status = self.status
+                epObj.save()
 
-            if self.status == EpisodeStatus.WANTED:
-                start_backlog = True
+                if self.status == EpisodeStatus.WANTED:
+                    start_backlog = True
 
-            ep_results.append(_epResult(RESULT_SUCCESS, epObj))
+                ep_results.append(_epResult(RESULT_SUCCESS, epObj))
 
         extra_msg = ""
         if start_backlog:
@@ -2592,6 +2592,9 @@ class CMD_Shows(ApiV1Handler):
     def run(self):
         """ Get all shows in SiCKRAGE """
         shows = {}
+
+        TVShow.load_episode_stats(get_show_list())
+
         for curShow in get_show_list():
             if self.paused is not None and bool(self.paused) != bool(curShow.paused):
                 continue
@@ -2651,6 +2654,8 @@ class CMD_ShowsStats(ApiV1Handler):
             'total_size': 0
         }
 
+        TVShow.load_episode_stats(get_show_list())
+
         for show in get_show_list():
             if sickrage.app.show_queue.is_being_added(show.series_id) or sickrage.app.show_queue.is_being_removed(show.series_id):
                 continue
@@ -34,6 +34,7 @@ from sickrage.core.helpers.anidb import short_group_names
 from sickrage.core.media.util import series_image, SeriesImageType
 from sickrage.core.queues.search import ManualSearchTask
 from sickrage.core.tv.episode.helpers import find_episode
+from sickrage.core.tv.show import TVShow
 from sickrage.core.tv.show.helpers import get_show_list, find_show, find_show_by_slug
 from sickrage.core.webserver.handlers.api.v2 import ApiV2BaseHandler
 from sickrage.core.websocket import WebSocketMessage
@@ -81,6 +82,8 @@ class ApiV2SeriesHandler(ApiV2BaseHandler):
         if not series_slug:
             all_series = []
 
+            TVShow.load_episode_stats(get_show_list())
+
             for show in get_show_list():
                 if sickrage.app.show_queue.is_being_removed(show.series_id):
                     continue
@@ -22,7 +22,6 @@ import functools
 import time
 import traceback
 import types
-from concurrent.futures.thread import ThreadPoolExecutor
 from typing import Optional, Awaitable
 from urllib.parse import urlparse, urljoin
 
@@ -43,8 +42,6 @@ class BaseHandler(RequestHandler):
     def __init__(self, application, request, **kwargs):
         super(BaseHandler, self).__init__(application, request, **kwargs)
 
-        self.executor = ThreadPoolExecutor(thread_name_prefix='WEB-Thread')
-
         self.startTime = time.time()
 
     def data_received(self, chunk: bytes) -> Optional[Awaitable[None]]:
@@ -192,7 +189,7 @@ class BaseHandler(RequestHandler):
     def run_async(self, method):
         @functools.wraps(method)
         async def wrapper(self, *args, **kwargs):
-            resp = await IOLoop.current().run_in_executor(self.executor, functools.partial(method, *args, **kwargs))
+            resp = await IOLoop.current().run_in_executor(sickrage.app.wserver.executor, functools.partial(method, *args, **kwargs))
             self.finish(resp)
 
         return types.MethodType(wrapper, self)
@@ -141,6 +141,7 @@ class SaveGeneralHandler(BaseHandler):
         date_preset = self.get_argument('date_preset', None)
         time_preset = self.get_argument('time_preset', None)
         series_provider_timeout = self.get_argument('series_provider_timeout', None)
+        series_provider_cache_ttl = self.get_argument('series_provider_cache_ttl', None)
         download_url = self.get_argument('download_url', None)
         theme_name = self.get_argument('theme_name', None)
         default_page = self.get_argument('default_page', None)
@@ -152,6 +153,15 @@ class SaveGeneralHandler(BaseHandler):
         enable_upnp = self.get_argument('enable_upnp', None)
         strip_special_file_bits = self.get_argument('strip_special_file_bits', None)
         max_queue_workers = self.get_argument('max_queue_workers', None)
+        name_parser_throttle = self.get_argument('name_parser_throttle', None)
+        name_parser_throttle_rate = self.get_argument('name_parser_throttle_rate', None)
+        name_parser_cache_size = self.get_argument('name_parser_cache_size', None)
+        name_parser_cache_ttl = self.get_argument('name_parser_cache_ttl', None)
+        web_max_workers = self.get_argument('web_max_workers', None)
+        web_session_pool_connections = self.get_argument('web_session_pool_connections', None)
+        web_session_pool_maxsize = self.get_argument('web_session_pool_maxsize', None)
+        web_session_timeout = self.get_argument('web_session_timeout', None)
+        web_session_cache_size = self.get_argument('web_session_cache_size', None)
         web_root = self.get_argument('web_root', '')
         ip_whitelist_localhost_enabled = self.get_argument('ip_whitelist_localhost_enabled', None)
         ip_whitelist_enabled = self.get_argument('ip_whitelist_enabled', None)
@@ -246,6 +256,8 @@ class SaveGeneralHandler(BaseHandler):
         if series_provider_timeout:
             sickrage.app.config.general.series_provider_timeout = try_int(series_provider_timeout)
 
+        sickrage.app.config.general.series_provider_cache_ttl = try_int(series_provider_cache_ttl, 24)
+
         if time_preset:
             sickrage.app.config.gui.time_preset_w_seconds = time_preset
             sickrage.app.config.gui.time_preset = sickrage.app.config.gui.time_preset_w_seconds.replace(":%S", "")
@@ -270,6 +282,16 @@ class SaveGeneralHandler(BaseHandler):
 
         sickrage.app.config.general.max_queue_workers = try_int(max_queue_workers)
 
+        sickrage.app.config.general.name_parser_throttle = checkbox_to_value(name_parser_throttle)
+        sickrage.app.config.general.name_parser_throttle_rate = try_int(name_parser_throttle_rate, 50)
+        sickrage.app.config.general.name_parser_cache_size = try_int(name_parser_cache_size, 1000)
+        sickrage.app.config.general.name_parser_cache_ttl = try_int(name_parser_cache_ttl)
+        sickrage.app.config.general.web_max_workers = try_int(web_max_workers, 10)
+        sickrage.app.config.general.web_session_pool_connections = try_int(web_session_pool_connections, 10)
+        sickrage.app.config.general.web_session_pool_maxsize = try_int(web_session_pool_maxsize, 10)
+        sickrage.app.config.general.web_session_timeout = try_int(web_session_timeout, 15)
+        sickrage.app.config.general.web_session_cache_size = try_int(web_session_cache_size, 50)
+
         sickrage.app.config.save()
 
         if auth_method_changed:
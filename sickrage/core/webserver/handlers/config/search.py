@@ -81,6 +81,8 @@ class SaveSearchHandler(BaseHandler):
         allow_high_priority = self.get_argument('allow_high_priority', None)
         sab_forced = self.get_argument('sab_forced', None)
         randomize_providers = self.get_argument('randomize_providers', None)
+        search_providers_max_workers = self.get_argument('search_providers_max_workers', None)
+        search_providers_timeout = self.get_argument('search_providers_timeout', None)
         use_failed_snatcher = self.get_argument('use_failed_snatcher', None)
         failed_snatch_age = self.get_argument('failed_snatch_age', None)
         torrent_dir = self.get_argument('torrent_dir', None)
@@ -126,6 +128,8 @@ class SaveSearchHandler(BaseHandler):
         sickrage.app.config.general.require_words = require_words if require_words else ""
         sickrage.app.config.general.ignored_subs_list = ignored_subs_list if ignored_subs_list else ""
         sickrage.app.config.general.randomize_providers = checkbox_to_value(randomize_providers)
+        sickrage.app.config.general.search_providers_max_workers = try_int(search_providers_max_workers, 5)
+        sickrage.app.config.general.search_providers_timeout = try_int(search_providers_timeout, 180)
         sickrage.app.config.general.enable_rss_cache = checkbox_to_value(enable_rss_cache)
         sickrage.app.config.general.torrent_file_to_magnet = checkbox_to_value(torrent_file_to_magnet)
         sickrage.app.config.general.torrent_magnet_to_file = checkbox_to_value(torrent_magnet_to_file)
@@ -59,6 +59,7 @@ from sickrage.core.scene_numbering import (
     get_scene_numbering
 )
 from sickrage.core.traktapi import TraktAPI
+from sickrage.core.tv.show import TVShow
 from sickrage.core.tv.show.helpers import find_show, get_show_list
 from sickrage.core.webserver.handlers.base import BaseHandler
 from sickrage.subtitles import Subtitles
@@ -72,6 +73,8 @@ class HomeHandler(BaseHandler):
         if not len(show_list):
             return self.redirect('/home/addShows/')
 
+        TVShow.load_episode_stats(show_list)
+
         show_lists = OrderedDict({
             'Shows': [x for x in show_list if x.anime is False],
             'Anime': [x for x in show_list if x.anime is True]
@@ -101,6 +104,8 @@ class HomeHandler(BaseHandler):
             'total_size': 0
         }
 
+        TVShow.load_episode_stats(get_show_list())
+
         for show in get_show_list():
             if sickrage.app.show_queue.is_being_added(show.series_id) or sickrage.app.show_queue.is_being_removed(show.series_id):
                 show_stat[show.series_id] = {
@@ -58,57 +58,58 @@ def set_episode_status(series_id, eps, status, direct=None):
     trakt_data = []
 
     if eps:
-        for curEp in eps.split('|'):
-            if not curEp:
-                sickrage.app.log.debug("curEp was empty when trying to setStatus")
+        with show_obj.batch_save():
+            for curEp in eps.split('|'):
+                if not curEp:
+                    sickrage.app.log.debug("curEp was empty when trying to setStatus")
 
-            sickrage.app.log.debug("Attempting to set status on episode " + curEp + " to " + status.display_name)
+                sickrage.app.log.debug("Attempting to set status on episode " + curEp + " to " + status.display_name)
 
-            ep_info = curEp.split('x')
+                ep_info = curEp.split('x')
 
-            if not all(ep_info):
-                sickrage.app.log.debug("Something went wrong when trying to setStatus, epInfo[0]: %s, epInfo[1]: %s" % (ep_info[0], ep_info[1]))
-                continue
+                if not all(ep_info):
+                    sickrage.app.log.debug("Something went wrong when trying to setStatus, epInfo[0]: %s, epInfo[1]: %s" % (ep_info[0], ep_info[1]))
+                    continue
 
-            try:
-                episode_object = show_obj.get_episode(int(ep_info[0]), int(ep_info[1]))
-            except EpisodeNotFoundException as e:
-                return False, _("Episode couldn't be retrieved")
+                try:
+                    episode_object = show_obj.get_episode(int(ep_info[0]), int(ep_info[1]))
+                except EpisodeNotFoundException as e:
+                    return False, _("Episode couldn't be retrieved")
 
-            if status in [EpisodeStatus.WANTED, EpisodeStatus.FAILED]:
-                # figure out what episodes are wanted so we can backlog them
-                wanted += [(episode_object.season, episode_object.episode)]
+                if status in [EpisodeStatus.WANTED, EpisodeStatus.FAILED]:
+                    # figure out what episodes are wanted so we can backlog them
+                    wanted += [(episode_object.season, episode_object.episode)]
 
-            # don't let them mess up UNAIRED episodes
-            if episode_object.status == EpisodeStatus.UNAIRED:
-                sickrage.app.log.warning("Refusing to change status of " + curEp + " because it is UNAIRED")
-                continue
+                # don't let them mess up UNAIRED episodes
+                if episode_object.status == EpisodeStatus.UNAIRED:
+                    sickrage.app.log.warning("Refusing to change status of " + curEp + " because it is UNAIRED")
+                    continue
 
-            if status in EpisodeStatus.composites(EpisodeStatus.DOWNLOADED) and episode_object.status not in flatten(
-                    [EpisodeStatus.composites(EpisodeStatus.SNATCHED), EpisodeStatus.composites(EpisodeStatus.SNATCHED_PROPER),
-                     EpisodeStatus.composites(EpisodeStatus.SNATCHED_BEST), EpisodeStatus.composites(EpisodeStatus.DOWNLOADED),
-                     EpisodeStatus.IGNORED]) and not os.path.isfile(episode_object.location):
-                sickrage.app.log.warning("Refusing to change status of " + curEp + " to DOWNLOADED because it's not SNATCHED/DOWNLOADED")
-                continue
+                if status in EpisodeStatus.composites(EpisodeStatus.DOWNLOADED) and episode_object.status not in flatten(
+                        [EpisodeStatus.composites(EpisodeStatus.SNATCHED), EpisodeStatus.composites(EpisodeStatus.SNATCHED_PROPER),
+                         EpisodeStatus.composites(EpisodeStatus.SNATCHED_BEST), EpisodeStatus.composites(EpisodeStatus.DOWNLOADED),
+                         EpisodeStatus.IGNORED]) and not os.path.isfile(episode_object.location):
+                    sickrage.app.log.warning("Refusing to change status of " + curEp + " to DOWNLOADED because it's not SNATCHED/DOWNLOADED")
+                    continue
 
-            if status == EpisodeStatus.FAILED and episode_object.status not in flatten([
-                EpisodeStatus.composites(EpisodeStatus.SNATCHED), EpisodeStatus.composites(EpisodeStatus.SNATCHED_PROPER),
-                EpisodeStatus.composites(EpisodeStatus.SNATCHED_BEST), EpisodeStatus.composites(EpisodeStatus.DOWNLOADED),
-                EpisodeStatus.composites(EpisodeStatus.ARCHIVED)]):
-                sickrage.app.log.warning("Refusing to change status of " + curEp + " to FAILED because it's not SNATCHED/DOWNLOADED")
-                continue
+                if status == EpisodeStatus.FAILED and episode_object.status not in flatten([
+                    EpisodeStatus.composites(EpisodeStatus.SNATCHED), EpisodeStatus.composites(EpisodeStatus.SNATCHED_PROPER),
+                    EpisodeStatus.composites(EpisodeStatus.SNATCHED_BEST), EpisodeStatus.composites(EpisodeStatus.DOWNLOADED),
+                    EpisodeStatus.composites(EpisodeStatus.ARCHIVED)]):
+                    sickrage.app.log.warning("Refusing to change status of " + curEp + " to FAILED because it's not SNATCHED/DOWNLOADED")
+                    continue
 
-            if episode_object.status in flatten([EpisodeStatus.composites(EpisodeStatus.DOWNLOADED),
-                                                 EpisodeStatus.composites(EpisodeStatus.ARCHIVED)]) and status == EpisodeStatus.WANTED:
-                sickrage.app.log.info("Removing release_name for episode as you want to set a downloaded "
-                                      "episode back to wanted, so obviously you want it replaced")
-                episode_object.release_name = ""
+                if episode_object.status in flatten([EpisodeStatus.composites(EpisodeStatus.DOWNLOADED),
+                                                     EpisodeStatus.composites(EpisodeStatus.ARCHIVED)]) and status == EpisodeStatus.WANTED:
+                    sickrage.app.log.info("Removing release_name for episode as you want to set a downloaded "
+                                          "episode back to wanted, so obviously you want it replaced")
+                    episode_object.release_name = ""
 
-            episode_object.status = status
+                episode_object.status = status
 
-            episode_object.save()
+                episode_object.save()
 
-            trakt_data += [(episode_object.season, episode_object.episode)]
+                trakt_data += [(episode_object.season, episode_object.episode)]
 
         data = sickrage.app.notification_providers['trakt'].trakt_episode_data_generate(trakt_data)
         if data and sickrage.app.config.trakt.enable and sickrage.app.config.trakt.sync_watchlist:
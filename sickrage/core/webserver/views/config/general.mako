@@ -251,6 +251,31 @@ c<%inherit file="../layouts/config.mako"/>
                     </div>
                 </div>
 
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Series provider cache')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-database"></span>
+                                </span>
+                            </div>
+                            <input name="series_provider_cache_ttl" id="series_provider_cache_ttl" type="number" min="0"
+                                   value="${sickrage.app.config.general.series_provider_cache_ttl}"
+                                   placeholder="${_('default = 24')}"
+                                   title="hours series info is reused before it is fetched again, 0 disables caching"
+                                   class="form-control"/>
+                            <div class="input-group-append">
+                                <span class="input-group-text">
+                                    hours
+                                </span>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+
                 <div class="form-row form-group">
                     <div class="col-lg-3 col-md-4 col-sm-5">
                         <label class="component-title">${_('Show root directories')}</label>
@@ -1086,6 +1111,174 @@ c<%inherit file="../layouts/config.mako"/>
                     </div>
                 </div>
 
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Name parser throttling')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <label for="name_parser_throttle">
+                            <input type="checkbox" class="toggle color-primary is-material" name="name_parser_throttle"
+                                   id="name_parser_throttle" ${('', 'checked')[bool(sickrage.app.config.general.name_parser_throttle)]}/>
+                            ${_('throttle release name parsing on the web server thread or when it exceeds its CPU budget')}
+                        </label>
+                    </div>
+                </div>
+
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Name parser throttle rate')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-microchip"></span>
+                                </span>
+                            </div>
+                            <input id="name_parser_throttle_rate" name="name_parser_throttle_rate" type="number"
+                                   value="${sickrage.app.config.general.name_parser_throttle_rate}" min="1"
+                                   title="${_('Maximum throttled release names parsed per second')}"
+                                   class="form-control" autocapitalize="off"/>
+                        </div>
+                    </div>
+                </div>
+
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Name parser cache size')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-database"></span>
+                                </span>
+                            </div>
+                            <input id="name_parser_cache_size" name="name_parser_cache_size" type="number"
+                                   value="${sickrage.app.config.general.name_parser_cache_size}" min="0"
+                                   title="${_('Maximum parsed release names kept in memory, 0 disables the cache')}"
+                                   class="form-control" autocapitalize="off"/>
+                        </div>
+                    </div>
+                </div>
+
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Name parser cache TTL')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-clock"></span>
+                                </span>
+                            </div>
+                            <input id="name_parser_cache_ttl" name="name_parser_cache_ttl" type="number"
+                                   value="${sickrage.app.config.general.name_parser_cache_ttl}" min="0"
+                                   title="${_('Seconds a parsed release name stays cached, 0 keeps it until evicted')}"
+                                   class="form-control" autocapitalize="off"/>
+                        </div>
+                    </div>
+                </div>
+
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Web worker threads')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-cogs"></span>
+                                </span>
+                            </div>
+                            <input id="web_max_workers" name="web_max_workers" type="number"
+                                   value="${sickrage.app.config.general.web_max_workers}" min="1"
+                                   title="${_('Maximum threads shared by web and API requests, requires restart')}"
+                                   class="form-control" autocapitalize="off"/>
+                        </div>
+                    </div>
+                </div>
+
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('HTTP connection pools')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-network-wired"></span>
+                                </span>
+                            </div>
+                            <input id="web_session_pool_connections" name="web_session_pool_connections" type="number"
+                                   value="${sickrage.app.config.general.web_session_pool_connections}" min="1"
+                                   title="${_('Number of hosts to keep pooled connections for')}"
+                                   class="form-control" autocapitalize="off"/>
+                        </div>
+                    </div>
+                </div>
+
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('HTTP connections per host')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-network-wired"></span>
+                                </span>
+                            </div>
+                            <input id="web_session_pool_maxsize" name="web_session_pool_maxsize" type="number"
+                                   value="${sickrage.app.config.general.web_session_pool_maxsize}" min="1"
+                                   title="${_('Maximum connections kept alive per host')}"
+                                   class="form-control" autocapitalize="off"/>
+                        </div>
+                    </div>
+                </div>
+
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('HTTP request timeout')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-clock"></span>
+                                </span>
+                            </div>
+                            <input id="web_session_timeout" name="web_session_timeout" type="number"
+                                   value="${sickrage.app.config.general.web_session_timeout}" min="1"
+                                   title="${_('Default seconds to wait for a response from a remote host')}"
+                                   class="form-control" autocapitalize="off"/>
+                        </div>
+                    </div>
+                </div>
+
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('HTTP cache size')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-hdd"></span>
+                                </span>
+                            </div>
+                            <input id="web_session_cache_size" name="web_session_cache_size" type="number"
+                                   value="${sickrage.app.config.general.web_session_cache_size}" min="0"
+                                   title="${_('Megabytes of HTTP responses cached on disk, 0 keeps them in memory only')}"
+                                   class="form-control" autocapitalize="off"/>
+                            <div class="input-group-append">
+                                <span class="input-group-text">MB</span>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+
                 <div class="form-row form-group">
                     <div class="col-lg-3 col-md-4 col-sm-5">
                         <label class="component-title">${_('Anonymous redirect')}</label>
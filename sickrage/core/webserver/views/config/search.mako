@@ -35,6 +35,47 @@
                         </label>
                     </div>
                 </div>
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Concurrent provider searches')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-microchip"></span>
+                                </span>
+                            </div>
+                            <input id="search_providers_max_workers" name="search_providers_max_workers" type="number"
+                                   value="${sickrage.app.config.general.search_providers_max_workers}" min="1"
+                                   title="${_('Maximum providers searched at the same time for a single search')}"
+                                   class="form-control" autocapitalize="off"/>
+                        </div>
+                    </div>
+                </div>
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Provider search timeout')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-clock"></span>
+                                </span>
+                            </div>
+                            <input id="search_providers_timeout" name="search_providers_timeout" type="number"
+                                   value="${sickrage.app.config.general.search_providers_timeout}" min="0"
+                                   title="${_('Seconds a search waits for all of its providers before skipping the ones still running, 0 waits forever')}"
+                                   class="form-control" autocapitalize="off"/>
+                            <div class="input-group-append">
+                                <span class="input-group-text">
+                                    ${_('seconds')}
+                                </span>
+                            </div>
+                        </div>
+                    </div>
+                </div>
                 <div class="form-row form-group">
                     <div class="col-lg-3 col-md-4 col-sm-5">
                         <label class="component-title">${_('Download propers')}</label>
@@ -6,6 +6,7 @@
     from sickrage.core.queues.show import ShowTaskActions
     from sickrage.core.common import dateTimeFormat
     from sickrage.core.helpers import pretty_time_delta
+    from sickrage.core.nameparser import name_parser_cache
 %>
 <%block name="content">
     <%
@@ -170,6 +171,76 @@
         </div>
     </div>
 
+    <div class="row">
+        <div class="col-lg-10 mx-auto">
+            <div class="card mb-3">
+                <div class="card-header">
+                    <h3>${_('Caches')}</h3>
+                </div>
+                <div class="card-body">
+                    <table id="cacheStatusTable" class="table" width="100%">
+                        <thead class="thead-dark">
+                        <tr>
+                            <th>${_('Cache')}</th>
+                            <th>${_('Size')}</th>
+                            <th>${_('Hits')}</th>
+                            <th>${_('Misses')}</th>
+                            <th>${_('Evictions')}</th>
+                            <th>${_('Expirations')}</th>
+                            <th>${_('Hit Ratio')}</th>
+                        </tr>
+                        </thead>
+                        <tbody>
+                            <% stats = name_parser_cache.stats %>
+                            <tr>
+                                <td>${_('Name Parser')}</td>
+                                <td align="center">${stats['size']} / ${stats['max_size']}</td>
+                                <td align="center">${stats['hits']}</td>
+                                <td align="center">${stats['misses']}</td>
+                                <td align="center">${stats['evictions']}</td>
+                                <td align="center">${stats['expirations']}</td>
+                                <td align="center">${'{:.1%}'.format(stats['hit_ratio'])}</td>
+                            </tr>
+                        </tbody>
+                    </table>
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <div class="row">
+        <div class="col-lg-10 mx-auto">
+            <div class="card mb-3">
+                <div class="card-header">
+                    <h3>${_('Web Executor')}</h3>
+                </div>
+                <div class="card-body">
+                    <table id="executorStatusTable" class="table" width="100%">
+                        <thead class="thead-dark">
+                        <tr>
+                            <th>${_('Max Workers')}</th>
+                            <th>${_('Threads')}</th>
+                            <th>${_('Active')}</th>
+                            <th>${_('Queued')}</th>
+                            <th>${_('Completed')}</th>
+                        </tr>
+                        </thead>
+                        <tbody>
+                            <% stats = sickrage.app.wserver.executor.stats %>
+                            <tr>
+                                <td align="center">${stats['max_workers']}</td>
+                                <td align="center">${stats['threads']}</td>
+                                <td align="center">${stats['active']}</td>
+                                <td align="center">${stats['queued']}</td>
+                                <td align="center">${stats['completed']}</td>
+                            </tr>
+                        </tbody>
+                    </table>
+                </div>
+            </div>
+        </div>
+    </div>
+
     <div class="row">
         <div class="col-lg-10 mx-auto">
             <div class="card mb-3">
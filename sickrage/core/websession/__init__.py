@@ -20,7 +20,9 @@
 # ##############################################################################
 import collections
 import errno
+import hashlib
 import os
+import threading
 import traceback
 from time import sleep
 from urllib.parse import urlparse
@@ -28,15 +30,26 @@ from urllib.parse import urlparse
 import certifi
 import requests
 from cachecontrol import CacheControlAdapter
+from cachecontrol.cache import BaseCache, DictCache
 from cloudscraper import CloudScraper
 from fake_useragent import UserAgent, FakeUserAgentError
 from requests import Session
+from requests.adapters import HTTPAdapter
 from requests.utils import dict_from_cookiejar
 from urllib3 import disable_warnings
 
 import sickrage
 
 
+def _general_setting(name, default):
+    """
+    Reads a general config setting, falling back to its default while the config is not loaded yet
+    (search providers build their sessions before Config.load runs)
+    """
+    general = sickrage.app.config.general
+    return getattr(general, name) if general else default
+
+
 def _add_proxies():
     if sickrage.app.config.general.proxy_setting:
         sickrage.app.log.debug("Using global proxy: " + sickrage.app.config.general.proxy_setting)
@@ -45,15 +58,168 @@ def _add_proxies():
         return {"http": address, "https": address}
 
 
+class DiskCache(BaseCache):
+    """
+    Size bounded on-disk response cache for CacheControl, least recently used entries are evicted first
+    """
+
+    def __init__(self, directory, max_size):
+        self.lock = threading.Lock()
+        self.directory = directory
+        self.max_size = max_size
+        self._entries = None
+        self._size = 0
+
+    def _filename(self, key):
+        return hashlib.sha224(key.encode('utf-8')).hexdigest()
+
+    def _load(self):
+        # index existing cache files by last use, oldest first
+        if self._entries is not None:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.endswith('.tmp'):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name, stat.st_size))
+
+        self._entries = collections.OrderedDict((filename, size) for __, filename, size in sorted(files))
+        self._size = sum(self._entries.values())
+
+    def _evict(self):
+        while self._entries and self._size > self.max_size:
+            filename, size = self._entries.popitem(last=False)
+            self._size -= size
+
+            try:
+                os.remove(os.path.join(self.directory, filename))
+            except OSError:
+                pass
+
+    def get(self, key):
+        filename = self._filename(key)
+        path = os.path.join(self.directory, filename)
+
+        with self.lock:
+            self._load()
+            if filename not in self._entries:
+                return None
+
+        try:
+            with open(path, 'rb') as f:
+                value = f.read()
+            os.utime(path)
+        except OSError:
+            with self.lock:
+                self._size -= self._entries.pop(filename, 0)
+            return None
+
+        with self.lock:
+            if filename in self._entries:
+                self._entries.move_to_end(filename)
+
+        return value
+
+    def set(self, key, value, expires=None):
+        if len(value) > self.max_size:
+            return
+
+        filename = self._filename(key)
+        path = os.path.join(self.directory, filename)
+
+        with self.lock:
+            self._load()
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path + '.tmp', 'wb') as f:
+                f.write(value)
+            os.replace(path + '.tmp', path)
+        except OSError as e:
+            sickrage.app.log.debug("Unable to write HTTP cache file {}: {}".format(path, e))
+            return
+
+        with self.lock:
+            self._size += len(value) - self._entries.pop(filename, 0)
+            self._entries[filename] = len(value)
+            self._evict()
+
+    def delete(self, key):
+        filename = self._filename(key)
+
+        with self.lock:
+            self._load()
+            self._size -= self._entries.pop(filename, 0)
+
+        try:
+            os.remove(os.path.join(self.directory, filename))
+        except OSError:
+            pass
+
+
+class WebTransport(object):
+    """
+    Process wide connection pools and response cache shared by all WebSession instances
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.cache = None
+        self._adapters = {}
+        self._pool_settings = None
+
+    def _get_cache(self):
+        cache_size = max(_general_setting('web_session_cache_size', 50) or 0, 0) * 1024 * 1024
+
+        # keep responses on disk when we have somewhere to put them, otherwise only in memory
+        if cache_size and sickrage.app.cache_dir:
+            if isinstance(self.cache, DiskCache):
+                self.cache.max_size = cache_size
+            else:
+                self.cache = DiskCache(os.path.join(sickrage.app.cache_dir, 'http'), cache_size)
+        elif not isinstance(self.cache, DictCache):
+            self.cache = DictCache()
+
+        return self.cache
+
+    def adapter(self, cache=True):
+        pool_settings = (max(_general_setting('web_session_pool_connections', 10) or 0, 1),
+                         max(_general_setting('web_session_pool_maxsize', 10) or 0, 1))
+
+        with self.lock:
+            response_cache = self.cache
+            if response_cache is not self._get_cache():
+                self._adapters.pop(True, None)
+
+            # pool sizes changed, sessions still holding the old adapters keep using them until they go away
+            if pool_settings != self._pool_settings:
+                self._adapters = {}
+                self._pool_settings = pool_settings
+
+            if cache not in self._adapters:
+                pool_connections, pool_maxsize = pool_settings
+                if cache:
+                    self._adapters[cache] = CacheControlAdapter(cache=self.cache, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+                else:
+                    self._adapters[cache] = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+            return self._adapters[cache]
+
+
+web_transport = WebTransport()
+
+
 class WebSession(Session):
     def __init__(self, proxies=None, cache=True, cloudflare=False):
         super(WebSession, self).__init__()
 
-        # setup caching adapter
-        if cache:
-            adapter = CacheControlAdapter()
-            self.mount('http://', adapter)
-            self.mount('https://', adapter)
+        # use shared connection pools, with or without response caching
+        adapter = web_transport.adapter(cache)
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
 
         # add proxies
         self.proxies = proxies
@@ -83,10 +249,16 @@ class WebSession(Session):
 
         return user_agent
 
-    def request(self, method, url, verify=False, random_ua=False, timeout=15, *args, **kwargs):
+    def close(self):
+        # adapters are shared with other sessions, leave their pools open
+        pass
+
+    def request(self, method, url, verify=False, random_ua=False, timeout=None, *args, **kwargs):
         self.headers.update({'Accept-Encoding': 'gzip, deflate',
                              'User-Agent': self._get_user_agent(random_ua)})
 
+        timeout = timeout or _general_setting('web_session_timeout', 15) or 15
+
         # add proxies
         self.proxies = self.proxies or _add_proxies()
 
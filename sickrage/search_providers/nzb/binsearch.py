@@ -91,8 +91,8 @@ class BinSearchCache(TVCache):
 
             for group in ['alt.binaries.hdtv', 'alt.binaries.hdtv.x264', 'alt.binaries.tv', 'alt.binaries.tvseries']:
                 search_params = {'max': 50, 'g': group}
-                for item in self.get_rss_feed(self.provider.urls['rss'], search_params).get('entries', []):
-                    self._parseItem(item)
+                items = self.get_rss_feed(self.provider.urls['rss'], search_params).get('entries', [])
+                self.add_cache_entries(list(filter(None, [self._parseItem(item) for item in items])))
 
         return True
 
@@ -18,17 +18,91 @@
 #  You should have received a copy of the GNU General Public License
 #  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
 # ##############################################################################
+import json
+import time
 from collections import OrderedDict
 
+from sqlalchemy import orm
+
 import sickrage
+from sickrage.core.databases.cache import CacheDB
 from sickrage.series_providers.exceptions import SeriesProviderAttributeNotFound, SeriesProviderEpisodeNotFound, SeriesProviderSeasonNotFound
 
 
 class SeriesProviderShowCache(OrderedDict):
     def __init__(self, *args, **kwargs):
         self.maxsize = 100
+        self.expires = {}
         super(SeriesProviderShowCache, self).__init__(*args, **kwargs)
 
+    @property
+    def ttl(self):
+        return max(sickrage.app.config.general.series_provider_cache_ttl or 0, 0) * 60 * 60
+
+    def get_show(self, sid):
+        """
+        Returns the cached show if it has not expired yet, otherwise None, shows cached without a ttl never expire
+        """
+
+        expires = self.expires.get(sid)
+        if sid in self and (expires is None or expires > time.time()):
+            self.move_to_end(sid)
+            return self[sid]
+
+    def invalidate(self, sid):
+        self.pop(sid, None)
+        self.expires.pop(sid, None)
+
+    def load_series_info(self, provider, sid, language, season_type):
+        """
+        Returns the stored (series_data, episodes_data) api responses for a series if they have not expired yet, otherwise None
+        """
+
+        if not self.ttl:
+            return None
+
+        session = sickrage.app.cache_db.session()
+
+        try:
+            dbData = session.query(CacheDB.SeriesProviderCache).filter_by(provider=provider, series_id=sid, language=language,
+                                                                          season_type=season_type).one()
+        except orm.exc.NoResultFound:
+            return None
+
+        if dbData.expires <= time.time():
+            return None
+
+        try:
+            return json.loads(dbData.series_data), json.loads(dbData.episodes_data), dbData.expires
+        except ValueError:
+            return None
+
+    def save_series_info(self, provider, sid, language, season_type, series_data, episodes_data):
+        """
+        Stores the api responses for a series and returns when they expire, nothing is stored when the ttl is 0
+        """
+
+        if not self.ttl:
+            return None
+
+        expires = int(time.time() + self.ttl)
+
+        session = sickrage.app.cache_db.session()
+
+        try:
+            dbData = session.query(CacheDB.SeriesProviderCache).filter_by(provider=provider, series_id=sid, language=language,
+                                                                          season_type=season_type).one()
+        except orm.exc.NoResultFound:
+            dbData = CacheDB.SeriesProviderCache(provider=provider, series_id=sid, language=language, season_type=season_type)
+            session.add(dbData)
+
+        dbData.series_data = json.dumps(series_data)
+        dbData.episodes_data = json.dumps(episodes_data)
+        dbData.expires = expires
+        session.commit()
+
+        return expires
+
     def add_season_data(self, sid, seas, attrib, value):
         if sid not in self:
             self[sid] = SeriesProviderShow()
@@ -43,6 +117,8 @@ class SeriesProviderShowCache(OrderedDict):
             self[sid][seas] = SeriesProviderSeason()
         if ep not in self[sid][seas]:
             self[sid][seas][ep] = SeriesProviderEpisode()
+        if attrib == 'firstAired':
+            self[sid].index_air_date(self[sid][seas][ep], value)
         self[sid][seas][ep][attrib] = value
 
     def add_show_data(self, sid, key, value):
@@ -54,7 +130,8 @@ class SeriesProviderShowCache(OrderedDict):
     def __setitem__(self, key, value, dict_setitem=dict.__setitem__):
         super(SeriesProviderShowCache, self).__setitem__(key, value)
         while len(self) > self.maxsize:
-            self.pop(list(self.keys())[0], None)
+            oldest, __ = self.popitem(last=False)
+            self.expires.pop(oldest, None)
 
 
 class SeriesProviderShow(dict):
@@ -64,12 +141,26 @@ class SeriesProviderShow(dict):
     def __init__(self, **kwargs):
         super(SeriesProviderShow, self).__init__(**kwargs)
         self.data = {}
+        self.air_dates = {}
 
     def get(self, key, default=None):
         return getattr(self, key, default)
 
+    def index_air_date(self, episode, first_aired):
+        """
+        Files an episode under the date part (YYYY-MM-DD) of its first aired value, replacing any previous entry
+        """
+
+        previous = episode.get('firstAired')
+        if previous is not None:
+            air_date = str(previous)[:10]
+            self.air_dates[air_date] = [x for x in self.air_dates.get(air_date, []) if x is not episode]
+
+        if first_aired is not None:
+            self.air_dates.setdefault(str(first_aired)[:10], []).append(episode)
+
     def aired_on(self, date):
-        ret = self.search(str(date), 'firstAired')
+        ret = list(self.air_dates.get(str(date), []))
         if len(ret) == 0:
             sickrage.app.log.debug("Could not find any episodes on TheTVDB that aired on {}".format(date))
             return None
@@ -91,42 +91,61 @@ class TheTVDB(SeriesProvider):
         Takes a series id, gets the episodes URL and parses the TVDB
         """
 
+        sid = int(sid)
+        season_type = 'dvd' if dvd_order else 'official'
+
+        # forced refresh, drop whatever we have cached for this series
+        if not enable_cache:
+            self.cache.invalidate(sid)
+
         # check if series is in cache
-        if sid in self.cache and enable_cache:
-            search_result = self.cache[sid]
-            if search_result:
-                return search_result
+        search_result = self.cache.get_show(sid)
+        if search_result:
+            return search_result
+
+        # check if series is in persistent cache
+        cached_series_info = self.cache.load_series_info(self.slug, sid, language, season_type) if enable_cache else None
+        if cached_series_info:
+            sickrage.app.log.debug(f"[{sid}]: Loaded series info for {self.name} from cache")
+            series_data, episodes_data, expires = cached_series_info
+            return self._build_series_info(sid, series_data, episodes_data, expires)
 
         # get series data
         sickrage.app.log.debug(f"[{sid}]: Getting series info from {self.name}")
 
-        resp = sickrage.app.api.series_provider.get_series_info(provider=self.slug, series_id=sid, language=language)
-        if not resp:
+        series_data = sickrage.app.api.series_provider.get_series_info(provider=self.slug, series_id=sid, language=language)
+        if not series_data:
             sickrage.app.log.debug(f"[{sid}]: Unable to get series info from {self.name}")
             return None
 
+        # get season and episode data
+        sickrage.app.log.debug(f'[{sid}]: Getting episode data from {self.name}')
+
+        episodes_data = sickrage.app.api.series_provider.get_episodes_info(provider=self.slug, series_id=sid, season_type=season_type, language=language)
+        if not episodes_data:
+            sickrage.app.log.debug(f"[{sid}]: Unable to get episode data from {self.name}")
+            return None
+
+        expires = self.cache.save_series_info(self.slug, sid, language, season_type, series_data, episodes_data)
+
+        return self._build_series_info(sid, series_data, episodes_data, expires)
+
+    def _build_series_info(self, sid, series_data, episodes_data, expires):
+        self.cache.invalidate(sid)
+
         # add season data to cache
-        for season in resp['seasons']:
+        for season in series_data['seasons']:
             season_number = int(float(season.get('seasonNumber')))
 
             for k, v in season.items():
                 self.cache.add_season_data(sid, season_number, k, v)
 
         # add series data to cache
-        [self.cache.add_show_data(sid, k, v) for k, v in resp.items() if k != 'seasons']
-
-        # get season and episode data
-        sickrage.app.log.debug(f'[{sid}]: Getting episode data from {self.name}')
-
-        season_type = 'dvd' if dvd_order else 'official'
-        resp = sickrage.app.api.series_provider.get_episodes_info(provider=self.slug, series_id=sid, season_type=season_type, language=language)
-        if not resp:
-            sickrage.app.log.debug(f"[{sid}]: Unable to get episode data from {self.name}")
-            return None
+        [self.cache.add_show_data(sid, k, v) for k, v in series_data.items() if k != 'seasons']
 
         # add episode data to cache
         episode_incomplete = False
-        for episode in resp:
+        for episode in episodes_data:
             season_number, episode_number = episode.get('seasonNumber'), episode.get('episodeNumber')
             if season_number is None or episode_number is None:
                 episode_incomplete = True
@@ -141,10 +160,9 @@ class TheTVDB(SeriesProvider):
         if episode_incomplete:
             sickrage.app.log.debug(f"{sid}: Series has incomplete season/episode numbers")
 
-        # set last updated
-        # self.cache.add_show_data(sid, 'last_updated', int(time.mktime(datetime.now().timetuple())))
+        self.cache.expires[sid] = expires
 
-        return self.cache[int(sid)]
+        return self.cache[sid]
 
     def image_types(self):
         return {
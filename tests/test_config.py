@@ -25,6 +25,7 @@
 import unittest
 from collections import namedtuple
 
+import sickrage
 import tests
 from sickrage.core.helpers import clean_url
 
@@ -69,6 +70,26 @@ class ConfigTestBasic(tests.SiCKRAGETestCase):
                 print('Test not defined for %s', test_url)
 
 
+class ConfigSaveTests(tests.SiCKRAGETestCase):
+    def test_save_changed_values(self):
+        config = sickrage.app.config
+        config.save()
+
+        config.general.web_port = 8082
+        config.save()
+
+        with config.db.session() as session:
+            self.assertEqual(session.query(config.db.General).one().web_port, 8082)
+            session.query(config.db.General).update({'web_port': 9000})
+            session.commit()
+
+        # unchanged values are not written again
+        config.save()
+
+        with config.db.session() as session:
+            self.assertEqual(session.query(config.db.General).one().web_port, 9000)
+
+
 if __name__ == '__main__':
     print("==================")
     print("STARTING - CONFIG TESTS")
@@ -22,11 +22,16 @@
 
 
 import datetime
+import os
+import shutil
+import tempfile
 import threading
 import unittest
+from unittest import mock
 
 import sickrage
 import tests
+from sickrage.core.databases.cache import CacheDB
 from sickrage.core.databases.main import MainDB
 from sickrage.core.common import EpisodeStatus
 
@@ -95,6 +100,94 @@ class DBBasicTests(tests.SiCKRAGETestDBCase):
             t.join()
 
 
+class DBMaintenanceTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(DBMaintenanceTests, self).setUp()
+        self.data_dir = sickrage.app.data_dir
+        sickrage.app.data_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(sickrage.app.data_dir)
+        sickrage.app.data_dir = self.data_dir
+        super(DBMaintenanceTests, self).tearDown()
+
+    def test_integrity_check_after_unclean_shutdown(self):
+        db = CacheDB(db_type='sqlite',
+                     db_prefix='sickrage',
+                     db_host='localhost',
+                     db_port='3306',
+                     db_username='sickrage',
+                     db_password='sickrage')
+
+        with mock.patch.object(CacheDB, 'integrity_check', return_value=True) as integrity_check:
+            db.setup()
+            db.shutdown()
+            self.assertEqual(integrity_check.call_count, 1)
+
+            # clean shutdown, integrity check is skipped
+            db.setup()
+            self.assertEqual(integrity_check.call_count, 1)
+
+            # no shutdown recorded since the last start
+            db.setup()
+            self.assertEqual(integrity_check.call_count, 2)
+
+        db.shutdown()
+
+    def test_engine_reused(self):
+        db = CacheDB(db_type='sqlite',
+                     db_prefix='sickrage',
+                     db_host='localhost',
+                     db_port='3306',
+                     db_username='sickrage',
+                     db_password='sickrage')
+
+        engine = db.engine
+        self.assertIs(db.engine, engine)
+        self.assertIs(db.session().get_bind(), engine)
+
+        # changing a database setting rebuilds the engine and rebinds the sessions
+        db.db_path = os.path.join(sickrage.app.data_dir, 'other_cache.db')
+        new_engine = db.engine
+        self.assertIsNot(new_engine, engine)
+        self.assertIs(db.engine, new_engine)
+        self.assertEqual(new_engine.url.database, db.db_path)
+        self.assertIs(db.session().get_bind(), new_engine)
+
+        db.session.remove()
+        new_engine.dispose()
+
+    def test_backup_restore(self):
+        db = CacheDB(db_type='sqlite',
+                     db_prefix='sickrage',
+                     db_host='localhost',
+                     db_port='3306',
+                     db_username='sickrage',
+                     db_password='sickrage')
+        db.setup()
+
+        session = db.session()
+        for provider in range(5):
+            session.add(CacheDB.LastSearch(provider='provider{}'.format(provider), time=provider))
+        session.commit()
+
+        backup_file = os.path.join(sickrage.app.data_dir, 'cache_db_backup.pickle')
+        with mock.patch.object(CacheDB, 'backup_chunk_size', 2):
+            db.backup(backup_file)
+
+        session.query(CacheDB.LastSearch).delete()
+        session.commit()
+        db.session.remove()
+
+        db.restore(backup_file)
+
+        session = db.session()
+        self.assertEqual(session.query(CacheDB.LastSearch).count(), 5)
+        self.assertEqual(session.query(CacheDB.LastSearch).filter_by(provider='provider3').one().time, 3)
+
+        db.shutdown()
+
+
 if __name__ == '__main__':
     print("==================")
     print("STARTING - DB TESTS")
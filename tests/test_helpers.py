@@ -22,6 +22,9 @@
 
 
 
+import os
+import shutil
+import tempfile
 import unittest
 
 import tests
@@ -85,6 +88,44 @@ def test_generator(test_strings):
 for name, test_data in test_cases.items():
     setattr(HelpersTests, 'test_%s' % name, test_generator(test_data))
 
+
+class ScanMediaFilesTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(ScanMediaFilesTests, self).setUp()
+        self.show_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.show_dir, 'Season 01'))
+        os.makedirs(os.path.join(self.show_dir, 'Extras'))
+        for filename in ['Season 01/Show.Name.S01E01.mkv', 'Season 01/Show.Name.S01E02.mkv', 'Season 01/Show.Name.S01E01.nfo',
+                         'Extras/Show.Name.Bloopers.mkv']:
+            self.write_file(filename, 'data')
+
+    def tearDown(self):
+        super(ScanMediaFilesTests, self).tearDown()
+        shutil.rmtree(self.show_dir)
+
+    def write_file(self, filename, data):
+        with open(os.path.join(self.show_dir, filename), 'w') as f:
+            f.write(data)
+
+    def test_scan_media_files(self):
+        from sickrage.core.helpers import scan_media_files
+
+        snapshot, changed_files = scan_media_files(self.show_dir)
+        self.assertEqual(sorted(os.path.basename(x) for x in changed_files), ['Show.Name.S01E01.mkv', 'Show.Name.S01E02.mkv'])
+
+        # nothing changed, nothing to parse
+        new_snapshot, changed_files = scan_media_files(self.show_dir, snapshot)
+        self.assertEqual(new_snapshot, snapshot)
+        self.assertEqual(changed_files, [])
+
+        # new and removed files show up in the next scan
+        self.write_file('Season 01/Show.Name.S01E03.mkv', 'data')
+        os.remove(os.path.join(self.show_dir, 'Season 01', 'Show.Name.S01E01.mkv'))
+
+        new_snapshot, changed_files = scan_media_files(self.show_dir, snapshot)
+        self.assertEqual([os.path.basename(x) for x in changed_files], ['Show.Name.S01E03.mkv'])
+        self.assertEqual(sorted(os.path.basename(x) for x, v in new_snapshot.items() if not v[0]), ['Show.Name.S01E02.mkv', 'Show.Name.S01E03.mkv'])
+
 if __name__ == '__main__':
     print("==================")
     print("STARTING - Helpers TESTS")
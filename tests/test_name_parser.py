@@ -23,11 +23,14 @@
 from __future__ import print_function
 
 import os.path
+import threading
 import unittest
 from datetime import date
+from unittest import mock
 
 import tests
-from sickrage.core.nameparser import ParseResult, NameParser, InvalidNameException, InvalidShowException
+import sickrage
+from sickrage.core.nameparser import ParseResult, NameParser, NameParserCache, NameParserThrottle, InvalidNameException, InvalidShowException
 from sickrage.core.tv.show import TVShow
 
 DEBUG = VERBOSE = False
@@ -444,6 +447,146 @@ class BasicTests(tests.SiCKRAGETestDBCase):
         pass
 
 
+class NameParserRegexTests(tests.SiCKRAGETestCase):
+    def test_compiled_regexes_shared(self):
+        first = NameParser(False, validate_show=False)
+
+        with mock.patch.object(NameParser, '_build_regexes') as build_regexes:
+            second = NameParser(False, validate_show=False)
+
+        build_regexes.assert_not_called()
+        self.assertIs(second.compiled_regexes, first.compiled_regexes)
+        self.assertTrue(all(a[2] is b[2] for a, b in zip(first.compiled_regexes, second.compiled_regexes)))
+
+        # each regex mode has its own compiled set
+        second._compile_regexes(NameParser.ANIME_REGEX)
+        self.assertIsNot(second.compiled_regexes, first.compiled_regexes)
+        self.assertLess(len(second.compiled_regexes), len(first.compiled_regexes))
+
+
+class NameParserCacheTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(NameParserCacheTests, self).setUp()
+        self.cache = NameParserCache()
+
+        self.max_size = 2
+        self.ttl = 0
+        for name in ('max_size', 'ttl'):
+            patcher = mock.patch.object(NameParserCache, name, new_callable=mock.PropertyMock, side_effect=lambda name=name: getattr(self, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_lru_eviction(self):
+        self.cache.add('a', 1)
+        self.cache.add('b', 2)
+
+        # reading a marks it as recently used, so b is evicted instead
+        self.assertEqual(self.cache.get('a'), 1)
+        self.cache.add('c', 3)
+
+        self.assertIsNone(self.cache.get('b'))
+        self.assertEqual(self.cache.get('a'), 1)
+        self.assertEqual(self.cache.get('c'), 3)
+        self.assertEqual(self.cache.evictions, 1)
+
+    def test_ttl_expiry(self):
+        self.ttl = 10
+
+        with mock.patch('sickrage.core.nameparser.time.monotonic', return_value=100.0):
+            self.cache.add('a', 1)
+
+        with mock.patch('sickrage.core.nameparser.time.monotonic', return_value=105.0):
+            self.assertEqual(self.cache.get('a'), 1)
+
+        with mock.patch('sickrage.core.nameparser.time.monotonic', return_value=111.0):
+            self.assertIsNone(self.cache.get('a'))
+
+        self.assertEqual(self.cache.expirations, 1)
+        self.assertEqual(len(self.cache.data), 0)
+
+    def test_counters(self):
+        self.cache.add('a', 1)
+        self.cache.get('a')
+        self.cache.get('a')
+        self.cache.get('b')
+
+        stats = self.cache.stats
+        self.assertEqual((stats['hits'], stats['misses'], stats['size']), (2, 1, 1))
+        self.assertAlmostEqual(stats['hit_ratio'], 2 / 3)
+
+
+class NameParserSettingsTests(tests.SiCKRAGETestCase):
+    def test_defaults_before_config_load(self):
+        with mock.patch.object(sickrage.app, 'config', mock.Mock(general=None)):
+            self.assertEqual(NameParserCache().max_size, 1000)
+            self.assertEqual(NameParserCache().ttl, 0)
+            self.assertTrue(NameParserThrottle().enabled)
+            self.assertEqual(NameParserThrottle().rate, 50)
+
+
+class NameParserThrottleTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(NameParserThrottleTests, self).setUp()
+        self.throttle = NameParserThrottle(cpu_budget=0.5, window=1.0)
+
+        for name, value in (('enabled', True), ('rate', 2)):
+            patcher = mock.patch.object(NameParserThrottle, name, new_callable=mock.PropertyMock, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _run_in_worker(self, func, *args):
+        result = []
+        worker = threading.Thread(target=lambda: result.append(func(*args)))
+        worker.start()
+        worker.join()
+        return result[0]
+
+    def test_token_bucket(self):
+        self.throttle.last_refill = 100.0
+
+        with mock.patch('sickrage.core.nameparser.time.monotonic', return_value=100.0):
+            self.assertEqual(self.throttle._consume(), 0)
+            self.assertEqual(self.throttle._consume(), 0)
+            self.assertAlmostEqual(self.throttle._consume(), 0.5)
+
+        # half a second refills one token
+        with mock.patch('sickrage.core.nameparser.time.monotonic', return_value=100.5):
+            self.assertAlmostEqual(self.throttle._consume(), 0.5)
+
+        # the bucket never holds more than one second worth of tokens
+        with mock.patch('sickrage.core.nameparser.time.monotonic', return_value=200.0):
+            self.assertEqual(self.throttle._consume(), 0)
+            self.assertEqual(self.throttle._consume(), 0)
+            self.assertAlmostEqual(self.throttle._consume(), 0.5)
+
+    def test_cpu_budget(self):
+        def over_budget(*cpu_times):
+            return [self.throttle._over_cpu_budget(cpu_time) for cpu_time in cpu_times]
+
+        with mock.patch('sickrage.core.nameparser.time.monotonic', return_value=100.0):
+            self.assertEqual(self._run_in_worker(over_budget, 0.2, 0.2, 0.2), [False, False, True])
+
+            # cpu time is tracked per thread
+            self.assertEqual(self._run_in_worker(over_budget, 0.2), [False])
+
+    def test_throttle_sleeps_worker_over_budget(self):
+        with mock.patch('sickrage.core.nameparser.time.sleep') as sleep:
+            self._run_in_worker(lambda: [self.throttle.throttle(0.1) for __ in range(5)])
+            sleep.assert_not_called()
+
+            self._run_in_worker(lambda: [self.throttle.throttle(1.0) for __ in range(5)])
+            self.assertTrue(sleep.called)
+
+    def test_throttle_never_sleeps_on_ioloop(self):
+        with mock.patch('sickrage.core.nameparser.IOLoop.current', return_value=mock.Mock()), \
+                mock.patch('sickrage.core.nameparser.time.sleep') as sleep:
+            for __ in range(5):
+                self.throttle.throttle(1.0)
+
+        sleep.assert_not_called()
+        self.assertIsNone(self.throttle.tokens)
+
+
 if __name__ == '__main__':
     print("==================")
     print("STARTING - NAME PARSER TESTS")
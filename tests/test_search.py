@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+import sickrage
+import tests
+from sickrage.core.common import Qualities
+from sickrage.core.search import narrow_results, search_providers
+from sickrage.search_providers import NZBProvider, TorrentProvider, NZBSearchProviderResult, TorrentSearchProviderResult
+
+
+class FakeProvider(object):
+    def __init__(self, provider_type):
+        self.provider_type = provider_type
+
+
+class NarrowResultsTests(tests.SiCKRAGETestCase):
+    def _result(self, result_class, provider_type, episodes, quality, seeders=-1):
+        result = result_class(1, episodes)
+        result.provider = FakeProvider(provider_type)
+        result.quality = quality
+        result.seeders = seeders
+        result.name = 'Show.Name.S01E{}'.format('E'.join(map(str, episodes)))
+        return result
+
+    def _torrent(self, episodes, quality, seeders):
+        return self._result(TorrentSearchProviderResult, TorrentProvider.provider_type, episodes, quality, seeders)
+
+    def _nzb(self, episodes, quality):
+        return self._result(NZBSearchProviderResult, NZBProvider.provider_type, episodes, quality)
+
+    def test_best_quality_per_episode(self):
+        low = self._torrent([1], Qualities.SDTV, 100)
+        high = self._torrent([1], Qualities.HDTV, 5)
+        other = self._torrent([2], Qualities.SDTV, 1)
+        self.assertEqual(narrow_results([low, high, other]), [high, other])
+
+    def test_seeders_break_quality_ties(self):
+        few = self._torrent([1], Qualities.HDTV, 5)
+        many = self._torrent([1], Qualities.HDTV, 50)
+        self.assertEqual(narrow_results([few, many]), [many])
+
+    def test_nzb_outranks_torrent_of_same_quality(self):
+        torrent = self._torrent([1], Qualities.HDTV, 50)
+        nzb = self._nzb([1], Qualities.HDTV)
+        self.assertEqual(narrow_results([torrent, nzb]), [nzb])
+
+    def test_unknown_quality_ranks_lowest(self):
+        unknown = self._torrent([1], Qualities.UNKNOWN, 50)
+        known = self._torrent([1], Qualities.SDTV, 5)
+        self.assertEqual(narrow_results([unknown, known]), [known])
+
+    def test_many_overlapping_results(self):
+        results = []
+        for i in range(1, 25):
+            results.append(self._torrent([i], Qualities.SDTV, i))
+            results.append(self._torrent([i, i + 1], Qualities.HDTV, i))
+            results.append(self._nzb([i, i + 1, i + 2], Qualities.SDTV))
+
+        start = time.time()
+        narrowed = narrow_results(results)
+        self.assertLess(time.time() - start, 0.1)
+
+        covered = set()
+        for result in narrowed:
+            covered |= set(result.episodes)
+        self.assertEqual(covered, set(range(1, 27)))
+        self.assertEqual(len([result for result in narrowed if result.quality == Qualities.HDTV]), 24)
+        self.assertTrue(all(26 in result.episodes for result in narrowed if result.quality != Qualities.HDTV))
+
+
+class SearchProvidersTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(SearchProvidersTests, self).setUp()
+        self.providers = []
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+
+        for name, value in (('search_providers_timeout', 0), ('search_providers_max_workers', 4), ('max_queue_workers', 1),
+                            ('randomize_providers', False), ('use_nzbs', True), ('use_torrents', True)):
+            patcher = mock.patch.object(sickrage.app.config.general, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        show = mock.Mock(is_anime=False)
+        show.name = 'Show Name'
+
+        patcher = mock.patch('sickrage.core.search.find_show', return_value=show)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(sickrage.app, 'search_providers')
+        search_providers_mock = patcher.start()
+        search_providers_mock.sort.side_effect = lambda randomize=False: {x.name: x for x in self.providers}
+        self.addCleanup(patcher.stop)
+
+    def _provider(self, name, find_search_results, search_fallback=False):
+        provider = mock.Mock(is_enabled=True, provider_type=TorrentProvider.provider_type, anime_only=False, search_mode='eponly',
+                             search_fallback=search_fallback)
+        provider.name = name
+        provider.find_search_results.side_effect = find_search_results
+        self.providers.append(provider)
+        return provider
+
+    def test_providers_searched_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+        thread_names = []
+
+        def find_search_results(*args):
+            thread_names.append(threading.currentThread().getName())
+            barrier.wait()
+            return {}
+
+        for name in ('provider1', 'provider2', 'provider3'):
+            self._provider(name, find_search_results)
+
+        self.assertIsNone(search_providers(1, 1, 1, 1))
+        self.assertFalse(barrier.broken)
+        self.assertEqual(sorted(x.rsplit('::', 1)[1] for x in thread_names), ['[provider1]', '[provider2]', '[provider3]'])
+
+        # worker threads get their own name back once a provider search is done
+        self.assertFalse(any('::' in x.getName() for x in threading.enumerate()))
+
+    def test_deadline_covers_whole_search(self):
+        sickrage.app.config.general.search_providers_timeout = 0.2
+
+        fast = self._provider('fast', lambda *args: {})
+        slow1 = self._provider('slow1', lambda *args: self.release.wait(5) and {})
+        slow2 = self._provider('slow2', lambda *args: self.release.wait(5) and {})
+
+        with mock.patch.object(sickrage.app, 'log') as log:
+            start = time.monotonic()
+            self.assertIsNone(search_providers(1, 1, 1, 1))
+            self.assertLess(time.monotonic() - start, 1)
+
+        self.assertEqual(fast.find_search_results.call_count, 1)
+        log.warning.assert_called_once_with("Timed out while searching slow1, slow2, skipping")
+
+    def test_timed_out_provider_stops_searching(self):
+        sickrage.app.config.general.search_providers_timeout = 0.2
+        searched = threading.Event()
+
+        def find_search_results(*args):
+            self.release.wait(5)
+            searched.set()
+            return {}
+
+        slow = self._provider('slow', find_search_results, search_fallback=True)
+
+        self.assertIsNone(search_providers(1, 1, 1, 1))
+
+        # the running request finishes, but the fallback search is never started
+        self.release.set()
+        self.assertTrue(searched.wait(5))
+        time.sleep(0.1)
+        self.assertEqual(slow.find_search_results.call_count, 1)
+
+
+if __name__ == "__main__":
+    print("==================")
+    print("STARTING - SEARCH TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+import time
+import unittest
+from datetime import date
+from unittest import mock
+
+import sickrage
+import tests
+from sickrage.core.databases.cache import CacheDB
+from sickrage.series_providers.cache import SeriesProviderShowCache, SeriesProviderShow
+
+
+class SeriesProviderShowCacheTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(SeriesProviderShowCacheTests, self).setUp()
+        self.cache = SeriesProviderShowCache()
+
+        patcher = mock.patch.object(sickrage.app.config.general, 'series_provider_cache_ttl', 2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        with sickrage.app.cache_db.session() as session:
+            session.query(CacheDB.SeriesProviderCache).filter_by(provider='test').delete()
+            session.commit()
+
+        super(SeriesProviderShowCacheTests, self).tearDown()
+
+    def test_persist_series_info(self):
+        expires = self.cache.save_series_info('test', 1, 'en', 'official', {'name': 'Show Name'}, [{'id': 10}])
+
+        # a new cache, e.g. after a restart, reads the stored api responses back
+        self.assertEqual(SeriesProviderShowCache().load_series_info('test', 1, 'en', 'official'),
+                         ({'name': 'Show Name'}, [{'id': 10}], expires))
+
+        self.assertIsNone(self.cache.load_series_info('test', 1, 'fr', 'official'))
+
+        # saving again replaces the stored responses
+        expires = self.cache.save_series_info('test', 1, 'en', 'official', {'name': 'New Name'}, [])
+        self.assertEqual(self.cache.load_series_info('test', 1, 'en', 'official'), ({'name': 'New Name'}, [], expires))
+
+    def test_ttl_in_hours(self):
+        with mock.patch('sickrage.series_providers.cache.time.time', return_value=1000):
+            self.assertEqual(self.cache.ttl, 2 * 60 * 60)
+            self.assertEqual(self.cache.save_series_info('test', 1, 'en', 'official', {}, []), 1000 + 2 * 60 * 60)
+
+        with mock.patch('sickrage.series_providers.cache.time.time', return_value=1000 + 2 * 60 * 60 - 1):
+            self.assertIsNotNone(self.cache.load_series_info('test', 1, 'en', 'official'))
+
+        with mock.patch('sickrage.series_providers.cache.time.time', return_value=1000 + 2 * 60 * 60):
+            self.assertIsNone(self.cache.load_series_info('test', 1, 'en', 'official'))
+
+    def test_ttl_disabled(self):
+        sickrage.app.config.general.series_provider_cache_ttl = 0
+
+        self.assertIsNone(self.cache.save_series_info('test', 1, 'en', 'official', {}, []))
+        self.assertIsNone(self.cache.load_series_info('test', 1, 'en', 'official'))
+
+    def test_get_show_expiry(self):
+        self.cache[1] = SeriesProviderShow()
+        self.cache.expires[1] = time.time() + 60
+        self.assertIs(self.cache.get_show(1), self.cache[1])
+
+        self.cache.expires[1] = time.time() - 1
+        self.assertIsNone(self.cache.get_show(1))
+
+        # shows cached without an expiry never expire
+        self.cache.expires.pop(1)
+        self.assertIsNotNone(self.cache.get_show(1))
+
+    def test_invalidate(self):
+        self.cache[1] = SeriesProviderShow()
+        self.cache.expires[1] = time.time() + 60
+
+        self.cache.invalidate(1)
+        self.assertIsNone(self.cache.get_show(1))
+        self.assertNotIn(1, self.cache.expires)
+
+        # invalidating an unknown show is a no-op
+        self.cache.invalidate(2)
+
+
+class SeriesProviderShowTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(SeriesProviderShowTests, self).setUp()
+        self.cache = SeriesProviderShowCache()
+
+        for season, episode, first_aired in ((1, 1, '2020-01-01'), (1, 2, '2020-01-01T21:00:00'), (1, 3, '2020-01-08'), (1, 4, None)):
+            self.cache.add_episode_data(1, season, episode, 'episodeNumber', episode)
+            self.cache.add_episode_data(1, season, episode, 'firstAired', first_aired)
+
+        self.show = self.cache[1]
+
+    def test_aired_on(self):
+        self.assertEqual([x['episodeNumber'] for x in self.show.aired_on(date(2020, 1, 1))], [1, 2])
+        self.assertEqual([x['episodeNumber'] for x in self.show.aired_on(date(2020, 1, 8))], [3])
+        self.assertIsNone(self.show.aired_on(date(2020, 1, 15)))
+
+    def test_aired_on_after_air_date_change(self):
+        self.cache.add_episode_data(1, 1, 3, 'firstAired', '2020-01-15')
+
+        self.assertIsNone(self.show.aired_on(date(2020, 1, 8)))
+        self.assertEqual([x['episodeNumber'] for x in self.show.aired_on(date(2020, 1, 15))], [3])
+
+        # clearing the air date drops the episode from the index
+        self.cache.add_episode_data(1, 1, 3, 'firstAired', None)
+        self.assertIsNone(self.show.aired_on(date(2020, 1, 15)))
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - SERIES PROVIDER CACHE TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
@@ -21,19 +21,66 @@
 # ##############################################################################
 
 
+import datetime
+import os
+import shutil
+import tempfile
 import unittest
+from unittest import mock
 
 import sickrage
 import tests
+from sickrage.core.common import EpisodeStatus, Quality, Qualities
+from sickrage.core.databases.main import MainDB
+from sickrage.core.enums import SeriesProviderID
+from sickrage.core.exceptions import EpisodeNotFoundException
 from sickrage.core.tv.episode import TVEpisode
 from sickrage.core.tv.show import TVShow
+from sickrage.core.tv.show.helpers import find_show_by_name, find_show_by_scene_exception, show_name_index
 
 
 class TVShowTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(TVShowTests, self).setUp()
+        self.series_ids = []
+
+    def tearDown(self):
+        with sickrage.app.main_db.session() as session:
+            for table in [MainDB.TVShow, MainDB.TVEpisode, MainDB.Blacklist, MainDB.Whitelist]:
+                session.query(table).filter(table.series_id.in_(self.series_ids)).delete(synchronize_session=False)
+            session.commit()
+
+        for series_id in self.series_ids:
+            show = sickrage.app.shows.pop((series_id, SeriesProviderID.THETVDB), None)
+            if show:
+                show_name_index.remove(show)
+
+        super(TVShowTests, self).tearDown()
+
+    def _add_show(self, series_id, name="show name"):
+        """
+        Stores the show row before building the show, so nothing is fetched from the series provider
+        """
+        with sickrage.app.main_db.session() as session:
+            session.add(MainDB.TVShow(series_id=series_id, series_provider_id=SeriesProviderID.THETVDB, name=name, location=''))
+            session.commit()
+
+        self.series_ids.append(series_id)
+        return TVShow(series_id, SeriesProviderID.THETVDB)
+
     def test_init_indexer_id(self):
         show = TVShow(0o001, 1)
         self.assertEqual(show.series_id, 0o001)
 
+    def test_init_with_data(self):
+        data = MainDB.TVShow().as_dict()
+        data.update(series_id=107, series_provider_id=SeriesProviderID.THETVDB, name="bulk name")
+        self.series_ids.append(107)
+
+        show = TVShow(107, SeriesProviderID.THETVDB, data=data)
+        self.assertEqual(show.name, "bulk name")
+        self.assertIs(find_show_by_name("bulk name"), show)
+
     def test_change_indexer_id(self):
         show = TVShow(0o001, 1)
         show.name = "show name"
@@ -52,6 +99,154 @@ class TVShowTests(tests.SiCKRAGETestDBCase):
         show.name = "newName"
         self.assertEqual(show.name, "newName")
 
+    def test_find_show_by_name(self):
+        show = self._add_show(101)
+        show.name = "show name"
+        show.scene_exceptions = ["scene name|-1"]
+        self.assertIs(find_show_by_name("Show Name"), show)
+        self.assertIs(find_show_by_scene_exception("scene name"), show)
+
+        show.name = "new name"
+        show.scene_exceptions = []
+        self.assertIsNone(find_show_by_name("show name"))
+        self.assertIsNone(find_show_by_scene_exception("scene name"))
+        self.assertIs(find_show_by_name("new name"), show)
+
+    def test_get_episode(self):
+        show = self._add_show(102)
+
+        with sickrage.app.main_db.session() as session:
+            for episode in range(1, 4):
+                session.add(MainDB.TVEpisode(series_id=show.series_id, series_provider_id=show.series_provider_id, season=1, episode=episode,
+                                             absolute_number=episode + 10))
+            session.commit()
+
+        show.flush_episodes()
+        self.assertEqual(len(show.episodes), 3)
+        self.assertIs(show.get_episode(1, 2), show.get_episode(absolute_number=12))
+        self.assertIsNone(show.get_episode(2, 1, no_create=True))
+        self.assertRaises(EpisodeNotFoundException, show.get_episode, absolute_number=99)
+
+    def test_episode_stats(self):
+        show = self._add_show(103)
+
+        today = datetime.date.today()
+        downloaded = Quality.composite_status(EpisodeStatus.DOWNLOADED, Qualities.HDTV)
+        snatched = Quality.composite_status(EpisodeStatus.SNATCHED, Qualities.HDTV)
+        with sickrage.app.main_db.session() as session:
+            for season, episode, status, airdate in [(0, 1, EpisodeStatus.SKIPPED, today - datetime.timedelta(days=30)),
+                                                     (1, 1, downloaded, today - datetime.timedelta(days=14)),
+                                                     (1, 2, snatched, today - datetime.timedelta(days=7)),
+                                                     (1, 3, EpisodeStatus.UNAIRED, today + datetime.timedelta(days=7)),
+                                                     (1, 4, EpisodeStatus.UNAIRED, today + datetime.timedelta(days=14))]:
+                session.add(MainDB.TVEpisode(series_id=show.series_id, series_provider_id=show.series_provider_id, season=season, episode=episode,
+                                             status=status, airdate=airdate))
+            session.commit()
+
+        show.flush_episodes()
+        sickrage.app.config.gui.display_show_specials = False
+        self.assertEqual(show.episodes_unaired, 2)
+        self.assertEqual(show.episodes_snatched, 1)
+        self.assertEqual(show.episodes_downloaded, 1)
+        self.assertEqual(show.episodes_special, 1)
+        self.assertEqual(show.episodes_total, 2)
+        self.assertEqual(show.airs_next, today + datetime.timedelta(days=7))
+        self.assertEqual(show.airs_prev, today - datetime.timedelta(days=7))
+
+        sickrage.app.config.gui.display_show_specials = True
+        self.assertEqual(show.episodes_total, 3)
+
+        episode_object = show.get_episode(1, 2)
+        episode_object.status = downloaded
+        episode_object.save()
+        self.assertEqual(show.episodes_snatched, 0)
+        self.assertEqual(show.episodes_downloaded, 2)
+
+    def test_total_size(self):
+        show = self._add_show(104)
+
+        with sickrage.app.main_db.session() as session:
+            for episode, location, file_size in [(1, '/show/s01e01.mkv', 100), (2, '/show/s01e02-03.mkv', 200), (3, '/show/s01e02-03.mkv', 200),
+                                                 (4, '', 300)]:
+                session.add(MainDB.TVEpisode(series_id=show.series_id, series_provider_id=show.series_provider_id, season=1, episode=episode,
+                                             location=location, file_size=file_size))
+            session.commit()
+
+        show.flush_episodes()
+        self.assertEqual(show.total_size, 300)
+
+    def test_batch_save(self):
+        show = self._add_show(105)
+
+        with sickrage.app.main_db.session() as session:
+            session.add(MainDB.TVEpisode(series_id=show.series_id, series_provider_id=show.series_provider_id, season=1, episode=1))
+            session.commit()
+
+        show.flush_episodes()
+
+        data = MainDB.TVEpisode().as_dict()
+        data.update(series_id=show.series_id, series_provider_id=show.series_provider_id, season=1, episode=2)
+        new_episode = TVEpisode(show.series_id, show.series_provider_id, 1, 2, data=data)
+
+        with show.batch_save():
+            for episode_object in [show.get_episode(1, 1), new_episode]:
+                episode_object.name = "batch name"
+                episode_object.save()
+
+            with sickrage.app.main_db.session() as session:
+                self.assertEqual(session.query(MainDB.TVEpisode).filter_by(series_id=show.series_id, name="batch name").count(), 0)
+
+        with sickrage.app.main_db.session() as session:
+            self.assertEqual(session.query(MainDB.TVEpisode).filter_by(series_id=show.series_id, name="batch name").count(), 2)
+
+        self.assertIs(show.get_episode(1, 2, no_create=True), new_episode)
+
+    def test_release_groups(self):
+        show = self._add_show(106)
+        show.anime = 1
+
+        release_groups = show.release_groups
+        self.assertIs(show.release_groups, release_groups)
+
+        release_groups.set_white_keywords(['GroupA', 'GroupB'])
+        release_groups.set_black_keywords(['GroupC'])
+        self.assertTrue(release_groups.is_valid(mock.Mock(release_group='groupa')))
+        self.assertFalse(release_groups.is_valid(mock.Mock(release_group='GROUPC')))
+        self.assertFalse(release_groups.is_valid(mock.Mock(release_group='GroupD')))
+        self.assertFalse(release_groups.is_valid(mock.Mock(release_group='')))
+
+        release_groups.load()
+        self.assertEqual(sorted(release_groups.whitelist), ['GroupA', 'GroupB'])
+        self.assertTrue(release_groups.is_valid(mock.Mock(release_group='GROUPB')))
+
+        # changing the show's ids rebuilds the list for the new ids
+        show.series_id = 108
+        self.assertIsNot(show.release_groups, release_groups)
+        self.assertEqual(show.release_groups.whitelist, [])
+
+    def test_refresh_dir_skips_unchanged_files(self):
+        show = self._add_show(109)
+        show.location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, show.location)
+        self.addCleanup(show.delete_dir_snapshot)
+
+        with open(os.path.join(show.location, 'Not An Episode.mkv'), 'w') as f:
+            f.write('media')
+
+        with mock.patch.object(TVShow, 'make_ep_from_file', return_value=None) as make_ep_from_file:
+            show.refresh_dir()
+            self.assertEqual(make_ep_from_file.call_count, 1)
+
+            # nothing changed on disk, so nothing is parsed again
+            make_ep_from_file.reset_mock()
+            show.refresh_dir()
+            make_ep_from_file.assert_not_called()
+
+            # dropping the snapshot, e.g. after new episodes were added, retries every file
+            show.delete_dir_snapshot()
+            show.refresh_dir()
+            self.assertEqual(make_ep_from_file.call_count, 1)
+
 
 class TVEpisodeTests(tests.SiCKRAGETestDBCase):
     def test_init_empty_db(self):
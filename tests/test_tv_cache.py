@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+import unittest
+from unittest import mock
+
+from sqlalchemy import orm
+
+import sickrage
+import tests
+from sickrage.core.caches.tv_cache import TVCache
+from sickrage.core.common import Qualities
+from sickrage.core.databases.cache import CacheDB
+from sickrage.core.enums import SeriesProviderID
+from sickrage.search_providers import NZBSearchProviderResult, SearchProviderType
+
+
+class TVCacheTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(TVCacheTests, self).setUp()
+        self.cache = TVCache(self._provider('test_provider'))
+
+        self.show = mock.Mock(series_provider_id=SeriesProviderID.THETVDB, is_anime=False)
+        self.show.want_episode.return_value = True
+
+        for target, value in (('sickrage.core.caches.tv_cache.find_show', self.show),
+                              ('sickrage.core.caches.tv_cache.show_names.filter_bad_releases', True)):
+            patcher = mock.patch(target, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        with sickrage.app.cache_db.session() as session:
+            for table in [CacheDB.ProviderEpisode, CacheDB.Provider, CacheDB.LastSearch]:
+                session.query(table).filter(table.provider.in_(['test_provider', 'other_provider'])).delete(synchronize_session=False)
+            session.commit()
+
+        super(TVCacheTests, self).tearDown()
+
+    @staticmethod
+    def _provider(provider_id):
+        provider = mock.Mock(id=provider_id, private=True, anime_only=False, provider_type=SearchProviderType.NZB)
+        provider.get_result.side_effect = lambda: NZBSearchProviderResult(None, [])
+        return provider
+
+    @staticmethod
+    def _add_result(provider_id, name, url, season, episodes):
+        with sickrage.app.cache_db.session() as session:
+            result = CacheDB.Provider(provider=provider_id, name=name, season=season, episodes="|" + "|".join(map(str, episodes)) + "|",
+                                      series_id=1, series_provider_id=SeriesProviderID.THETVDB, url=url, time=0, quality=Qualities.HDTV)
+            result.episode_map = [CacheDB.ProviderEpisode(provider=provider_id, series_id=1, series_provider_id=SeriesProviderID.THETVDB,
+                                                          season=season, episode=episode) for episode in episodes]
+            session.add(result)
+            session.commit()
+
+    def test_search_cache(self):
+        self._add_result('test_provider', 'Show.S01E02E03', 'http://test/1', 1, [2, 3])
+        self._add_result('test_provider', 'Show.S01E04', 'http://test/2', 1, [4])
+        self._add_result('test_provider', 'Show.S02E03', 'http://test/3', 2, [3])
+        self._add_result('other_provider', 'Show.S01E03', 'http://other/1', 1, [3])
+
+        # the multi episode result is found through its provider_episodes row for episode 3
+        results = self.cache.search_cache(1, SeriesProviderID.THETVDB, 1, 3)
+        self.assertEqual(list(results), [3])
+        self.assertEqual([(x.name, x.episodes) for x in results[3]], [('Show.S01E02E03', [2, 3])])
+
+        self.assertEqual([x.name for x in self.cache.search_cache(1, SeriesProviderID.THETVDB, 1, 4)[4]], ['Show.S01E04'])
+        self.assertEqual(self.cache.search_cache(1, SeriesProviderID.THETVDB, 1, 5), {})
+
+    @staticmethod
+    def _parse(name):
+        return mock.Mock(series_name='Show', quality=Qualities.HDTV, season_number=1, episode_numbers=[int(name.rsplit('E', 1)[1])],
+                         series_id=1, series_provider_id=SeriesProviderID.THETVDB, release_group='GRP', version=-1)
+
+    def _add_cache_entries(self, entries):
+        with mock.patch('sickrage.core.caches.tv_cache.NameParser') as name_parser:
+            name_parser.return_value.parse.side_effect = self._parse
+            self.cache.add_cache_entries([(name, url, 1, 2, 3) for name, url in entries])
+
+    def _cached_urls(self):
+        with sickrage.app.cache_db.session() as session:
+            return {x.url: x.name for x in session.query(CacheDB.Provider).filter_by(provider='test_provider')}
+
+    def test_add_cache_entries_batched(self):
+        with mock.patch.object(orm.Session, 'commit', autospec=True, side_effect=orm.Session.commit) as commit:
+            self._add_cache_entries([('Show.S01E01', 'http://test/1'), ('Show.S01E02', 'http://test/2'), ('Show.S01E03', 'http://test/3')])
+
+        # all rows are written in one transaction
+        self.assertEqual(commit.call_count, 1)
+        self.assertEqual(self._cached_urls(), {'http://test/1': 'Show.S01E01', 'http://test/2': 'Show.S01E02', 'http://test/3': 'Show.S01E03'})
+
+        with sickrage.app.cache_db.session() as session:
+            self.assertEqual(sorted(x.episode for x in session.query(CacheDB.ProviderEpisode).filter_by(provider='test_provider')), [1, 2, 3])
+
+    def test_add_cache_entries_chunked_existence_check(self):
+        self.assertEqual(TVCache.url_chunk_size, 500)
+
+        self._add_result('test_provider', 'Show.S01E01', 'http://test/0', 1, [1])
+        entries = [('Show.S01E{}'.format(i % 10 + 1), 'http://test/{}'.format(i)) for i in range(1201)]
+
+        with mock.patch.object(CacheDB.Provider.url, 'in_', wraps=CacheDB.Provider.url.in_) as url_in:
+            self._add_cache_entries(entries)
+
+        self.assertEqual([len(x[0][0]) for x in url_in.call_args_list], [500, 500, 201])
+
+        # the url that was already cached is left alone
+        cached_urls = self._cached_urls()
+        self.assertEqual(len(cached_urls), 1201)
+        self.assertEqual(cached_urls['http://test/0'], 'Show.S01E01')
+
+    def test_add_cache_entries_duplicate_url_in_batch(self):
+        self._add_cache_entries([('Show.S01E01', 'http://test/1'), ('Show.S01E02', 'http://test/1')])
+
+        # the first entry for a url wins
+        self.assertEqual(self._cached_urls(), {'http://test/1': 'Show.S01E01'})
+
+    def test_add_cache_entries_integrity_error_fallback(self):
+        self.cache.provider.private = False
+
+        # another writer adds http://test/2 after the existence check ran
+        self._add_result('test_provider', 'Show.S01E02', 'http://test/2', 1, [2])
+
+        with mock.patch.object(CacheDB.Provider.url, 'in_', return_value=CacheDB.Provider.url.is_(None)), \
+                mock.patch.object(sickrage.app.config.general, 'enable_sickrage_api', True), \
+                mock.patch.object(sickrage.app, 'api') as api:
+            self._add_cache_entries([('Show.S01E01', 'http://test/1'), ('Show.S01E03', 'http://test/2'), ('Show.S01E03', 'http://test/3')])
+
+        self.assertEqual(self._cached_urls(), {'http://test/1': 'Show.S01E01', 'http://test/2': 'Show.S01E02', 'http://test/3': 'Show.S01E03'})
+
+        # only the rows that were saved are shared
+        self.assertEqual([x[1]['data']['url'] for x in api.search_provider.add_search_result.call_args_list], ['http://test/1', 'http://test/3'])
+
+    def test_clear(self):
+        self._add_result('test_provider', 'Show.S01E02E03', 'http://test/1', 1, [2, 3])
+        self._add_result('other_provider', 'Show.S01E03', 'http://other/1', 1, [3])
+
+        with mock.patch.object(TVCache, 'shouldClearCache', return_value=True):
+            self.cache.clear()
+
+        with sickrage.app.cache_db.session() as session:
+            for table in [CacheDB.Provider, CacheDB.ProviderEpisode]:
+                self.assertEqual(session.query(table).filter_by(provider='test_provider').count(), 0)
+                self.assertEqual(session.query(table).filter_by(provider='other_provider').count(), 1)
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - TV CACHE TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
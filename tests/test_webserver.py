@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+import threading
+import unittest
+
+import tests
+from sickrage.core.webserver import WebExecutor
+
+
+class WebExecutorTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(WebExecutorTests, self).setUp()
+        self.executor = WebExecutor(max_workers=1)
+        self.release = threading.Event()
+        self.addCleanup(self.executor.shutdown)
+        self.addCleanup(self.release.set)
+
+    def test_stats(self):
+        started = threading.Event()
+
+        def work(value):
+            started.set()
+            self.release.wait(5)
+            return value
+
+        first = self.executor.submit(work, 1)
+        second = self.executor.submit(work, 2)
+        self.assertTrue(started.wait(5))
+
+        # one task runs on the only worker, the other waits for it
+        self.assertEqual(self.executor.stats, {'max_workers': 1, 'threads': 1, 'queued': 1, 'active': 1, 'completed': 0})
+
+        self.release.set()
+        self.assertEqual((first.result(5), second.result(5)), (1, 2))
+        self.assertEqual(self.executor.stats, {'max_workers': 1, 'threads': 1, 'queued': 0, 'active': 0, 'completed': 2})
+
+    def test_failed_task_counts_as_completed(self):
+        def fail():
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            self.executor.submit(fail).result(5)
+
+        self.assertEqual((self.executor.stats['active'], self.executor.stats['completed']), (0, 1))
+
+    def test_submit_after_shutdown(self):
+        self.executor.shutdown()
+
+        with self.assertRaises(RuntimeError):
+            self.executor.submit(lambda: None)
+
+        self.assertEqual(self.executor.stats['queued'], 0)
+
+
+if __name__ == '__main__':
+    print("==================")
+    print("STARTING - WEB SERVER TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+
+import os
+import shutil
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest import mock
+
+import sickrage
+import tests
+from sickrage.core.websession import DiskCache, WebSession, WebTransport
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    etag = '"v1"'
+    requests = []
+
+    def do_GET(self):
+        revalidating = self.headers.get('If-None-Match') == self.etag
+        StandInHandler.requests.append((self.path, revalidating))
+
+        if revalidating:
+            self.send_response(304)
+            self.send_header('ETag', self.etag)
+            self.end_headers()
+            return
+
+        body = b'stand-in response'
+        self.send_response(200)
+        self.send_header('ETag', self.etag)
+        self.send_header('Cache-Control', 'max-age=0' if self.path == '/revalidate' else 'max-age=3600')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class DiskCacheTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(DiskCacheTests, self).setUp()
+        self.cache_dir = os.path.join(self.TESTDIR, 'http_cache')
+
+    def tearDown(self):
+        super(DiskCacheTests, self).tearDown()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_set_get_delete(self):
+        cache = DiskCache(self.cache_dir, 1024)
+        cache.set('key', b'value')
+        self.assertEqual(cache.get('key'), b'value')
+        self.assertEqual(DiskCache(self.cache_dir, 1024).get('key'), b'value')
+
+        cache.delete('key')
+        self.assertIsNone(cache.get('key'))
+
+    def test_lru_eviction(self):
+        cache = DiskCache(self.cache_dir, 30)
+        cache.set('a', b'x' * 10)
+        cache.set('b', b'x' * 10)
+        cache.set('c', b'x' * 10)
+        cache.get('a')
+        cache.set('d', b'x' * 10)
+
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('d'))
+        self.assertEqual(len(os.listdir(self.cache_dir)), 3)
+
+
+class WebSessionCacheTests(tests.SiCKRAGETestCase):
+    def setUp(self):
+        super(WebSessionCacheTests, self).setUp()
+
+        # web_transport is process wide and keeps the cache dir it first saw, every test gets its own
+        for target, attribute, value in ((sickrage.app, 'cache_dir', os.path.join(self.TESTDIR, 'cache')),
+                                         (sickrage.app.config.general, 'web_session_cache_size', 1),
+                                         (sickrage.core.websession, 'web_transport', WebTransport())):
+            patcher = mock.patch.object(target, attribute, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        StandInHandler.requests = []
+        self.server = HTTPServer(('127.0.0.1', 0), StandInHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = 'http://127.0.0.1:{}'.format(self.server.server_port)
+
+    def tearDown(self):
+        super(WebSessionCacheTests, self).tearDown()
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(sickrage.app.cache_dir, ignore_errors=True)
+
+    def test_cached_response_survives_session(self):
+        self.assertEqual(WebSession().get(self.url + '/cached').text, 'stand-in response')
+        self.assertEqual(WebSession().get(self.url + '/cached').text, 'stand-in response')
+        self.assertEqual(StandInHandler.requests, [('/cached', False)])
+        self.assertIsInstance(sickrage.core.websession.web_transport.cache, DiskCache)
+        self.assertTrue(os.listdir(os.path.join(sickrage.app.cache_dir, 'http')))
+
+    def test_stale_response_is_revalidated(self):
+        WebSession().get(self.url + '/revalidate')
+        resp = WebSession().get(self.url + '/revalidate')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.text, 'stand-in response')
+        self.assertEqual(StandInHandler.requests, [('/revalidate', False), ('/revalidate', True)])
+
+
+class WebSessionStartupTests(tests.SiCKRAGETestCase):
+    def test_session_before_config_load(self):
+        # search providers build their sessions before the config is loaded
+        with mock.patch.object(sickrage.core.websession, 'web_transport', WebTransport()) as web_transport, \
+                mock.patch.object(type(sickrage.app.config), 'general', new_callable=mock.PropertyMock, return_value=None):
+            session = WebSession()
+            self.assertIs(session.get_adapter('https://'), web_transport.adapter())
+
+
+if __name__ == "__main__":
+    print("==================")
+    print("STARTING - WEBSESSION TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()